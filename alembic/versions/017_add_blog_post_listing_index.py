@@ -0,0 +1,39 @@
+"""Add composite index for blog post listing
+
+Revision ID: 017_add_blog_post_listing_index
+Revises: 016_add_communication
+Create Date: 2026-10-17
+
+Matches the ORDER BY of the blog post listing so keyset pagination on
+(published_at, created_at, id) within a status can be served by an
+index scan.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "017_add_blog_post_listing_index"
+down_revision: Union[str, None] = "016_add_communication"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_blog_posts_status_listing",
+        "blog_posts",
+        [
+            "status",
+            sa.text("published_at DESC NULLS LAST"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_blog_posts_status_listing", table_name="blog_posts", if_exists=True)
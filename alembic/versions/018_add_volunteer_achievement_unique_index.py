@@ -0,0 +1,47 @@
+"""Add unique index on volunteer achievement progress
+
+Revision ID: 018_add_vach_unique_index
+Revises: 017_add_blog_post_listing_index
+Create Date: 2026-10-17
+
+get_or_create_progress inserts with ON CONFLICT (volunteer_id,
+achievement_id), which requires a unique index on those columns.
+Duplicate progress rows are collapsed first, keeping the most advanced.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "018_add_vach_unique_index"
+down_revision: Union[str, None] = "017_add_blog_post_listing_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM volunteer_achievements
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY volunteer_id, achievement_id
+                    ORDER BY is_completed DESC, current_progress DESC, id
+                ) AS rn
+                FROM volunteer_achievements
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.create_index(
+        "ix_vach_vol_ach",
+        "volunteer_achievements",
+        ["volunteer_id", "achievement_id"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vach_vol_ach", table_name="volunteer_achievements", if_exists=True)
@@ -0,0 +1,71 @@
+"""Add composite indexes for gamification lookups
+
+Revision ID: 019_add_gamification_indexes
+Revises: 018_add_vach_unique_index
+Create Date: 2026-10-17
+
+Covers the per-volunteer badge/achievement lookups, points history
+listing and current-leaderboard lookup. Duplicate badge awards are
+removed before the (volunteer_id, badge_id) index is made unique,
+keeping the earliest award.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "019_add_gamification_indexes"
+down_revision: Union[str, None] = "018_add_vach_unique_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM volunteer_badges
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY volunteer_id, badge_id
+                    ORDER BY earned_at, id
+                ) AS rn
+                FROM volunteer_badges
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.create_index(
+        "ix_vbadge_vol_badge",
+        "volunteer_badges",
+        ["volunteer_id", "badge_id"],
+        unique=True,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_vach_vol_completed",
+        "volunteer_achievements",
+        ["volunteer_id", "is_completed"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_phist_vol_created",
+        "points_history",
+        ["volunteer_id", sa.text("created_at DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_lb_type_tf_current",
+        "leaderboards",
+        ["leaderboard_type", "timeframe", "is_current"],
+        postgresql_where=sa.text("is_current"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lb_type_tf_current", table_name="leaderboards", if_exists=True)
+    op.drop_index("ix_phist_vol_created", table_name="points_history", if_exists=True)
+    op.drop_index("ix_vach_vol_completed", table_name="volunteer_achievements", if_exists=True)
+    op.drop_index("ix_vbadge_vol_badge", table_name="volunteer_badges", if_exists=True)
@@ -0,0 +1,32 @@
+"""Add index for stale leaderboard cleanup
+
+Revision ID: 020_add_lb_cleanup_index
+Revises: 019_add_gamification_indexes
+Create Date: 2026-10-17
+
+Serves the (is_current, generated_at < cutoff) predicate of
+delete_old_leaderboards.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "020_add_lb_cleanup_index"
+down_revision: Union[str, None] = "019_add_gamification_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_lb_current_generated",
+        "leaderboards",
+        ["is_current", "generated_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lb_current_generated", table_name="leaderboards", if_exists=True)
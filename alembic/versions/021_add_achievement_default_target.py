@@ -0,0 +1,45 @@
+"""Add default_target to achievements
+
+Revision ID: 021_ach_default_target
+Revises: 020_add_lb_cleanup_index
+Create Date: 2026-10-17
+
+Stores the progress target resolved from criteria so progress creation
+does not re-derive it. Existing rows are backfilled using the same key
+priority as the application.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "021_ach_default_target"
+down_revision: Union[str, None] = "020_add_lb_cleanup_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "achievements",
+        sa.Column("default_target", sa.Numeric(10, 2), nullable=True),
+    )
+    op.execute("""
+        UPDATE achievements
+        SET default_target = COALESCE(
+            (criteria->>'hours_required')::numeric,
+            (criteria->>'projects_required')::numeric,
+            (criteria->>'tasks_required')::numeric,
+            (criteria->>'skills_required')::numeric,
+            (criteria->>'trainings_required')::numeric,
+            (criteria->>'days_required')::numeric,
+            (criteria->>'volunteers_required')::numeric,
+            1
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column("achievements", "default_target")
@@ -0,0 +1,39 @@
+"""Convert leaderboards.rankings to JSONB
+
+Revision ID: 022_leaderboard_rankings_jsonb
+Revises: 021_ach_default_target
+Create Date: 2026-10-17
+
+JSONB is stored pre-parsed and compressed, so reading and rewriting
+large ranking snapshots no longer re-parses the text document.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "022_leaderboard_rankings_jsonb"
+down_revision: Union[str, None] = "021_ach_default_target"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "leaderboards",
+        "rankings",
+        type_=postgresql.JSONB(),
+        postgresql_using="rankings::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "leaderboards",
+        "rankings",
+        type_=sa.JSON(),
+        postgresql_using="rankings::json",
+    )
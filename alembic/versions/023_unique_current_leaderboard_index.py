@@ -0,0 +1,57 @@
+"""Make the current-leaderboard partial index unique
+
+Revision ID: 023_unique_current_leaderboard
+Revises: 022_leaderboard_rankings_jsonb
+Create Date: 2026-10-17
+
+Replaces ix_lb_type_tf_current with a unique partial index on
+(leaderboard_type, timeframe) WHERE is_current, which both serves the
+current-leaderboard lookup and enforces a single current snapshot per
+type/timeframe. Older duplicate current rows are demoted first.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "023_unique_current_leaderboard"
+down_revision: Union[str, None] = "022_leaderboard_rankings_jsonb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        UPDATE leaderboards lb
+        SET is_current = false
+        WHERE lb.is_current
+          AND lb.id <> (
+              SELECT max(latest.id)
+              FROM leaderboards latest
+              WHERE latest.is_current
+                AND latest.leaderboard_type = lb.leaderboard_type
+                AND latest.timeframe = lb.timeframe
+          )
+    """)
+    op.drop_index("ix_lb_type_tf_current", table_name="leaderboards", if_exists=True)
+    op.create_index(
+        "ix_leaderboard_current",
+        "leaderboards",
+        ["leaderboard_type", "timeframe"],
+        unique=True,
+        postgresql_where=sa.text("is_current"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leaderboard_current", table_name="leaderboards", if_exists=True)
+    op.create_index(
+        "ix_lb_type_tf_current",
+        "leaderboards",
+        ["leaderboard_type", "timeframe", "is_current"],
+        postgresql_where=sa.text("is_current"),
+        if_not_exists=True,
+    )
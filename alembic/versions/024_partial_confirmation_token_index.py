@@ -0,0 +1,52 @@
+"""Make the subscriber confirmation-token index unique and partial
+
+Revision ID: 024_partial_confirmation_token
+Revises: 023_unique_current_leaderboard
+Create Date: 2026-10-17
+
+confirmation_token is cleared once a subscriber confirms, so most rows
+hold NULL. Index only the live tokens, uniquely, so confirmation lookups
+hit a small B-tree. The unsubscribe/open/click token columns already
+have unique indexes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "024_partial_confirmation_token"
+down_revision: Union[str, None] = "023_unique_current_leaderboard"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(
+        "ix_newsletter_subscribers_confirmation_token",
+        table_name="newsletter_subscribers",
+        if_exists=True,
+    )
+    op.create_index(
+        "ix_newsletter_subscribers_confirmation_token",
+        "newsletter_subscribers",
+        ["confirmation_token"],
+        unique=True,
+        postgresql_where=sa.text("confirmation_token IS NOT NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_newsletter_subscribers_confirmation_token",
+        table_name="newsletter_subscribers",
+        if_exists=True,
+    )
+    op.create_index(
+        "ix_newsletter_subscribers_confirmation_token",
+        "newsletter_subscribers",
+        ["confirmation_token"],
+        if_not_exists=True,
+    )
@@ -0,0 +1,46 @@
+"""Make (subscriber_id, tag_id) unique on subscriber_tags
+
+Revision ID: 025_unique_subscriber_tag
+Revises: 024_partial_confirmation_token
+Create Date: 2026-10-17
+
+Tag attachment now inserts with ON CONFLICT (subscriber_id, tag_id)
+DO NOTHING, which needs a unique index on the pair. Duplicate pairs
+left by the old check-then-insert path are removed first, keeping the
+oldest row.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "025_unique_subscriber_tag"
+down_revision: Union[str, None] = "024_partial_confirmation_token"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM subscriber_tags dup
+        USING subscriber_tags keep
+        WHERE dup.subscriber_id = keep.subscriber_id
+          AND dup.tag_id = keep.tag_id
+          AND dup.id > keep.id
+    """)
+    op.create_index(
+        "ix_subscriber_tags_subscriber_tag",
+        "subscriber_tags",
+        ["subscriber_id", "tag_id"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_subscriber_tags_subscriber_tag",
+        table_name="subscriber_tags",
+        if_exists=True,
+    )
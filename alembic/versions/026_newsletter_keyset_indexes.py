@@ -0,0 +1,48 @@
+"""Add keyset pagination indexes for newsletter listings
+
+Revision ID: 026_newsletter_keyset_indexes
+Revises: 025_unique_subscriber_tag
+Create Date: 2026-10-17
+
+The subscriber and campaign-recipient listings accept a cursor and seek
+with (created_at, id) < cursor and campaign_id = ? AND id > cursor
+instead of OFFSET. Composite indexes let each page start at the cursor.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "026_newsletter_keyset_indexes"
+down_revision: Union[str, None] = "025_unique_subscriber_tag"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_newsletter_subscribers_created_at_id",
+        "newsletter_subscribers",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_campaign_recipients_campaign_id_id",
+        "campaign_recipients",
+        ["campaign_id", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_campaign_recipients_campaign_id_id",
+        table_name="campaign_recipients",
+        if_exists=True,
+    )
+    op.drop_index(
+        "ix_newsletter_subscribers_created_at_id",
+        table_name="newsletter_subscribers",
+        if_exists=True,
+    )
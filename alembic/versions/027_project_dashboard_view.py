@@ -0,0 +1,68 @@
+"""Add mv_project_dashboard materialized view
+
+Revision ID: 027_project_dashboard_view
+Revises: 026_newsletter_keyset_indexes
+Create Date: 2026-10-17
+
+Per-project team, task and approved-hour aggregates for the project
+dashboard and stats, so those endpoints stop aggregating project_teams,
+tasks and volunteer_time_logs on every request. The background task
+manager refreshes it concurrently, which needs the unique index on id.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "027_project_dashboard_view"
+down_revision: Union[str, None] = "026_newsletter_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_project_dashboard AS
+        SELECT
+            p.id,
+            COALESCE(team.team_size, 0) AS team_size,
+            COALESCE(team.volunteers_count, 0) AS volunteers_count,
+            COALESCE(task.total_tasks, 0) AS total_tasks,
+            COALESCE(task.completed_tasks, 0) AS completed_tasks,
+            COALESCE(hours.volunteer_hours, 0) AS volunteer_hours
+        FROM projects p
+        LEFT JOIN (
+            SELECT project_id,
+                   COUNT(DISTINCT user_id) AS team_size,
+                   COUNT(DISTINCT CASE WHEN is_volunteer THEN user_id END) AS volunteers_count
+            FROM project_teams
+            WHERE is_active = true
+            GROUP BY project_id
+        ) team ON team.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id,
+                   COUNT(*) AS total_tasks,
+                   COUNT(CASE WHEN status = 'completed' THEN 1 END) AS completed_tasks
+            FROM tasks
+            GROUP BY project_id
+        ) task ON task.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id, SUM(hours) AS volunteer_hours
+            FROM volunteer_time_logs
+            WHERE approved = true
+            GROUP BY project_id
+        ) hours ON hours.project_id = p.id
+        WITH DATA
+    """)
+    op.create_index(
+        "ix_mv_project_dashboard_id",
+        "mv_project_dashboard",
+        ["id"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_project_dashboard")
@@ -0,0 +1,68 @@
+"""Add composite and partial indexes for project queries
+
+Revision ID: 028_project_composite_indexes
+Revises: 027_project_dashboard_view
+Create Date: 2026-10-17
+
+Project CRUD filters by project_id plus a second predicate or sort key.
+These indexes cover those shapes so PostgreSQL can range-scan in order
+instead of combining single-column indexes and sorting. Newest-first
+orders are served by scanning the ascending indexes backwards.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "028_project_composite_indexes"
+down_revision: Union[str, None] = "027_project_dashboard_view"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_projects_status_created_at",
+        "projects",
+        ["status", "created_at"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_project_teams_project_active",
+        "project_teams",
+        ["project_id"],
+        postgresql_where=sa.text("is_active"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_milestones_project_target_date",
+        "milestones",
+        ["project_id", "target_date"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_environmental_metrics_project_measurement_date",
+        "environmental_metrics",
+        ["project_id", "measurement_date"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_volunteer_time_logs_project_approved",
+        "volunteer_time_logs",
+        ["project_id"],
+        postgresql_where=sa.text("approved"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    for name, table in (
+        ("ix_volunteer_time_logs_project_approved", "volunteer_time_logs"),
+        ("ix_environmental_metrics_project_measurement_date", "environmental_metrics"),
+        ("ix_milestones_project_target_date", "milestones"),
+        ("ix_project_teams_project_active", "project_teams"),
+        ("ix_projects_status_created_at", "projects"),
+    ):
+        op.drop_index(name, table_name=table, if_exists=True)
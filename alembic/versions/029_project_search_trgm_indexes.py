@@ -0,0 +1,46 @@
+"""Add trigram indexes for project search
+
+Revision ID: 029_project_search_trgm
+Revises: 028_project_composite_indexes
+Create Date: 2026-10-17
+
+get_projects searches with name/description ILIKE '%term%'. A leading
+wildcard cannot use a B-tree, but pg_trgm GIN indexes can serve ILIKE
+substring matches, so each side of the OR becomes a bitmap index scan.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "029_project_search_trgm"
+down_revision: Union[str, None] = "028_project_composite_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_projects_name_trgm",
+        "projects",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_projects_description_trgm",
+        "projects",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    op.drop_index("ix_projects_description_trgm", table_name="projects", if_exists=True)
+    op.drop_index("ix_projects_name_trgm", table_name="projects", if_exists=True)
@@ -0,0 +1,63 @@
+"""Make active project memberships unique
+
+Revision ID: 030_unique_active_project_member
+Revises: 029_project_search_trgm
+Create Date: 2026-10-17
+
+add_team_member now inserts with ON CONFLICT (project_id, user_id)
+WHERE is_active DO NOTHING, which needs a matching unique partial
+index. Duplicate active memberships are deactivated first, keeping the
+newest. The index leads with project_id, so it replaces the partial
+project_id index from 028.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "030_unique_active_project_member"
+down_revision: Union[str, None] = "029_project_search_trgm"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        UPDATE project_teams dup
+        SET is_active = false, removed_at = now()
+        FROM project_teams keep
+        WHERE dup.project_id = keep.project_id
+          AND dup.user_id = keep.user_id
+          AND dup.is_active AND keep.is_active
+          AND dup.id < keep.id
+    """)
+    op.create_index(
+        "ix_project_teams_active_member",
+        "project_teams",
+        ["project_id", "user_id"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_project_teams_project_active",
+        table_name="project_teams",
+        if_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_project_teams_project_active",
+        "project_teams",
+        ["project_id"],
+        postgresql_where=sa.text("is_active"),
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_project_teams_active_member",
+        table_name="project_teams",
+        if_exists=True,
+    )
@@ -0,0 +1,41 @@
+"""Add keyset pagination indexes for project and resource listings
+
+Revision ID: 031_project_resource_keyset
+Revises: 030_unique_active_project_member
+Create Date: 2026-10-17
+
+Projects page by (created_at, id) descending and active resources by
+(name, id), seeking past the last row seen instead of using OFFSET.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "031_project_resource_keyset"
+down_revision: Union[str, None] = "030_unique_active_project_member"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_projects_created_at_id",
+        "projects",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_resources_active_name_id",
+        "resources",
+        ["name", "id"],
+        postgresql_where=sa.text("is_active"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resources_active_name_id", table_name="resources", if_exists=True)
+    op.drop_index("ix_projects_created_at_id", table_name="projects", if_exists=True)
@@ -0,0 +1,39 @@
+"""Give project and resource updated_at columns a database default
+
+Revision ID: 032_updated_at_server_defaults
+Revises: 031_project_resource_keyset
+Create Date: 2026-10-17
+
+updated_at on projects, milestones, environmental_metrics and resources
+is now filled by the database: a server default on insert and an
+ORM-side onupdate of TIMEZONE('utc', CURRENT_TIMESTAMP) on update, so
+the stored values stay naive UTC like datetime.utcnow().
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "032_updated_at_server_defaults"
+down_revision: Union[str, None] = "031_project_resource_keyset"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("projects", "milestones", "environmental_metrics", "resources")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "updated_at",
+            server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "updated_at", server_default=None)
@@ -0,0 +1,50 @@
+"""Add a full-text search vector to projects
+
+Revision ID: 033_project_search_vector
+Revises: 032_updated_at_server_defaults
+Create Date: 2026-10-17
+
+get_projects matches search terms of three or more characters with
+search_vector @@ to_tsquery('simple', ...), each word as a prefix
+(word:*), ORed with the ILIKE substring match on name and description.
+The column is generated from name and description and GIN-indexed.
+Shorter terms use only ILIKE and the trigram indexes from 029.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "033_project_search_vector"
+down_revision: Union[str, None] = "032_updated_at_server_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_projects_fts",
+        "projects",
+        ["search_vector"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_fts", table_name="projects", if_exists=True)
+    op.drop_column("projects", "search_vector")
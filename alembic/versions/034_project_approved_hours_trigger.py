@@ -0,0 +1,74 @@
+"""Keep approved volunteer hours on the project row
+
+Revision ID: 034_project_approved_hours
+Revises: 033_project_search_vector
+Create Date: 2026-10-17
+
+Project details used to SUM approved volunteer_time_logs.hours on every
+fetch. projects.total_approved_hours now holds that total, and a row
+trigger on volunteer_time_logs applies each insert, update and delete
+as a delta. The existing totals are backfilled here.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "034_project_approved_hours"
+down_revision: Union[str, None] = "033_project_search_vector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column(
+            "total_approved_hours",
+            sa.Numeric(12, 2),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.execute("""
+        UPDATE projects p
+        SET total_approved_hours = t.hours
+        FROM (
+            SELECT project_id, SUM(hours) AS hours
+            FROM volunteer_time_logs
+            WHERE approved AND project_id IS NOT NULL
+            GROUP BY project_id
+        ) t
+        WHERE t.project_id = p.id
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION projects_track_approved_hours() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.approved AND OLD.project_id IS NOT NULL THEN
+                UPDATE projects
+                SET total_approved_hours = total_approved_hours - OLD.hours
+                WHERE id = OLD.project_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.approved AND NEW.project_id IS NOT NULL THEN
+                UPDATE projects
+                SET total_approved_hours = total_approved_hours + NEW.hours
+                WHERE id = NEW.project_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER volunteer_time_logs_approved_hours
+        AFTER INSERT OR DELETE OR UPDATE OF approved, hours, project_id
+        ON volunteer_time_logs
+        FOR EACH ROW EXECUTE FUNCTION projects_track_approved_hours()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS volunteer_time_logs_approved_hours ON volunteer_time_logs")
+    op.execute("DROP FUNCTION IF EXISTS projects_track_approved_hours()")
+    op.drop_column("projects", "total_approved_hours")
@@ -0,0 +1,40 @@
+"""Add keyset pagination indexes for tasks and users
+
+Revision ID: 035_task_user_keyset
+Revises: 034_project_approved_hours
+Create Date: 2026-10-17
+
+GET /tasks pages by (created_at, id) newest first and GET /users by
+(name, id). A composite B-tree on each pair serves both the keyset
+predicate and the ORDER BY; the tasks index is scanned backwards.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "035_task_user_keyset"
+down_revision: Union[str, None] = "034_project_approved_hours"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_created_at_id",
+        "tasks",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_users_name_id",
+        "users",
+        ["name", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_name_id", table_name="users", if_exists=True)
+    op.drop_index("ix_tasks_created_at_id", table_name="tasks", if_exists=True)
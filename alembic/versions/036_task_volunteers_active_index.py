@@ -0,0 +1,39 @@
+"""Add a partial index on active task volunteer assignments
+
+Revision ID: 036_task_volunteers_active
+Revises: 035_task_user_keyset
+Create Date: 2026-10-17
+
+get_volunteer_suitable_tasks counts active assignments per task with a
+correlated subquery. Indexing task_id over active rows only keeps each
+count a small index lookup.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "036_task_volunteers_active"
+down_revision: Union[str, None] = "035_task_user_keyset"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_volunteers_task_active",
+        "task_volunteers",
+        ["task_id"],
+        postgresql_where=sa.text("is_active"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_task_volunteers_task_active",
+        table_name="task_volunteers",
+        if_exists=True,
+    )
@@ -0,0 +1,50 @@
+"""Add trigram indexes for task and user search
+
+Revision ID: 037_task_user_search_trgm
+Revises: 036_task_volunteers_active
+Create Date: 2026-10-17
+
+get_tasks searches title/description and get_users searches name,
+email, department and employee_id with ILIKE '%term%'. As in 029, pg_trgm
+GIN indexes let each side of those ORs use a bitmap index scan instead
+of a sequential scan.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "037_task_user_search_trgm"
+down_revision: Union[str, None] = "036_task_volunteers_active"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRGM_INDEXES = (
+    ("ix_tasks_title_trgm", "tasks", "title"),
+    ("ix_tasks_description_trgm", "tasks", "description"),
+    ("ix_users_name_trgm", "users", "name"),
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_users_department_trgm", "users", "department"),
+    ("ix_users_employee_id_trgm", "users", "employee_id"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects depend on it
+    for name, table, _ in reversed(TRGM_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
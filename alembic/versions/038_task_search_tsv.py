@@ -0,0 +1,50 @@
+"""Add a weighted full-text search vector to tasks
+
+Revision ID: 038_task_search_tsv
+Revises: 037_task_user_search_trgm
+Create Date: 2026-10-17
+
+Multi-word task searches match search_tsv @@ websearch_to_tsquery and
+rank by ts_rank_cd, with title weighted above description. The column is
+generated and GIN-indexed. Single-word searches keep ILIKE on the
+trigram indexes from 037.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "038_task_search_tsv"
+down_revision: Union[str, None] = "037_task_user_search_trgm"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_tasks_search_tsv",
+        "tasks",
+        ["search_tsv"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_search_tsv", table_name="tasks", if_exists=True)
+    op.drop_column("tasks", "search_tsv")
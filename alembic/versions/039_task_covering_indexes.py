@@ -0,0 +1,79 @@
+"""Add composite and covering indexes for task queries
+
+Revision ID: 039_task_covering_indexes
+Revises: 038_task_search_tsv
+Create Date: 2026-10-17
+
+Task stats filter by project and group by status/priority, the
+volunteer listing filters on suitable_for_volunteers and status, and
+the overdue count only considers open tasks. Dependency lookups by
+successor and approved-hours sums per task carry the selected column
+in INCLUDE so they can be answered with index-only scans. Active
+task_volunteers rows are already indexed by 036.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "039_task_covering_indexes"
+down_revision: Union[str, None] = "038_task_search_tsv"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_project_status_priority",
+        "tasks",
+        ["project_id", "status", "priority"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_tasks_volunteer_status",
+        "tasks",
+        ["suitable_for_volunteers", "status"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_tasks_open_end_date",
+        "tasks",
+        ["end_date"],
+        postgresql_where=sa.text("status IN ('not_started', 'in_progress')"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_task_dependencies_successor",
+        "task_dependencies",
+        ["successor_task_id"],
+        postgresql_include=["predecessor_task_id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_volunteer_time_logs_task_approved",
+        "volunteer_time_logs",
+        ["task_id"],
+        postgresql_include=["hours"],
+        postgresql_where=sa.text("approved"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_volunteer_time_logs_task_approved",
+        table_name="volunteer_time_logs",
+        if_exists=True,
+    )
+    op.drop_index(
+        "ix_task_dependencies_successor",
+        table_name="task_dependencies",
+        if_exists=True,
+    )
+    op.drop_index("ix_tasks_open_end_date", table_name="tasks", if_exists=True)
+    op.drop_index("ix_tasks_volunteer_status", table_name="tasks", if_exists=True)
+    op.drop_index(
+        "ix_tasks_project_status_priority", table_name="tasks", if_exists=True
+    )
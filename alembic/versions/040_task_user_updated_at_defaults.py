@@ -0,0 +1,39 @@
+"""Give task and user updated_at columns a database default
+
+Revision ID: 040_task_user_updated_at
+Revises: 039_task_covering_indexes
+Create Date: 2026-10-17
+
+Same treatment as 032: tasks.updated_at and users.updated_at are filled
+by the database (server default on insert, ORM-side onupdate of
+TIMEZONE('utc', CURRENT_TIMESTAMP)), so the CRUD writes no longer send
+a client timestamp.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "040_task_user_updated_at"
+down_revision: Union[str, None] = "039_task_covering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("tasks", "users")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "updated_at",
+            server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "updated_at", server_default=None)
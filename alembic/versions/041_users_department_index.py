@@ -0,0 +1,36 @@
+"""Add a partial index on users.department
+
+Revision ID: 041_users_department
+Revises: 040_task_user_updated_at
+Create Date: 2026-10-17
+
+get_departments walks distinct departments with a recursive CTE that
+looks up MIN(department) > previous each step. This B-tree over
+non-NULL departments makes each step a single index probe instead of
+a DISTINCT over the whole users table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "041_users_department"
+down_revision: Union[str, None] = "040_task_user_updated_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_department",
+        "users",
+        ["department"],
+        postgresql_where=sa.text("department IS NOT NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_department", table_name="users", if_exists=True)
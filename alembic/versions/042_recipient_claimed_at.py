@@ -0,0 +1,37 @@
+"""Add campaign_recipients.claimed_at
+
+Revision ID: 042_recipient_claimed_at
+Revises: 041_users_department
+Create Date: 2026-10-17
+
+get_pending_recipients stamps claimed_at when a send worker moves a
+recipient to 'sending', and re-queues claims older than the lease so
+rows held by a crashed worker are sent by the next batch. Rows already
+in 'sending' get a fresh lease so they expire like any other claim.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "042_recipient_claimed_at"
+down_revision: Union[str, None] = "041_users_department"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "campaign_recipients",
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+    )
+    op.execute(
+        "UPDATE campaign_recipients SET claimed_at = now() "
+        "WHERE status = 'sending'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("campaign_recipients", "claimed_at")
@@ -28,7 +28,7 @@ def get_password_hash(password: str) -> str:
     hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed_password.decode('utf-8')
 
-def create_access_token(
+async def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None,
     ip_address: Optional[str] = None,
@@ -84,12 +84,12 @@ def create_access_token(
             status=TokenStatus.ACTIVE
         )
         blacklist = get_token_blacklist()
-        blacklist.store_token_metadata(metadata)
+        await blacklist.store_token_metadata(metadata)
 
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def create_refresh_token(
+async def create_refresh_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None,
     token_family: Optional[str] = None,
@@ -150,12 +150,12 @@ def create_refresh_token(
             status=TokenStatus.ACTIVE
         )
         blacklist = get_token_blacklist()
-        blacklist.store_token_metadata(metadata)
+        await blacklist.store_token_metadata(metadata)
 
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt, token_family
 
-def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
+async def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     """
     Verify a JWT token and check if it has been revoked.
 
@@ -177,7 +177,7 @@ def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
             return None
 
         # Check if token has been revoked
-        if jti and is_token_revoked(jti):
+        if jti and await is_token_revoked(jti):
             return None
 
         try:
@@ -108,7 +108,7 @@ def reset_login_rate_limit(identifier: str) -> None:
     rate_limiter.reset(f"login:{identifier}")
 
 
-def log_and_create_tokens(
+async def log_and_create_tokens(
     user_id: int,
     email: str,
     ip_address: Optional[str],
@@ -125,12 +125,12 @@ def log_and_create_tokens(
 
     # Create tokens
     token_data = {"sub": user_id, "email": email}
-    access_token = create_access_token(
+    access_token = await create_access_token(
         token_data,
         ip_address=ip_address,
         user_agent=user_agent
     )
-    refresh_token, token_family = create_refresh_token(
+    refresh_token, token_family = await create_refresh_token(
         token_data,
         token_family=token_family,
         ip_address=ip_address,
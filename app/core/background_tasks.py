@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from sqlmodel import Session
 
-from app.database.engine import get_db
+from app.database.engine import AsyncSessionLocal, get_db
 from app.services.notification_service import NotificationService
 from app.core.sse_manager import get_sse_manager
 
@@ -35,6 +35,7 @@ class BackgroundTaskManager:
         self.tasks.append(asyncio.create_task(self.cleanup_expired_notifications_task()))
         self.tasks.append(asyncio.create_task(self.cleanup_stale_sse_connections_task()))
         self.tasks.append(asyncio.create_task(self.update_leaderboards_task()))
+        self.tasks.append(asyncio.create_task(self.refresh_project_dashboard_task()))
 
         # Newsletter campaign tasks
         self.tasks.append(asyncio.create_task(self.process_scheduled_campaigns_task()))
@@ -132,6 +133,7 @@ class BackgroundTaskManager:
                     from app.services.gamification_service import GamificationService
 
                     count = GamificationService.update_all_leaderboards(db)
+                    await GamificationService.invalidate_leaderboard_cache()
                     logger.info(f"Updated {count} leaderboards")
                 finally:
                     # Close the database session
@@ -148,6 +150,44 @@ class BackgroundTaskManager:
                 # Wait before retrying
                 await asyncio.sleep(60)
 
+    async def refresh_project_dashboard_task(self):
+        """
+        Periodically refresh the project dashboard materialized view.
+        Runs every 5 minutes.
+        """
+        while self._running:
+            try:
+                await asyncio.sleep(300)  # Run every 5 minutes
+
+                # The refresh is a blocking query; keep it off the event loop
+                await asyncio.to_thread(self._refresh_project_dashboard)
+
+            except asyncio.CancelledError:
+                logger.info("Project dashboard refresh task cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in project dashboard refresh task: {e}")
+                # Wait before retrying
+                await asyncio.sleep(60)
+
+    @staticmethod
+    def _refresh_project_dashboard():
+        """Refresh mv_project_dashboard on a session owned by the calling thread."""
+        from app.crud.project import project_crud
+
+        # Get a database session
+        db_gen = get_db()
+        db = next(db_gen)
+
+        try:
+            project_crud.refresh_dashboard_view(db)
+        finally:
+            # Close the database session
+            try:
+                next(db_gen)
+            except StopIteration:
+                pass
+
     async def process_scheduled_campaigns_task(self):
         """
         Check for campaigns due to be sent and start sending.
@@ -157,25 +197,17 @@ class BackgroundTaskManager:
             try:
                 await asyncio.sleep(60)  # Check every minute
 
-                # Get a database session
-                db_gen = get_db()
-                db = next(db_gen)
-
-                try:
+                async with AsyncSessionLocal() as db:
                     from app.services.campaign_service import campaign_service
 
                     # Get campaigns due to be sent
-                    due_campaigns = campaign_service.get_due_campaigns(db)
+                    due_campaigns = await campaign_service.get_due_campaigns(db)
 
                     for campaign in due_campaigns:
                         # Start sending the campaign
                         await campaign_service.send_campaign_now(db, campaign.id)
+                        await db.commit()
                         logger.info(f"Started sending scheduled campaign {campaign.id}: {campaign.name}")
-                finally:
-                    try:
-                        next(db_gen)
-                    except StopIteration:
-                        pass
 
             except asyncio.CancelledError:
                 logger.info("Scheduled campaigns task cancelled")
@@ -193,16 +225,12 @@ class BackgroundTaskManager:
             try:
                 await asyncio.sleep(10)  # Check every 10 seconds
 
-                # Get a database session
-                db_gen = get_db()
-                db = next(db_gen)
-
-                try:
+                async with AsyncSessionLocal() as db:
                     from app.services.campaign_service import campaign_service
                     from app.core.config import settings
 
                     # Get campaigns that are currently sending
-                    sending_campaigns = campaign_service.get_sending_campaigns(db)
+                    sending_campaigns = await campaign_service.get_sending_campaigns(db)
 
                     for campaign in sending_campaigns:
                         # Process a batch of emails
@@ -218,11 +246,6 @@ class BackgroundTaskManager:
 
                         if remaining == 0:
                             logger.info(f"Campaign {campaign.id} sending complete")
-                finally:
-                    try:
-                        next(db_gen)
-                    except StopIteration:
-                        pass
 
             except asyncio.CancelledError:
                 logger.info("Campaign sending task cancelled")
@@ -0,0 +1,120 @@
+"""
+Small key/value cache for hot read endpoints.
+Values are JSON strings; entries expire after a TTL and can be
+invalidated explicitly after writes.
+"""
+
+import inspect
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryCache:
+    """
+    In-memory cache for development/testing.
+    In production, use Redis so all workers share entries and invalidations.
+    """
+
+    def __init__(self):
+        # key -> (expires_at_monotonic, value)
+        self._entries: Dict[str, Tuple[float, str]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store a value for ttl seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def delete(self, *keys: str) -> None:
+        """Remove entries."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisCache:
+    """
+    Redis-backed cache for production use.
+    Expects a redis.asyncio client created with decode_responses=True.
+
+    Redis errors are logged and treated as a miss (or a no-op write), so
+    an unavailable cache only costs the loader call, not the request.
+    """
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self._prefix = "cache:"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None if missing or expired."""
+        try:
+            return await self.redis.get(f"{self._prefix}{key}")
+        except Exception as e:
+            logger.error(f"Cache get failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store a value for ttl seconds."""
+        try:
+            await self.redis.setex(f"{self._prefix}{key}", ttl, value)
+        except Exception as e:
+            logger.error(f"Cache set failed for {key}: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        """Remove entries."""
+        if not keys:
+            return
+        try:
+            await self.redis.delete(*(f"{self._prefix}{key}" for key in keys))
+        except Exception as e:
+            logger.error(f"Cache delete failed for {', '.join(keys)}: {e}")
+
+
+# Global cache instance
+_cache: Union[InMemoryCache, RedisCache] = InMemoryCache()
+
+
+def get_cache() -> Union[InMemoryCache, RedisCache]:
+    """Get the cache instance."""
+    return _cache
+
+
+def initialize_redis_cache(redis_client):
+    """
+    Initialize the Redis-based cache.
+    Call this during application startup with a redis.asyncio client.
+    """
+    global _cache
+    _cache = RedisCache(redis_client)
+
+
+async def get_or_set(
+    key: str,
+    ttl: int,
+    loader: Callable[[], Union[Optional[str], Awaitable[Optional[str]]]],
+) -> Optional[str]:
+    """
+    Return the cached value for key, calling loader on a miss.
+    The loader returns a JSON string (sync or async); None is not cached.
+    """
+    value = await _cache.get(key)
+    if value is not None:
+        return value
+
+    value = loader()
+    if inspect.isawaitable(value):
+        value = await value
+    if value is not None:
+        await _cache.set(key, value, ttl)
+    return value
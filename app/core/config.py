@@ -16,6 +16,16 @@ class Settings(BaseSettings):
     DB_USER: str = "repensar"
     DB_PASSWORD: str = "repensar_password"
     DB_NAME: str = "repensar_db"
+    # Compiled SQL cache entries per engine (SQLAlchemy default is 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Async (asyncpg) engine pool
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800
+    # Set when connecting through PgBouncer in transaction mode
+    DB_PGBOUNCER: bool = False
+    # Upper bound for free-text search statements (0 disables)
+    SEARCH_STATEMENT_TIMEOUT_MS: int = 3000
 
     # Redis (optional - for production)
     REDIS_URL: Optional[str] = None  # e.g., "redis://localhost:6379/0"
@@ -16,7 +16,7 @@ async def get_current_user(
     db: Session = Depends(get_db),
 ) -> User:
     token = credentials.credentials
-    token_data = verify_token(token)
+    token_data = await verify_token(token)
 
     if token_data is None:
         raise HTTPException(
@@ -62,7 +62,7 @@ async def get_optional_user(
         return None
 
     token = credentials.credentials
-    token_data = verify_token(token)
+    token_data = await verify_token(token)
     if token_data is None:
         return None
 
@@ -3,8 +3,9 @@ Production-grade JWT token management with blacklisting, rotation, and audit log
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any, List, Set, Union
 from dataclasses import dataclass
+from array import array
 import secrets
 import hashlib
 from enum import Enum
@@ -20,7 +21,7 @@ class TokenStatus(Enum):
     COMPROMISED = "compromised"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenMetadata:
     """Metadata for token tracking."""
     jti: str  # JWT ID
@@ -38,35 +39,85 @@ class InMemoryTokenBlacklist:
     """
     In-memory token blacklist for development/testing.
     In production, use Redis or another distributed cache.
+
+    Token metadata is kept column-wise: one compact array per field, with
+    ``_jti_index`` mapping a jti to its row. This avoids one object per live
+    token and lets ``cleanup_expired`` scan a contiguous array of expiry
+    timestamps.
     """
 
     def __init__(self):
         self._blacklist: Set[str] = set()
-        self._token_metadata: Dict[str, TokenMetadata] = {}
         self._family_tokens: Dict[str, Set[str]] = {}  # token_family -> set of jtis
 
-    def add_to_blacklist(self, jti: str, expires_at: datetime) -> None:
+        # Token metadata columns; row i describes self._jtis[i]
+        self._jti_index: Dict[str, int] = {}
+        self._jtis: List[str] = []
+        self._user_ids = array("q")
+        self._issued_at = array("d")
+        self._expires_at = array("d")
+        self._families: List[str] = []
+        self._token_types: List[str] = []
+        self._ips: List[Optional[str]] = []
+        self._user_agents: List[Optional[str]] = []
+        self._statuses: List[TokenStatus] = []
+
+    async def add_to_blacklist(self, jti: str, expires_at: datetime) -> None:
         """Add a token to the blacklist."""
         self._blacklist.add(jti)
 
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token is blacklisted."""
         return jti in self._blacklist
 
-    def store_token_metadata(self, metadata: TokenMetadata) -> None:
+    async def store_token_metadata(self, metadata: TokenMetadata) -> None:
         """Store token metadata for tracking."""
-        self._token_metadata[metadata.jti] = metadata
+        row = self._jti_index.get(metadata.jti)
+        if row is None:
+            self._jti_index[metadata.jti] = len(self._jtis)
+            self._jtis.append(metadata.jti)
+            self._user_ids.append(metadata.user_id)
+            self._issued_at.append(metadata.issued_at.timestamp())
+            self._expires_at.append(metadata.expires_at.timestamp())
+            self._families.append(metadata.token_family)
+            self._token_types.append(metadata.token_type)
+            self._ips.append(metadata.issued_from_ip)
+            self._user_agents.append(metadata.user_agent)
+            self._statuses.append(metadata.status)
+        else:
+            self._user_ids[row] = metadata.user_id
+            self._issued_at[row] = metadata.issued_at.timestamp()
+            self._expires_at[row] = metadata.expires_at.timestamp()
+            self._families[row] = metadata.token_family
+            self._token_types[row] = metadata.token_type
+            self._ips[row] = metadata.issued_from_ip
+            self._user_agents[row] = metadata.user_agent
+            self._statuses[row] = metadata.status
 
         # Track token families for rotation
         if metadata.token_family not in self._family_tokens:
             self._family_tokens[metadata.token_family] = set()
         self._family_tokens[metadata.token_family].add(metadata.jti)
 
-    def get_token_metadata(self, jti: str) -> Optional[TokenMetadata]:
+    async def get_token_metadata(self, jti: str) -> Optional[TokenMetadata]:
         """Retrieve token metadata."""
-        return self._token_metadata.get(jti)
+        row = self._jti_index.get(jti)
+        if row is None:
+            return None
+
+        return TokenMetadata(
+            jti=jti,
+            user_id=self._user_ids[row],
+            token_family=self._families[row],
+            issued_at=datetime.fromtimestamp(self._issued_at[row], tz=timezone.utc),
+            expires_at=datetime.fromtimestamp(self._expires_at[row], tz=timezone.utc),
+            token_type=self._token_types[row],
+            issued_from_ip=self._ips[row],
+            user_agent=self._user_agents[row],
+            status=self._statuses[row],
+        )
 
-    def revoke_token_family(self, token_family: str) -> int:
+    async def revoke_token_family(self, token_family: str) -> int:
         """
         Revoke all tokens in a family (for refresh token rotation compromise detection).
         Returns the number of tokens revoked.
@@ -77,57 +128,78 @@ class InMemoryTokenBlacklist:
         jtis = self._family_tokens[token_family]
         for jti in jtis:
             self._blacklist.add(jti)
-            if jti in self._token_metadata:
-                self._token_metadata[jti].status = TokenStatus.COMPROMISED
+            row = self._jti_index.get(jti)
+            if row is not None:
+                self._statuses[row] = TokenStatus.COMPROMISED
 
         return len(jtis)
 
-    def revoke_user_tokens(self, user_id: int) -> int:
+    async def revoke_user_tokens(self, user_id: int) -> int:
         """
         Revoke all tokens for a specific user.
         Returns the number of tokens revoked.
         """
         count = 0
-        for jti, metadata in self._token_metadata.items():
-            if metadata.user_id == user_id and metadata.status == TokenStatus.ACTIVE:
-                self._blacklist.add(jti)
-                metadata.status = TokenStatus.REVOKED
+        statuses = self._statuses
+        for row, row_user_id in enumerate(self._user_ids):
+            if row_user_id == user_id and statuses[row] == TokenStatus.ACTIVE:
+                self._blacklist.add(self._jtis[row])
+                statuses[row] = TokenStatus.REVOKED
                 count += 1
         return count
 
-    def cleanup_expired(self) -> int:
+    async def cleanup_expired(self) -> int:
         """
         Remove expired tokens from the blacklist and metadata storage.
         Returns the number of tokens cleaned up.
         """
-        now = datetime.now(timezone.utc)
-        expired_jtis = []
-
-        for jti, metadata in self._token_metadata.items():
-            if metadata.expires_at < now:
-                expired_jtis.append(jti)
+        now = datetime.now(timezone.utc).timestamp()
+        keep = [row for row, expires_at in enumerate(self._expires_at) if expires_at >= now]
+        expired_count = len(self._jtis) - len(keep)
+        if not expired_count:
+            return 0
 
-        for jti in expired_jtis:
+        kept = set(keep)
+        for row, jti in enumerate(self._jtis):
+            if row in kept:
+                continue
             self._blacklist.discard(jti)
-            metadata = self._token_metadata.pop(jti, None)
-            if metadata and metadata.token_family in self._family_tokens:
-                self._family_tokens[metadata.token_family].discard(jti)
-
-        return len(expired_jtis)
+            family = self._families[row]
+            if family in self._family_tokens:
+                self._family_tokens[family].discard(jti)
+
+        self._compact(keep)
+        return expired_count
+
+    def _compact(self, keep: List[int]) -> None:
+        """Rebuild the metadata columns, retaining only the given rows."""
+        self._jtis = [self._jtis[row] for row in keep]
+        self._user_ids = array("q", (self._user_ids[row] for row in keep))
+        self._issued_at = array("d", (self._issued_at[row] for row in keep))
+        self._expires_at = array("d", (self._expires_at[row] for row in keep))
+        self._families = [self._families[row] for row in keep]
+        self._token_types = [self._token_types[row] for row in keep]
+        self._ips = [self._ips[row] for row in keep]
+        self._user_agents = [self._user_agents[row] for row in keep]
+        self._statuses = [self._statuses[row] for row in keep]
+        self._jti_index = {jti: row for row, jti in enumerate(self._jtis)}
 
 
 class RedisTokenBlacklist:
     """
     Redis-based token blacklist for production use.
     Provides distributed caching and automatic expiration.
+
+    Expects a ``redis.asyncio`` client; multi-key writes are sent as a single
+    non-transactional pipeline so each operation costs one round trip.
     """
 
     def __init__(self, redis_client):
         """
-        Initialize with a Redis client.
+        Initialize with an async Redis client.
 
         Args:
-            redis_client: Redis client instance (from redis-py or aioredis)
+            redis_client: redis.asyncio.Redis instance
         """
         self.redis = redis_client
         self._blacklist_prefix = "token:blacklist:"
@@ -135,119 +207,137 @@ class RedisTokenBlacklist:
         self._family_prefix = "token:family:"
         self._user_tokens_prefix = "user:tokens:"
 
-    def add_to_blacklist(self, jti: str, expires_at: datetime) -> None:
+    async def add_to_blacklist(self, jti: str, expires_at: datetime) -> None:
         """Add a token to the blacklist with automatic expiration."""
         ttl = int((expires_at - datetime.now(timezone.utc)).total_seconds())
         if ttl > 0:
-            self.redis.setex(
+            await self.redis.setex(
                 f"{self._blacklist_prefix}{jti}",
                 ttl,
                 "1"
             )
 
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token is blacklisted."""
-        return self.redis.exists(f"{self._blacklist_prefix}{jti}") > 0
+        return await self.redis.exists(f"{self._blacklist_prefix}{jti}") > 0
 
-    def store_token_metadata(self, metadata: TokenMetadata) -> None:
+    async def store_token_metadata(self, metadata: TokenMetadata) -> None:
         """Store token metadata with automatic expiration."""
         ttl = int((metadata.expires_at - datetime.now(timezone.utc)).total_seconds())
         if ttl > 0:
-            # Store metadata
             key = f"{self._metadata_prefix}{metadata.jti}"
-            self.redis.hset(key, mapping={
-                "user_id": metadata.user_id,
-                "token_family": metadata.token_family,
-                "token_type": metadata.token_type,
-                "issued_at": metadata.issued_at.isoformat(),
-                "expires_at": metadata.expires_at.isoformat(),
-                "status": metadata.status.value,
-                "issued_from_ip": metadata.issued_from_ip or "",
-                "user_agent": metadata.user_agent or "",
-            })
-            self.redis.expire(key, ttl)
-
-            # Track token family
             family_key = f"{self._family_prefix}{metadata.token_family}"
-            self.redis.sadd(family_key, metadata.jti)
-            self.redis.expire(family_key, ttl)
-
-            # Track user tokens
             user_key = f"{self._user_tokens_prefix}{metadata.user_id}"
-            self.redis.sadd(user_key, metadata.jti)
-            self.redis.expire(user_key, ttl)
 
-    def get_token_metadata(self, jti: str) -> Optional[TokenMetadata]:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                # Store metadata
+                pipe.hset(key, mapping={
+                    "user_id": metadata.user_id,
+                    "token_family": metadata.token_family,
+                    "token_type": metadata.token_type,
+                    "issued_at": metadata.issued_at.isoformat(),
+                    "expires_at": metadata.expires_at.isoformat(),
+                    "status": metadata.status.value,
+                    "issued_from_ip": metadata.issued_from_ip or "",
+                    "user_agent": metadata.user_agent or "",
+                })
+                pipe.expire(key, ttl)
+
+                # Track token family
+                pipe.sadd(family_key, metadata.jti)
+                pipe.expire(family_key, ttl)
+
+                # Track user tokens
+                pipe.sadd(user_key, metadata.jti)
+                pipe.expire(user_key, ttl)
+
+                await pipe.execute()
+
+    async def get_token_metadata(self, jti: str) -> Optional[TokenMetadata]:
         """Retrieve token metadata."""
-        key = f"{self._metadata_prefix}{jti}"
-        data = self.redis.hgetall(key)
+        data = await self.redis.hgetall(f"{self._metadata_prefix}{jti}")
+        return self._metadata_from_hash(jti, data)
 
-        if not data:
-            return None
+    async def revoke_token_family(self, token_family: str) -> int:
+        """Revoke all tokens in a family."""
+        return await self._blacklist_members(f"{self._family_prefix}{token_family}")
 
-        return TokenMetadata(
-            jti=jti,
-            user_id=int(data[b"user_id"]),
-            token_family=data[b"token_family"].decode(),
-            token_type=data[b"token_type"].decode(),
-            issued_at=datetime.fromisoformat(data[b"issued_at"].decode()),
-            expires_at=datetime.fromisoformat(data[b"expires_at"].decode()),
-            status=TokenStatus(data[b"status"].decode()),
-            issued_from_ip=data[b"issued_from_ip"].decode() or None,
-            user_agent=data[b"user_agent"].decode() or None,
-        )
+    async def revoke_user_tokens(self, user_id: int) -> int:
+        """Revoke all tokens for a specific user."""
+        return await self._blacklist_members(f"{self._user_tokens_prefix}{user_id}")
 
-    def revoke_token_family(self, token_family: str) -> int:
-        """Revoke all tokens in a family."""
-        family_key = f"{self._family_prefix}{token_family}"
-        jtis = self.redis.smembers(family_key)
+    async def cleanup_expired(self) -> int:
+        """Redis handles expiration automatically, so this is a no-op."""
+        return 0
 
+    async def _blacklist_members(self, set_key: str) -> int:
+        """
+        Blacklist every token listed in a family/user set.
+        Metadata reads and blacklist writes are each batched into one pipeline.
+        """
+        jtis = [_decode(jti) for jti in await self.redis.smembers(set_key)]
+        if not jtis:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for jti in jtis:
+                pipe.hgetall(f"{self._metadata_prefix}{jti}")
+            hashes = await pipe.execute()
+
+        now = datetime.now(timezone.utc)
         count = 0
-        for jti in jtis:
-            jti_str = jti.decode() if isinstance(jti, bytes) else jti
-            metadata = self.get_token_metadata(jti_str)
-            if metadata:
-                self.add_to_blacklist(jti_str, metadata.expires_at)
-                count += 1
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for jti, data in zip(jtis, hashes):
+                metadata = self._metadata_from_hash(jti, data)
+                if metadata:
+                    ttl = int((metadata.expires_at - now).total_seconds())
+                    if ttl > 0:
+                        pipe.setex(f"{self._blacklist_prefix}{jti}", ttl, "1")
+                    count += 1
+            await pipe.execute()
 
         return count
 
-    def revoke_user_tokens(self, user_id: int) -> int:
-        """Revoke all tokens for a specific user."""
-        user_key = f"{self._user_tokens_prefix}{user_id}"
-        jtis = self.redis.smembers(user_key)
+    @staticmethod
+    def _metadata_from_hash(jti: str, data: Dict[Any, Any]) -> Optional[TokenMetadata]:
+        """Build TokenMetadata from a metadata hash (bytes or str responses)."""
+        if not data:
+            return None
 
-        count = 0
-        for jti in jtis:
-            jti_str = jti.decode() if isinstance(jti, bytes) else jti
-            metadata = self.get_token_metadata(jti_str)
-            if metadata:
-                self.add_to_blacklist(jti_str, metadata.expires_at)
-                count += 1
+        fields = {_decode(k): _decode(v) for k, v in data.items()}
+        return TokenMetadata(
+            jti=jti,
+            user_id=int(fields["user_id"]),
+            token_family=fields["token_family"],
+            token_type=fields["token_type"],
+            issued_at=datetime.fromisoformat(fields["issued_at"]),
+            expires_at=datetime.fromisoformat(fields["expires_at"]),
+            status=TokenStatus(fields["status"]),
+            issued_from_ip=fields["issued_from_ip"] or None,
+            user_agent=fields["user_agent"] or None,
+        )
 
-        return count
 
-    def cleanup_expired(self) -> int:
-        """Redis handles expiration automatically, so this is a no-op."""
-        return 0
+def _decode(value: Any) -> str:
+    """Normalize a Redis response value to str."""
+    return value.decode() if isinstance(value, bytes) else value
 
 
-# Global token blacklist instance
-_token_blacklist: Optional[InMemoryTokenBlacklist] = None
+# Global token blacklist instance. Created eagerly so the hot-path helpers
+# below read it directly instead of going through a lazy-init check; startup
+# may swap it for a Redis-backed instance via initialize_redis_blacklist().
+_token_blacklist: Union[InMemoryTokenBlacklist, RedisTokenBlacklist] = InMemoryTokenBlacklist()
 
 
-def get_token_blacklist() -> InMemoryTokenBlacklist:
-    """Get or create the token blacklist instance."""
-    global _token_blacklist
-    if _token_blacklist is None:
-        _token_blacklist = InMemoryTokenBlacklist()
+def get_token_blacklist() -> Union[InMemoryTokenBlacklist, RedisTokenBlacklist]:
+    """Get the active token blacklist instance."""
     return _token_blacklist
 
 
 def initialize_redis_blacklist(redis_client):
     """
     Initialize the Redis-based token blacklist.
-    Call this during application startup if using Redis.
+    Call this during application startup with a redis.asyncio client.
     """
     global _token_blacklist
     _token_blacklist = RedisTokenBlacklist(redis_client)
@@ -268,31 +358,27 @@ def hash_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
 
 
-def revoke_token(jti: str, expires_at: datetime) -> None:
+async def revoke_token(jti: str, expires_at: datetime) -> None:
     """Revoke a specific token."""
-    blacklist = get_token_blacklist()
-    blacklist.add_to_blacklist(jti, expires_at)
+    await _token_blacklist.add_to_blacklist(jti, expires_at)
 
 
-def is_token_revoked(jti: str) -> bool:
+async def is_token_revoked(jti: str) -> bool:
     """Check if a token has been revoked."""
-    blacklist = get_token_blacklist()
-    return blacklist.is_blacklisted(jti)
+    return await _token_blacklist.is_blacklisted(jti)
 
 
-def revoke_all_user_tokens(user_id: int) -> int:
+async def revoke_all_user_tokens(user_id: int) -> int:
     """
     Revoke all tokens for a user.
     Useful for security incidents or account compromise.
     """
-    blacklist = get_token_blacklist()
-    return blacklist.revoke_user_tokens(user_id)
+    return await _token_blacklist.revoke_user_tokens(user_id)
 
 
-def revoke_refresh_token_family(token_family: str) -> int:
+async def revoke_refresh_token_family(token_family: str) -> int:
     """
     Revoke all tokens in a refresh token family.
     Used when refresh token reuse is detected (potential compromise).
     """
-    blacklist = get_token_blacklist()
-    return blacklist.revoke_token_family(token_family)
+    return await _token_blacklist.revoke_token_family(token_family)
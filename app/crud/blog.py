@@ -1,6 +1,7 @@
 # app/crud/blog.py
 from sqlmodel import Session, select, func, and_, or_
-from typing import List, Optional, Dict, Any
+from sqlalchemy import tuple_
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import re
 
@@ -12,6 +13,7 @@ from app.models.blog import (
     BlogPostTag,
     BlogPostStatus,
 )
+from app.crud.utils import count_rows
 from app.models.user import User
 from app.schemas.blog import (
     BlogPostCreate,
@@ -22,15 +24,16 @@ from app.schemas.blog import (
     TagUpdate,
 )
 
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+
 
 def generate_slug(text: str, db: Session, model_class) -> str:
     """Generate a unique slug from text."""
     # Convert to lowercase and replace spaces with hyphens
     slug = text.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)  # Remove special characters
-    slug = re.sub(
-        r"[-\s]+", "-", slug
-    )  # Replace spaces/multiple hyphens with single hyphen
+    slug = _SLUG_STRIP.sub("", slug)  # Remove special characters
+    slug = _SLUG_DASH.sub("-", slug)  # Replace spaces/multiple hyphens with single hyphen
     slug = slug.strip("-")  # Remove leading/trailing hyphens
 
     # Ensure uniqueness
@@ -46,6 +49,42 @@ def generate_slug(text: str, db: Session, model_class) -> str:
     return slug
 
 
+# Keyset position in the post listing: (published_at, created_at, id)
+PostCursor = Tuple[Optional[datetime], datetime, int]
+
+
+def encode_post_cursor(post: BlogPost) -> str:
+    """Encode the listing position of a post as an opaque cursor string."""
+    published = post.published_at.isoformat() if post.published_at else ""
+    return f"{published}|{post.created_at.isoformat()}|{post.id}"
+
+
+def decode_post_cursor(cursor: str) -> PostCursor:
+    """Decode a cursor produced by encode_post_cursor. Raises ValueError if malformed."""
+    published, created, post_id = cursor.split("|")
+    return (
+        datetime.fromisoformat(published) if published else None,
+        datetime.fromisoformat(created),
+        int(post_id),
+    )
+
+
+def _after_post_cursor(cursor: PostCursor):
+    """
+    Condition selecting posts that sort after the cursor in
+    (published_at DESC NULLS LAST, created_at DESC, id DESC) order.
+    """
+    published_at, created_at, post_id = cursor
+    rest = tuple_(BlogPost.created_at, BlogPost.id) < (created_at, post_id)
+    if published_at is None:
+        return and_(BlogPost.published_at.is_(None), rest)
+    return or_(
+        BlogPost.published_at < published_at,
+        BlogPost.published_at.is_(None),
+        and_(BlogPost.published_at == published_at, rest),
+    )
+
+
 class BlogCRUD:
     # ============ Blog Post Operations ============
 
@@ -108,10 +147,15 @@ class BlogCRUD:
         author_id: Optional[int] = None,
         search: Optional[str] = None,
         include_drafts: bool = False,
-    ) -> tuple[List[BlogPost], int]:
-        """Get blog posts with filtering options. Returns (posts, total_count)."""
+        with_total: bool = True,
+        cursor: Optional[PostCursor] = None,
+    ) -> tuple[List[BlogPost], Optional[int]]:
+        """
+        Get blog posts with filtering options. Returns (posts, total_count).
+        Pass with_total=False to skip the count query; total is then None.
+        When cursor is given, keyset pagination is used and skip is ignored.
+        """
         query = select(BlogPost)
-        count_query = select(func.count(BlogPost.id))
 
         # Apply filters
         conditions = []
@@ -146,7 +190,7 @@ class BlogCRUD:
                     conditions.append(BlogPost.id.in_(post_ids))
                 else:
                     # No posts in this category
-                    return [], 0
+                    return [], 0 if with_total else None
 
         # Filter by tag slug
         if tag:
@@ -160,18 +204,25 @@ class BlogCRUD:
                     conditions.append(BlogPost.id.in_(post_ids))
                 else:
                     # No posts with this tag
-                    return [], 0
+                    return [], 0 if with_total else None
 
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
 
         # Get total count
-        total = db.exec(count_query).first() or 0
+        total = count_rows(db, BlogPost, conditions) if with_total else None
 
         # Apply pagination and ordering
-        query = query.order_by(BlogPost.published_at.desc(), BlogPost.created_at.desc())
-        query = query.offset(skip).limit(limit)
+        query = query.order_by(
+            BlogPost.published_at.desc().nulls_last(),
+            BlogPost.created_at.desc(),
+            BlogPost.id.desc(),
+        )
+        if cursor is not None:
+            query = query.where(_after_post_cursor(cursor))
+        else:
+            query = query.offset(skip)
+        query = query.limit(limit)
 
         posts = db.exec(query).all()
         return posts, total
@@ -345,13 +396,12 @@ class BlogCRUD:
         return db.exec(select(Category).where(Category.slug == slug)).first()
 
     def get_categories(
-        self, db: Session, skip: int = 0, limit: int = 50
-    ) -> tuple[List[Category], int]:
+        self, db: Session, skip: int = 0, limit: int = 50, with_total: bool = True
+    ) -> tuple[List[Category], Optional[int]]:
         """Get all categories with post counts. Returns (categories, total_count)."""
         query = select(Category).order_by(Category.name)
-        count_query = select(func.count(Category.id))
 
-        total = db.exec(count_query).first() or 0
+        total = count_rows(db, Category) if with_total else None
         categories = db.exec(query.offset(skip).limit(limit)).all()
 
         return categories, total
@@ -430,13 +480,12 @@ class BlogCRUD:
         return db.exec(select(Tag).where(Tag.slug == slug)).first()
 
     def get_tags(
-        self, db: Session, skip: int = 0, limit: int = 100
-    ) -> tuple[List[Tag], int]:
+        self, db: Session, skip: int = 0, limit: int = 100, with_total: bool = True
+    ) -> tuple[List[Tag], Optional[int]]:
         """Get all tags with post counts. Returns (tags, total_count)."""
         query = select(Tag).order_by(Tag.name)
-        count_query = select(func.count(Tag.id))
 
-        total = db.exec(count_query).first() or 0
+        total = count_rows(db, Tag) if with_total else None
         tags = db.exec(query.offset(skip).limit(limit)).all()
 
         return tags, total
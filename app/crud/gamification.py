@@ -2,8 +2,11 @@
 Gamification Module - CRUD Operations
 """
 
-from sqlmodel import Session, select, func, and_, or_, desc
-from typing import List, Optional, Dict, Any
+from sqlmodel import Session, select, func, and_, or_, desc, text
+from sqlalchemy import Date, case, cast, delete, exists, insert, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -25,6 +28,28 @@ from app.schemas.gamification import (
 )
 
 
+# Criteria keys that define an achievement's target, in priority order
+_TARGET_CRITERIA_KEYS = (
+    "hours_required",
+    "projects_required",
+    "tasks_required",
+    "skills_required",
+    "trainings_required",
+    "days_required",
+    "volunteers_required",
+)
+
+
+def _extract_target_from_criteria(criteria: Optional[Dict[str, Any]]) -> Decimal:
+    """Extract target value from achievement criteria."""
+    for key in _TARGET_CRITERIA_KEYS:
+        if criteria and key in criteria:
+            value = criteria[key]
+            # ints convert exactly; floats go through str to avoid binary noise
+            return Decimal(value) if isinstance(value, int) else Decimal(str(value))
+    return Decimal("1")  # Default target
+
+
 # ============================================================
 # BADGE CRUD
 # ============================================================
@@ -132,9 +157,9 @@ class AchievementCRUD:
     def create_achievement(self, db: Session, data: AchievementCreate) -> Achievement:
         """Create a new achievement."""
         achievement = Achievement(**data.model_dump())
+        achievement.default_target = _extract_target_from_criteria(achievement.criteria)
         db.add(achievement)
         db.commit()
-        db.refresh(achievement)
         return achievement
 
     def get_achievement(self, db: Session, achievement_id: int) -> Optional[Achievement]:
@@ -154,8 +179,13 @@ class AchievementCRUD:
         achievement_type: Optional[str] = None,
         is_active: Optional[bool] = None,
         include_secret: bool = False,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[Achievement]:
-        """Get list of achievements with filters."""
+        """
+        Get list of achievements with filters.
+        Pass before=(created_at, id) of the last row seen for keyset
+        pagination; skip is then ignored.
+        """
         query = select(Achievement)
 
         if achievement_type:
@@ -165,7 +195,12 @@ class AchievementCRUD:
         if not include_secret:
             query = query.where(Achievement.is_secret == False)
 
-        query = query.offset(skip).limit(limit).order_by(Achievement.created_at.desc())
+        if before is not None:
+            query = query.where(tuple_(Achievement.created_at, Achievement.id) < before)
+        else:
+            query = query.offset(skip)
+
+        query = query.limit(limit).order_by(Achievement.created_at.desc(), Achievement.id.desc())
         return list(db.exec(query).all())
 
     def count_achievements(
@@ -196,6 +231,9 @@ class AchievementCRUD:
         for field, value in update_dict.items():
             setattr(achievement, field, value)
 
+        if "criteria" in update_dict:
+            achievement.default_target = _extract_target_from_criteria(achievement.criteria)
+
         achievement.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(achievement)
@@ -240,15 +278,46 @@ class VolunteerBadgeCRUD:
         )
         db.add(volunteer_badge)
         db.commit()
-        db.refresh(volunteer_badge)
         return volunteer_badge
 
+    def bulk_award_badges(self, db: Session, items: List[Dict[str, Any]]) -> int:
+        """
+        Award many badges in a single INSERT and one commit.
+
+        Each item takes the keyword arguments of award_badge
+        (volunteer_id, badge_id, earned_reason, awarded_by_id).
+        Returns the number of badges awarded.
+        """
+        if not items:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "volunteer_id": item["volunteer_id"],
+                "badge_id": item["badge_id"],
+                "earned_at": now,
+                "earned_reason": item.get("earned_reason"),
+                "awarded_by_id": item.get("awarded_by_id"),
+                "is_showcased": False,
+            }
+            for item in items
+        ]
+        db.execute(insert(VolunteerBadge), rows)
+        db.commit()
+        return len(rows)
+
     def has_badge(self, db: Session, volunteer_id: int, badge_id: int) -> bool:
         """Check if volunteer already has a badge."""
-        statement = select(VolunteerBadge).where(
-            and_(VolunteerBadge.volunteer_id == volunteer_id, VolunteerBadge.badge_id == badge_id)
+        statement = select(
+            exists().where(
+                and_(
+                    VolunteerBadge.volunteer_id == volunteer_id,
+                    VolunteerBadge.badge_id == badge_id,
+                )
+            )
         )
-        return db.exec(statement).first() is not None
+        return bool(db.scalar(statement))
 
     def get_volunteer_badge(
         self, db: Session, volunteer_id: int, badge_id: int
@@ -263,7 +332,11 @@ class VolunteerBadgeCRUD:
         self, db: Session, volunteer_id: int, showcased_only: bool = False
     ) -> List[VolunteerBadge]:
         """Get all badges earned by a volunteer."""
-        query = select(VolunteerBadge).where(VolunteerBadge.volunteer_id == volunteer_id)
+        query = (
+            select(VolunteerBadge)
+            .where(VolunteerBadge.volunteer_id == volunteer_id)
+            .options(selectinload(VolunteerBadge.badge))
+        )
 
         if showcased_only:
             query = query.where(VolunteerBadge.is_showcased == True)
@@ -301,9 +374,14 @@ class VolunteerAchievementCRUD:
     """CRUD operations for volunteer achievements."""
 
     def get_or_create_progress(
-        self, db: Session, volunteer_id: int, achievement_id: int
+        self, db: Session, volunteer_id: int, achievement_id: int, commit: bool = True
     ) -> VolunteerAchievement:
-        """Get or create achievement progress for a volunteer."""
+        """
+        Get or create achievement progress for a volunteer.
+        A missing row is created with a single upsert, which returns the row
+        even if a concurrent request inserted it first.
+        Pass commit=False to leave the transaction open for the caller.
+        """
         statement = select(VolunteerAchievement).where(
             and_(
                 VolunteerAchievement.volunteer_id == volunteer_id,
@@ -311,17 +389,20 @@ class VolunteerAchievementCRUD:
             )
         )
         progress = db.exec(statement).first()
+        if progress:
+            return progress
 
-        if not progress:
-            # Get achievement to extract target from criteria
-            achievement = db.get(Achievement, achievement_id)
-            if not achievement:
-                raise ValueError(f"Achievement {achievement_id} not found")
+        achievement = db.get(Achievement, achievement_id)
+        if not achievement:
+            raise ValueError(f"Achievement {achievement_id} not found")
 
-            # Extract target from criteria
-            target = self._extract_target_from_criteria(achievement)
+        target = achievement.default_target
+        if target is None:
+            target = _extract_target_from_criteria(achievement.criteria)
 
-            progress = VolunteerAchievement(
+        upsert = (
+            pg_insert(VolunteerAchievement)
+            .values(
                 volunteer_id=volunteer_id,
                 achievement_id=achievement_id,
                 current_progress=Decimal("0"),
@@ -330,77 +411,104 @@ class VolunteerAchievementCRUD:
                 times_completed=0,
                 started_at=datetime.utcnow(),
             )
-            db.add(progress)
+            .on_conflict_do_update(
+                index_elements=["volunteer_id", "achievement_id"],
+                set_={"volunteer_id": volunteer_id},
+            )
+            .returning(VolunteerAchievement)
+        )
+        progress = db.execute(upsert).scalar_one()
+        if commit:
             db.commit()
-            db.refresh(progress)
-
         return progress
 
-    def _extract_target_from_criteria(self, achievement: Achievement) -> Decimal:
-        """Extract target value from achievement criteria."""
-        criteria = achievement.criteria
-        if "hours_required" in criteria:
-            return Decimal(str(criteria["hours_required"]))
-        elif "projects_required" in criteria:
-            return Decimal(str(criteria["projects_required"]))
-        elif "tasks_required" in criteria:
-            return Decimal(str(criteria["tasks_required"]))
-        elif "skills_required" in criteria:
-            return Decimal(str(criteria["skills_required"]))
-        elif "trainings_required" in criteria:
-            return Decimal(str(criteria["trainings_required"]))
-        elif "days_required" in criteria:
-            return Decimal(str(criteria["days_required"]))
-        elif "volunteers_required" in criteria:
-            return Decimal(str(criteria["volunteers_required"]))
-        else:
-            return Decimal("1")  # Default target
+    def _set_progress(
+        self,
+        db: Session,
+        volunteer_id: int,
+        achievement_id: int,
+        new_progress,
+        commit: bool = True,
+    ) -> VolunteerAchievement:
+        """
+        Set current_progress to new_progress (a value or SQL expression) and
+        mark completion in one UPDATE ... RETURNING, so concurrent updates
+        are serialized by the row lock instead of overwriting each other.
+        """
+        now = datetime.utcnow()
+        reaches_target = and_(
+            VolunteerAchievement.is_completed == False,
+            new_progress >= VolunteerAchievement.target_progress,
+        )
+        statement = (
+            update(VolunteerAchievement)
+            .where(
+                and_(
+                    VolunteerAchievement.volunteer_id == volunteer_id,
+                    VolunteerAchievement.achievement_id == achievement_id,
+                )
+            )
+            .values(
+                current_progress=new_progress,
+                last_progress_at=now,
+                is_completed=case((reaches_target, True), else_=VolunteerAchievement.is_completed),
+                completed_at=case((reaches_target, now), else_=VolunteerAchievement.completed_at),
+                times_completed=VolunteerAchievement.times_completed
+                + case((reaches_target, 1), else_=0),
+            )
+            .returning(VolunteerAchievement)
+            .execution_options(populate_existing=True)
+        )
+        progress = db.execute(statement).scalar_one_or_none()
+        if progress is None:
+            # No progress row yet: create it, then apply the update
+            self.get_or_create_progress(db, volunteer_id, achievement_id, commit=False)
+            progress = db.execute(statement).scalar_one()
+
+        if commit:
+            db.commit()
+        return progress
 
     def update_progress(
-        self, db: Session, volunteer_id: int, achievement_id: int, new_value: Decimal
+        self,
+        db: Session,
+        volunteer_id: int,
+        achievement_id: int,
+        new_value: Decimal,
+        commit: bool = True,
     ) -> VolunteerAchievement:
         """Update achievement progress."""
-        progress = self.get_or_create_progress(db, volunteer_id, achievement_id)
-        progress.current_progress = new_value
-        progress.last_progress_at = datetime.utcnow()
-
-        # Check if completed
-        if not progress.is_completed and progress.current_progress >= progress.target_progress:
-            progress.is_completed = True
-            progress.completed_at = datetime.utcnow()
-            progress.times_completed += 1
-
-        db.commit()
-        db.refresh(progress)
-        return progress
+        return self._set_progress(
+            db, volunteer_id, achievement_id, literal(new_value), commit=commit
+        )
 
     def increment_progress(
-        self, db: Session, volunteer_id: int, achievement_id: int, increment: Decimal
+        self,
+        db: Session,
+        volunteer_id: int,
+        achievement_id: int,
+        increment: Decimal,
+        commit: bool = True,
     ) -> VolunteerAchievement:
         """Increment achievement progress."""
-        progress = self.get_or_create_progress(db, volunteer_id, achievement_id)
-        progress.current_progress += increment
-        progress.last_progress_at = datetime.utcnow()
-
-        # Check if completed
-        if not progress.is_completed and progress.current_progress >= progress.target_progress:
-            progress.is_completed = True
-            progress.completed_at = datetime.utcnow()
-            progress.times_completed += 1
-
-        db.commit()
-        db.refresh(progress)
-        return progress
+        return self._set_progress(
+            db,
+            volunteer_id,
+            achievement_id,
+            VolunteerAchievement.current_progress + increment,
+            commit=commit,
+        )
 
     def complete_achievement(
         self, db: Session, volunteer_id: int, achievement_id: int
     ) -> VolunteerAchievement:
         """Mark achievement as completed."""
+        now = datetime.utcnow()
         progress = self.get_or_create_progress(db, volunteer_id, achievement_id)
 
         if not progress.is_completed:
             progress.is_completed = True
-            progress.completed_at = datetime.utcnow()
+            progress.completed_at = now
             progress.times_completed += 1
             progress.current_progress = progress.target_progress
         else:
@@ -408,7 +516,7 @@ class VolunteerAchievementCRUD:
             achievement = db.get(Achievement, achievement_id)
             if achievement and achievement.is_repeatable:
                 progress.times_completed += 1
-                progress.completed_at = datetime.utcnow()
+                progress.completed_at = now
 
         db.commit()
         db.refresh(progress)
@@ -418,8 +526,10 @@ class VolunteerAchievementCRUD:
         self, db: Session, volunteer_id: int, completed_only: bool = False
     ) -> List[VolunteerAchievement]:
         """Get all achievement progress for a volunteer."""
-        query = select(VolunteerAchievement).where(
-            VolunteerAchievement.volunteer_id == volunteer_id
+        query = (
+            select(VolunteerAchievement)
+            .where(VolunteerAchievement.volunteer_id == volunteer_id)
+            .options(selectinload(VolunteerAchievement.achievement))
         )
 
         if completed_only:
@@ -443,17 +553,50 @@ class VolunteerAchievementCRUD:
 # POINTS CRUD
 # ============================================================
 
+# Increment the balance and record the history entry in one statement.
+# Yields no row when the volunteer has no points record yet.
+_AWARD_POINTS_SQL = text("""
+    WITH upd AS (
+        UPDATE volunteer_points
+        SET total_points = total_points + :points_change,
+            current_points = current_points + :points_change,
+            updated_at = :now
+        WHERE volunteer_id = :volunteer_id
+        RETURNING id, current_points
+    )
+    INSERT INTO points_history (
+        volunteer_points_id, volunteer_id, points_change, event_type, description,
+        reference_id, reference_type, balance_after, awarded_by_id, created_at
+    )
+    SELECT
+        upd.id, :volunteer_id, :points_change, :event_type, :description,
+        :reference_id, :reference_type, upd.current_points, :awarded_by_id, :now
+    FROM upd
+    RETURNING *
+""")
+
+
 
 class PointsCRUD:
     """CRUD operations for volunteer points."""
 
-    def get_or_create_points(self, db: Session, volunteer_id: int) -> VolunteerPoints:
-        """Get or create points record for a volunteer."""
+    def get_or_create_points(
+        self, db: Session, volunteer_id: int, commit: bool = True
+    ) -> VolunteerPoints:
+        """
+        Get or create points record for a volunteer.
+        A missing record is created with a single upsert, which returns the
+        row even if a concurrent request inserted it first.
+        Pass commit=False to leave the transaction open for the caller.
+        """
         statement = select(VolunteerPoints).where(VolunteerPoints.volunteer_id == volunteer_id)
         points = db.exec(statement).first()
+        if points:
+            return points
 
-        if not points:
-            points = VolunteerPoints(
+        upsert = (
+            pg_insert(VolunteerPoints)
+            .values(
                 volunteer_id=volunteer_id,
                 total_points=0,
                 current_points=0,
@@ -464,10 +607,14 @@ class PointsCRUD:
                 last_activity_date=None,
                 updated_at=datetime.utcnow(),
             )
-            db.add(points)
+            .on_conflict_do_update(
+                index_elements=["volunteer_id"], set_={"volunteer_id": volunteer_id}
+            )
+            .returning(VolunteerPoints)
+        )
+        points = db.execute(upsert).scalar_one()
+        if commit:
             db.commit()
-            db.refresh(points)
-
         return points
 
     def award_points(
@@ -480,35 +627,107 @@ class PointsCRUD:
         reference_id: Optional[int] = None,
         reference_type: Optional[str] = None,
         awarded_by_id: Optional[int] = None,
+        commit: bool = True,
     ) -> PointsHistory:
-        """Award points to a volunteer and create history entry."""
-        points_record = self.get_or_create_points(db, volunteer_id)
+        """
+        Award points to a volunteer and create history entry.
+        The balance update and history insert run as one writable-CTE
+        statement, so concurrent awards compose in a single round trip.
+        Pass commit=False to leave the transaction open for the caller.
+        """
+        statement = select(PointsHistory).from_statement(
+            _AWARD_POINTS_SQL.bindparams(
+                volunteer_id=volunteer_id,
+                points_change=points_change,
+                event_type=event_type,
+                description=description,
+                reference_id=reference_id,
+                reference_type=reference_type,
+                awarded_by_id=awarded_by_id,
+                now=datetime.utcnow(),
+            )
+        )
+        history = db.scalars(statement).one_or_none()
+        if history is None:
+            # No points record yet: create it, then apply the award
+            self.get_or_create_points(db, volunteer_id, commit=False)
+            history = db.scalars(statement).one()
 
-        # Update points (cumulative - both total and current increase)
-        points_record.total_points += points_change
-        points_record.current_points += points_change
-        points_record.updated_at = datetime.utcnow()
+        if commit:
+            db.commit()
+        return history
 
-        # Create history entry
-        history = PointsHistory(
-            volunteer_points_id=points_record.id,
-            volunteer_id=volunteer_id,
-            points_change=points_change,
-            event_type=event_type,
-            description=description,
-            reference_id=reference_id,
-            reference_type=reference_type,
-            balance_after=points_record.current_points,
-            awarded_by_id=awarded_by_id,
-            created_at=datetime.utcnow(),
+    def bulk_award_points(self, db: Session, items: List[Dict[str, Any]]) -> int:
+        """
+        Award points for many events in one transaction.
+
+        Each item takes the keyword arguments of award_points. The affected
+        points rows are locked with a single SELECT ... FOR UPDATE, balances
+        are computed in Python, then history rows are inserted and balances
+        updated with one executemany each. Returns the number of history
+        entries written.
+        """
+        if not items:
+            return 0
+
+        volunteer_ids = {item["volunteer_id"] for item in items}
+        statement = (
+            select(VolunteerPoints)
+            .where(VolunteerPoints.volunteer_id.in_(volunteer_ids))
+            .with_for_update()
         )
+        records = {p.volunteer_id: p for p in db.exec(statement).all()}
+
+        now = datetime.utcnow()
+        missing = volunteer_ids - records.keys()
+        if missing:
+            new_records = [
+                VolunteerPoints(volunteer_id=volunteer_id, updated_at=now)
+                for volunteer_id in missing
+            ]
+            db.add_all(new_records)
+            db.flush()
+            records.update((p.volunteer_id, p) for p in new_records)
+
+        balances = {
+            volunteer_id: [record.total_points, record.current_points]
+            for volunteer_id, record in records.items()
+        }
+        history_rows = []
+        for item in items:
+            balance = balances[item["volunteer_id"]]
+            balance[0] += item["points_change"]
+            balance[1] += item["points_change"]
+            history_rows.append(
+                {
+                    "volunteer_points_id": records[item["volunteer_id"]].id,
+                    "volunteer_id": item["volunteer_id"],
+                    "points_change": item["points_change"],
+                    "event_type": item["event_type"],
+                    "description": item["description"],
+                    "reference_id": item.get("reference_id"),
+                    "reference_type": item.get("reference_type"),
+                    "balance_after": balance[1],
+                    "awarded_by_id": item.get("awarded_by_id"),
+                    "created_at": now,
+                }
+            )
 
-        db.add(history)
+        db.execute(insert(PointsHistory), history_rows)
+        db.execute(
+            update(VolunteerPoints),
+            [
+                {
+                    "id": records[volunteer_id].id,
+                    "total_points": total,
+                    "current_points": current,
+                    "updated_at": now,
+                }
+                for volunteer_id, (total, current) in balances.items()
+            ],
+        )
         db.commit()
-        db.refresh(points_record)
-        db.refresh(history)
-
-        return history
+        return len(history_rows)
 
     def get_points(self, db: Session, volunteer_id: int) -> Optional[VolunteerPoints]:
         """Get points record for a volunteer."""
@@ -516,80 +735,111 @@ class PointsCRUD:
         return db.exec(statement).first()
 
     def get_points_history(
-        self, db: Session, volunteer_id: int, skip: int = 0, limit: int = 50
+        self,
+        db: Session,
+        volunteer_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[PointsHistory]:
-        """Get points history for a volunteer."""
-        query = (
-            select(PointsHistory)
-            .where(PointsHistory.volunteer_id == volunteer_id)
-            .order_by(PointsHistory.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        """
+        Get points history for a volunteer.
+        Pass before=(created_at, id) of the last entry seen for keyset
+        pagination; skip is then ignored.
+        """
+        query = select(PointsHistory).where(PointsHistory.volunteer_id == volunteer_id)
+
+        if before is not None:
+            query = query.where(tuple_(PointsHistory.created_at, PointsHistory.id) < before)
+        else:
+            query = query.offset(skip)
+
+        query = query.order_by(PointsHistory.created_at.desc(), PointsHistory.id.desc()).limit(
+            limit
         )
         return list(db.exec(query).all())
 
+    def count_points_history(self, db: Session, volunteer_id: int) -> int:
+        """Count points history entries for a volunteer."""
+        query = select(func.count(PointsHistory.id)).where(
+            PointsHistory.volunteer_id == volunteer_id
+        )
+        return db.exec(query).one()
+
     def update_streak(
-        self, db: Session, volunteer_id: int, activity_date: Optional[datetime] = None
+        self,
+        db: Session,
+        volunteer_id: int,
+        activity_date: Optional[datetime] = None,
+        commit: bool = True,
     ) -> VolunteerPoints:
-        """Update activity streak for a volunteer."""
+        """
+        Update activity streak for a volunteer.
+        Pass commit=False to leave the transaction open for the caller.
+        """
+        now = datetime.utcnow()
         if activity_date is None:
-            activity_date = datetime.utcnow()
-
-        points_record = self.get_or_create_points(db, volunteer_id)
-        today = activity_date.date()
-
-        if points_record.last_activity_date:
-            last_date = points_record.last_activity_date.date()
-            days_diff = (today - last_date).days
-
-            if days_diff == 0:
-                # Same day, no change
-                pass
-            elif days_diff == 1:
-                # Consecutive day, increment streak
-                points_record.current_streak_days += 1
-                if points_record.current_streak_days > points_record.longest_streak_days:
-                    points_record.longest_streak_days = points_record.current_streak_days
-            else:
-                # Streak broken, reset
-                points_record.current_streak_days = 1
-        else:
-            # First activity
-            points_record.current_streak_days = 1
-            points_record.longest_streak_days = 1
-
-        points_record.last_activity_date = activity_date
-        points_record.updated_at = datetime.utcnow()
+            activity_date = now
 
-        db.commit()
-        db.refresh(points_record)
-        return points_record
-
-    def update_rankings(self, db: Session) -> int:
-        """Update rankings for all volunteers. Returns count of updated records."""
-        # Get all volunteers ordered by total points
+        # Whole days since the last activity, computed in SQL so concurrent
+        # activity posts see each other's writes
+        days_diff = literal(activity_date.date(), Date) - cast(
+            VolunteerPoints.last_activity_date, Date
+        )
+        new_streak = case(
+            # First activity
+            (VolunteerPoints.last_activity_date.is_(None), 1),
+            # Same day, no change
+            (days_diff == 0, VolunteerPoints.current_streak_days),
+            # Consecutive day, increment streak
+            (days_diff == 1, VolunteerPoints.current_streak_days + 1),
+            # Streak broken, reset
+            else_=1,
+        )
         statement = (
-            select(VolunteerPoints)
-            .order_by(desc(VolunteerPoints.total_points), VolunteerPoints.volunteer_id)
+            update(VolunteerPoints)
+            .where(VolunteerPoints.volunteer_id == volunteer_id)
+            .values(
+                current_streak_days=new_streak,
+                longest_streak_days=func.greatest(VolunteerPoints.longest_streak_days, new_streak),
+                last_activity_date=activity_date,
+                updated_at=now,
+            )
+            .returning(VolunteerPoints)
+            .execution_options(populate_existing=True)
         )
-        all_points = list(db.exec(statement).all())
+        points_record = db.execute(statement).scalar_one_or_none()
+        if points_record is None:
+            self.get_or_create_points(db, volunteer_id, commit=False)
+            points_record = db.execute(statement).scalar_one()
 
-        total_volunteers = len(all_points)
-        if total_volunteers == 0:
-            return 0
+        if commit:
+            db.commit()
+        return points_record
 
-        # Update ranks and percentiles
-        for rank, points_record in enumerate(all_points, start=1):
-            points_record.rank = rank
-            # Percentile: (number of people below / total) * 100
-            people_below = total_volunteers - rank
-            points_record.rank_percentile = Decimal(
-                str(round((people_below / total_volunteers) * 100, 2))
+    def update_rankings(self, db: Session) -> int:
+        """
+        Update rankings for all volunteers. Returns count of updated records.
+        Ranks and percentiles are computed by the database in one statement.
+        """
+        statement = text("""
+            WITH ranked AS (
+                SELECT
+                    id,
+                    ROW_NUMBER() OVER (ORDER BY total_points DESC, volunteer_id) AS rnk,
+                    COUNT(*) OVER () AS total
+                FROM volunteer_points
             )
-            points_record.updated_at = datetime.utcnow()
-
+            UPDATE volunteer_points vp
+            SET rank = ranked.rnk,
+                rank_percentile = ROUND((ranked.total - ranked.rnk)::numeric / ranked.total * 100, 2),
+                updated_at = :now
+            FROM ranked
+            WHERE vp.id = ranked.id
+        """)
+        result = db.execute(statement, {"now": datetime.utcnow()})
         db.commit()
-        return total_volunteers
+        return result.rowcount
 
     def get_top_volunteers(
         self, db: Session, limit: int = 100, min_points: int = 0
@@ -626,16 +876,18 @@ class LeaderboardCRUD:
     ) -> Leaderboard:
         """Create a new leaderboard snapshot."""
         # Mark existing leaderboards of same type/timeframe as not current
-        statement = select(Leaderboard).where(
-            and_(
-                Leaderboard.leaderboard_type == leaderboard_type,
-                Leaderboard.timeframe == timeframe,
-                Leaderboard.is_current == True,
+        statement = (
+            update(Leaderboard)
+            .where(
+                and_(
+                    Leaderboard.leaderboard_type == leaderboard_type,
+                    Leaderboard.timeframe == timeframe,
+                    Leaderboard.is_current == True,
+                )
             )
+            .values(is_current=False)
         )
-        existing = db.exec(statement).all()
-        for lb in existing:
-            lb.is_current = False
+        db.execute(statement)
 
         # Create new leaderboard
         leaderboard = Leaderboard(
@@ -653,7 +905,6 @@ class LeaderboardCRUD:
 
         db.add(leaderboard)
         db.commit()
-        db.refresh(leaderboard)
         return leaderboard
 
     def get_current_leaderboard(
@@ -695,21 +946,34 @@ class LeaderboardCRUD:
         query = query.offset(skip).limit(limit).order_by(Leaderboard.generated_at.desc())
         return list(db.exec(query).all())
 
+    def count_leaderboards(
+        self,
+        db: Session,
+        leaderboard_type: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        current_only: bool = True,
+    ) -> int:
+        """Count leaderboards with filters."""
+        query = select(func.count(Leaderboard.id))
+
+        if leaderboard_type:
+            query = query.where(Leaderboard.leaderboard_type == leaderboard_type)
+        if timeframe:
+            query = query.where(Leaderboard.timeframe == timeframe)
+        if current_only:
+            query = query.where(Leaderboard.is_current == True)
+
+        return db.exec(query).one()
+
     def delete_old_leaderboards(self, db: Session, days_to_keep: int = 30) -> int:
         """Delete leaderboards older than specified days (keep current ones)."""
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-        statement = select(Leaderboard).where(
+        statement = delete(Leaderboard).where(
             and_(Leaderboard.generated_at < cutoff_date, Leaderboard.is_current == False)
         )
-        old_leaderboards = db.exec(statement).all()
-
-        count = 0
-        for lb in old_leaderboards:
-            db.delete(lb)
-            count += 1
-
+        result = db.execute(statement)
         db.commit()
-        return count
+        return result.rowcount
 
 
 # ============================================================
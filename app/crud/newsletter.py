@@ -1,10 +1,17 @@
 # app/crud/newsletter.py
-from sqlmodel import Session, select, func, and_, or_
-from typing import List, Optional
-from datetime import datetime
+from sqlalchemy import delete, exists, insert, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload
+from sqlmodel import select, func, and_, or_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import base64
+import os
 import re
 import secrets
 
+from app.core.cache import get_cache, get_or_set
 from app.models.newsletter import (
     ContactSubmission, Subscriber, NewsletterTag, SubscriberTag,
     EmailTemplate, Campaign, CampaignRecipient, CampaignLinkClick,
@@ -17,39 +24,214 @@ from app.schemas.newsletter import (
     CampaignCreate, CampaignUpdate
 )
 
+# Counters that update_campaign_stats may increment
+CAMPAIGN_STAT_FIELDS = frozenset({
+    'total_sent', 'total_delivered', 'total_opened', 'total_clicked',
+    'total_bounced', 'total_unsubscribed'
+})
 
-def generate_slug(text: str, db: Session, model_class) -> str:
+# Rows per INSERT when bulk-creating campaign recipients, keeping each
+# statement well under the driver's bind-parameter limit
+RECIPIENT_INSERT_BATCH_SIZE = 10_000
+
+# Slug -> id lookups for tags and templates; slugs rarely change, and
+# update/delete invalidate the entry
+SLUG_CACHE_TTL = 60  # seconds
+
+# A recipient claimed (status 'sending') for longer than this is assumed
+# abandoned by a crashed worker and goes back to 'pending'; well above the
+# time one batch takes to send
+RECIPIENT_CLAIM_TIMEOUT = timedelta(minutes=15)
+
+
+def tag_slug_cache_key(slug: str) -> str:
+    return f"newsletter:tag-slug:{slug}"
+
+
+def template_slug_cache_key(slug: str) -> str:
+    return f"newsletter:template-slug:{slug}"
+
+
+# Keyset position in the subscriber listing: (created_at, id)
+SubscriberCursor = Tuple[datetime, int]
+
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+
+def slugify(text: str) -> str:
+    """Normalize text to a slug (no uniqueness check)."""
+    slug = _SLUG_STRIP.sub('', text.lower().strip())
+    return _SLUG_DASH.sub('-', slug).strip('-')
+
+
+async def generate_slug(text: str, db: AsyncSession, model_class) -> str:
     """Generate a unique slug from text."""
-    slug = text.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    slug = slug.strip('-')
+    slug = slugify(text)
+
+    # Fetch every taken "<slug>" / "<slug>-N" in one query, then pick the
+    # first free suffix in memory.
+    suffixed = re.compile(rf'{re.escape(slug)}-\d+')
+    existing_slugs = (await db.exec(
+        select(model_class.slug).where(
+            or_(
+                model_class.slug == slug,
+                model_class.slug.startswith(f"{slug}-", autoescape=True)
+            )
+        )
+    )).all()
+    taken = {
+        existing for existing in existing_slugs
+        if existing == slug or suffixed.fullmatch(existing)
+    }
 
     original_slug = slug
     counter = 1
-    while True:
-        existing = db.exec(select(model_class).where(model_class.slug == slug)).first()
-        if not existing:
-            break
+    while slug in taken:
         slug = f"{original_slug}-{counter}"
         counter += 1
 
     return slug
 
 
+async def _insert_with_unique_slug(db: AsyncSession, model_class, obj):
+    """
+    Insert obj, relying on the UNIQUE slug index instead of a pre-check.
+    The first attempt uses obj.slug as is; on conflict the first free
+    "-N" suffix is looked up and tried, looping only if a concurrent
+    insert takes it first. Returns the inserted row.
+    """
+    values = obj.model_dump(exclude={'id', 'slug'})
+    slug = obj.slug
+    while True:
+        inserted = (await db.execute(
+            pg_insert(model_class)
+            .values(**values, slug=slug)
+            .on_conflict_do_nothing(index_elements=["slug"])
+            .returning(model_class)
+        )).scalar_one_or_none()
+        if inserted is not None:
+            return inserted
+        slug = await generate_slug(slug, db, model_class)
+
+
 def generate_token(length: int = 32) -> str:
     """Generate a secure random token."""
     return secrets.token_urlsafe(length)
 
 
+def generate_tokens(count: int, length: int = 32) -> List[str]:
+    """
+    Generate count secure random tokens from a single urandom read.
+    Same format as generate_token (urlsafe base64 of length random bytes).
+    """
+    raw = os.urandom(count * length)
+    return [
+        base64.urlsafe_b64encode(raw[i:i + length]).rstrip(b'=').decode('ascii')
+        for i in range(0, count * length, length)
+    ]
+
+
+async def _insert_subscriber_tags(db: AsyncSession, subscriber_id: int, tag_ids: List[int]) -> None:
+    """
+    Attach tags to a subscriber with one multi-row INSERT.
+    Tags the subscriber already has are skipped by ON CONFLICT DO NOTHING.
+    """
+    if not tag_ids:
+        return
+    now = datetime.utcnow()
+    await db.execute(
+        pg_insert(SubscriberTag).on_conflict_do_nothing(
+            index_elements=["subscriber_id", "tag_id"]
+        ),
+        [
+            {"subscriber_id": subscriber_id, "tag_id": tag_id, "added_at": now}
+            for tag_id in dict.fromkeys(tag_ids)
+        ]
+    )
+
+
+def encode_subscriber_cursor(subscriber) -> str:
+    """Encode the listing position of a subscriber as an opaque cursor string."""
+    return f"{subscriber.created_at.isoformat()}|{subscriber.id}"
+
+
+def decode_subscriber_cursor(cursor: str) -> SubscriberCursor:
+    """Decode a cursor produced by encode_subscriber_cursor. Raises ValueError if malformed."""
+    created, subscriber_id = cursor.split("|")
+    return datetime.fromisoformat(created), int(subscriber_id)
+
+
+async def _count(db: AsyncSession, model_class, conditions: list) -> int:
+    """Exact count of rows matching conditions."""
+    count_query = select(func.count()).select_from(model_class)
+    if conditions:
+        count_query = count_query.where(and_(*conditions))
+    return (await db.exec(count_query)).first() or 0
+
+
+async def _paginate(
+    db: AsyncSession,
+    model_class,
+    conditions: list,
+    order_by: list,
+    skip: int,
+    limit: int,
+    options: Optional[list] = None,
+    columns: Optional[list] = None,
+    after=None
+) -> tuple[list, int]:
+    """
+    Fetch one page of rows plus the total matching count in a single query,
+    using COUNT(*) OVER () alongside the page.
+
+    With columns, only those columns are selected and the page is returned
+    as rows with attribute access, instead of model instances.
+
+    With after (a keyset condition), the page starts right after the
+    previous one and skip is ignored; the window count would only see the
+    rows past the cursor, so the total is counted separately.
+    """
+    if after is not None:
+        query = select(*(columns or [model_class]))
+        if options:
+            query = query.options(*options)
+        query = query.where(and_(*conditions, after)).order_by(*order_by).limit(limit)
+        items = list((await db.exec(query)).all())
+        return items, await _count(db, model_class, conditions)
+
+    query = select(*(columns or [model_class]), func.count().over().label("total"))
+    if options:
+        query = query.options(*options)
+    if conditions:
+        query = query.where(and_(*conditions))
+    query = query.order_by(*order_by).offset(skip).limit(limit)
+
+    rows = (await db.exec(query)).all()
+    if rows:
+        items = list(rows) if columns else [row[0] for row in rows]
+        return items, rows[0].total
+
+    # Page past the end: the window count is unavailable without rows
+    if skip == 0:
+        return [], 0
+    return [], await _count(db, model_class, conditions)
+
+
 class NewsletterCRUD:
+    """
+    Newsletter data access. Methods flush but never commit: the request's
+    get_async_db session commits once at the end (unit of work), and
+    background jobs commit explicitly.
+    """
+
     # ============================================================
     # Contact Submission Operations
     # ============================================================
 
-    def create_contact_submission(
+    async def create_contact_submission(
         self,
-        db: Session,
+        db: AsyncSession,
         data: ContactFormCreate,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
@@ -63,142 +245,157 @@ class NewsletterCRUD:
             user_agent=user_agent
         )
         db.add(submission)
-        db.commit()
-        db.refresh(submission)
+        await db.flush()
         return submission
 
-    def get_contact_submission(self, db: Session, submission_id: int) -> Optional[ContactSubmission]:
+    async def get_contact_submission(self, db: AsyncSession, submission_id: int) -> Optional[ContactSubmission]:
         """Get contact submission by ID."""
-        return db.get(ContactSubmission, submission_id)
+        return await db.get(ContactSubmission, submission_id)
 
-    def get_contact_submissions(
+    async def get_contact_submissions(
         self,
-        db: Session,
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 50,
         unread_only: bool = False
-    ) -> tuple[List[ContactSubmission], int]:
-        """Get contact submissions with optional filtering."""
-        query = select(ContactSubmission)
-        count_query = select(func.count(ContactSubmission.id))
+    ) -> tuple[list, int]:
+        """
+        Get contact submissions with optional filtering.
+        Returns rows with the list-view columns (no user_agent).
+        """
+        conditions = []
 
         if unread_only:
-            query = query.where(ContactSubmission.is_read == False)
-            count_query = count_query.where(ContactSubmission.is_read == False)
-
-        total = db.exec(count_query).first() or 0
-        query = query.order_by(ContactSubmission.created_at.desc())
-        query = query.offset(skip).limit(limit)
-
-        submissions = db.exec(query).all()
-        return list(submissions), total
+            conditions.append(ContactSubmission.is_read == False)
+
+        return await _paginate(
+            db, ContactSubmission, conditions,
+            [ContactSubmission.created_at.desc()], skip, limit,
+            columns=[
+                ContactSubmission.id, ContactSubmission.name, ContactSubmission.email,
+                ContactSubmission.message, ContactSubmission.ip_address,
+                ContactSubmission.is_read, ContactSubmission.read_at,
+                ContactSubmission.created_at
+            ]
+        )
 
-    def mark_submission_read(self, db: Session, submission_id: int) -> Optional[ContactSubmission]:
+    async def mark_submission_read(self, db: AsyncSession, submission_id: int) -> Optional[ContactSubmission]:
         """Mark a contact submission as read."""
-        submission = db.get(ContactSubmission, submission_id)
+        submission = await db.get(ContactSubmission, submission_id)
         if not submission:
             return None
 
         submission.is_read = True
         submission.read_at = datetime.utcnow()
-        db.commit()
-        db.refresh(submission)
+        await db.flush()
         return submission
 
-    def delete_contact_submission(self, db: Session, submission_id: int) -> bool:
+    async def delete_contact_submission(self, db: AsyncSession, submission_id: int) -> bool:
         """Delete a contact submission."""
-        submission = db.get(ContactSubmission, submission_id)
+        submission = await db.get(ContactSubmission, submission_id)
         if not submission:
             return False
 
-        db.delete(submission)
-        db.commit()
+        await db.delete(submission)
+        await db.flush()
         return True
 
     # ============================================================
     # Newsletter Tag Operations
     # ============================================================
 
-    def create_tag(self, db: Session, data: NewsletterTagCreate) -> NewsletterTag:
+    async def create_tag(self, db: AsyncSession, data: NewsletterTagCreate) -> NewsletterTag:
         """Create a new newsletter tag."""
-        slug = generate_slug(data.name, db, NewsletterTag)
-
         tag = NewsletterTag(
             **data.model_dump(),
-            slug=slug
+            slug=slugify(data.name)
         )
-        db.add(tag)
-        db.commit()
-        db.refresh(tag)
-        return tag
+        return await _insert_with_unique_slug(db, NewsletterTag, tag)
 
-    def get_tag(self, db: Session, tag_id: int) -> Optional[NewsletterTag]:
+    async def get_tag(self, db: AsyncSession, tag_id: int) -> Optional[NewsletterTag]:
         """Get tag by ID."""
-        return db.get(NewsletterTag, tag_id)
+        return await db.get(NewsletterTag, tag_id)
+
+    async def get_tag_by_slug(self, db: AsyncSession, slug: str) -> Optional[NewsletterTag]:
+        """Get tag by slug, resolving the slug to an id through the cache."""
+        async def load() -> Optional[str]:
+            tag_id = (await db.exec(
+                select(NewsletterTag.id).where(NewsletterTag.slug == slug)
+            )).first()
+            return str(tag_id) if tag_id is not None else None
 
-    def get_tag_by_slug(self, db: Session, slug: str) -> Optional[NewsletterTag]:
-        """Get tag by slug."""
-        return db.exec(select(NewsletterTag).where(NewsletterTag.slug == slug)).first()
+        cached = await get_or_set(tag_slug_cache_key(slug), SLUG_CACHE_TTL, load)
+        return await db.get(NewsletterTag, int(cached)) if cached else None
 
-    def get_tags(self, db: Session) -> tuple[List[NewsletterTag], int]:
+    async def get_tags(self, db: AsyncSession) -> tuple[List[NewsletterTag], int]:
         """Get all tags with subscriber counts."""
         query = select(NewsletterTag).order_by(NewsletterTag.name)
-        count_query = select(func.count(NewsletterTag.id))
 
-        total = db.exec(count_query).first() or 0
-        tags = db.exec(query).all()
-        return list(tags), total
+        # Unpaginated, so the total is simply the number of rows
+        tags = list((await db.exec(query)).all())
+        return tags, len(tags)
 
-    def update_tag(
+    async def update_tag(
         self,
-        db: Session,
+        db: AsyncSession,
         tag_id: int,
         data: NewsletterTagUpdate
     ) -> Optional[NewsletterTag]:
         """Update a tag."""
-        tag = db.get(NewsletterTag, tag_id)
+        tag = await db.get(NewsletterTag, tag_id)
         if not tag:
             return None
 
         update_data = data.model_dump(exclude_unset=True)
 
         if 'name' in update_data and update_data['name'] != tag.name:
-            update_data['slug'] = generate_slug(update_data['name'], db, NewsletterTag)
+            await get_cache().delete(tag_slug_cache_key(tag.slug))
+            update_data['slug'] = await generate_slug(update_data['name'], db, NewsletterTag)
 
         for field, value in update_data.items():
             setattr(tag, field, value)
 
-        db.commit()
-        db.refresh(tag)
+        await db.flush()
         return tag
 
-    def delete_tag(self, db: Session, tag_id: int) -> bool:
+    async def delete_tag(self, db: AsyncSession, tag_id: int) -> bool:
         """Delete a tag and its associations."""
-        tag = db.get(NewsletterTag, tag_id)
+        tag = await db.get(NewsletterTag, tag_id)
         if not tag:
             return False
 
         # Remove subscriber associations
-        for st in db.exec(select(SubscriberTag).where(SubscriberTag.tag_id == tag_id)).all():
-            db.delete(st)
+        await db.execute(delete(SubscriberTag).where(SubscriberTag.tag_id == tag_id))
 
-        db.delete(tag)
-        db.commit()
+        await get_cache().delete(tag_slug_cache_key(tag.slug))
+        await db.delete(tag)
+        await db.flush()
         return True
 
-    def get_tag_subscriber_count(self, db: Session, tag_id: int) -> int:
+    async def get_tag_subscriber_count(self, db: AsyncSession, tag_id: int) -> int:
         """Get number of subscribers with this tag."""
-        return db.exec(
-            select(func.count(SubscriberTag.id)).where(SubscriberTag.tag_id == tag_id)
-        ).first() or 0
+        return (await db.exec(
+            select(func.count()).select_from(SubscriberTag).where(SubscriberTag.tag_id == tag_id)
+        )).first() or 0
+
+    async def get_tag_subscriber_counts(self, db: AsyncSession, tag_ids: List[int]) -> Dict[int, int]:
+        """Get subscriber counts for several tags in one grouped query."""
+        if not tag_ids:
+            return {}
+        rows = (await db.exec(
+            select(SubscriberTag.tag_id, func.count())
+            .where(SubscriberTag.tag_id.in_(tag_ids))
+            .group_by(SubscriberTag.tag_id)
+        )).all()
+        return dict(rows)
 
     # ============================================================
     # Subscriber Operations
     # ============================================================
 
-    def create_subscriber(
+    async def create_subscriber(
         self,
-        db: Session,
+        db: AsyncSession,
         email: str,
         name: Optional[str] = None,
         status: SubscriptionStatus = SubscriptionStatus.pending,
@@ -206,13 +403,16 @@ class NewsletterCRUD:
         user_id: Optional[int] = None,
         tag_ids: List[int] = []
     ) -> Subscriber:
-        """Create a new subscriber."""
+        """
+        Create a new subscriber and attach tags.
+        Upserts on email, so a concurrent duplicate signup returns the
+        existing row (name filled in if it was missing) instead of failing.
+        """
         confirmation_token = generate_token() if status == SubscriptionStatus.pending else None
         confirmation_expires = datetime.utcnow() if status == SubscriptionStatus.pending else None
 
         # Add 24 hours for confirmation expiry
         if confirmation_expires:
-            from datetime import timedelta
             confirmation_expires = datetime.utcnow() + timedelta(hours=24)
 
         subscriber = Subscriber(
@@ -226,57 +426,63 @@ class NewsletterCRUD:
             ip_address=ip_address,
             confirmed_at=datetime.utcnow() if status == SubscriptionStatus.active else None
         )
-        db.add(subscriber)
-        db.commit()
-        db.refresh(subscriber)
-
-        # Add tags
-        for tag_id in tag_ids:
-            subscriber_tag = SubscriberTag(
-                subscriber_id=subscriber.id,
-                tag_id=tag_id
+        upsert = (
+            pg_insert(Subscriber)
+            .values(**subscriber.model_dump(exclude={'id'}))
+            .on_conflict_do_update(
+                index_elements=["email"],
+                set_={
+                    "name": func.coalesce(Subscriber.name, name),
+                    "updated_at": subscriber.updated_at
+                }
             )
-            db.add(subscriber_tag)
+            .returning(Subscriber)
+            .execution_options(populate_existing=True)
+        )
+        subscriber = (await db.execute(upsert)).scalar_one()
 
-        if tag_ids:
-            db.commit()
-            db.refresh(subscriber)
+        # Add tags
+        await _insert_subscriber_tags(db, subscriber.id, tag_ids)
 
+        await db.flush()
         return subscriber
 
-    def get_subscriber(self, db: Session, subscriber_id: int) -> Optional[Subscriber]:
+    async def get_subscriber(self, db: AsyncSession, subscriber_id: int) -> Optional[Subscriber]:
         """Get subscriber by ID."""
-        return db.get(Subscriber, subscriber_id)
+        return await db.get(Subscriber, subscriber_id)
 
-    def get_subscriber_by_email(self, db: Session, email: str) -> Optional[Subscriber]:
+    async def get_subscriber_by_email(self, db: AsyncSession, email: str) -> Optional[Subscriber]:
         """Get subscriber by email."""
-        return db.exec(select(Subscriber).where(Subscriber.email == email)).first()
+        return (await db.exec(select(Subscriber).where(Subscriber.email == email))).first()
 
-    def get_subscriber_by_confirmation_token(self, db: Session, token: str) -> Optional[Subscriber]:
+    async def get_subscriber_by_confirmation_token(self, db: AsyncSession, token: str) -> Optional[Subscriber]:
         """Get subscriber by confirmation token."""
-        return db.exec(
+        return (await db.exec(
             select(Subscriber).where(Subscriber.confirmation_token == token)
-        ).first()
+        )).first()
 
-    def get_subscriber_by_unsubscribe_token(self, db: Session, token: str) -> Optional[Subscriber]:
+    async def get_subscriber_by_unsubscribe_token(self, db: AsyncSession, token: str) -> Optional[Subscriber]:
         """Get subscriber by unsubscribe token."""
-        return db.exec(
+        return (await db.exec(
             select(Subscriber).where(Subscriber.unsubscribe_token == token)
-        ).first()
+        )).first()
 
-    def get_subscribers(
+    async def get_subscribers(
         self,
-        db: Session,
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 50,
         status: Optional[SubscriptionStatus] = None,
         tag_id: Optional[int] = None,
-        search: Optional[str] = None
-    ) -> tuple[List[Subscriber], int]:
-        """Get subscribers with filtering."""
-        query = select(Subscriber)
-        count_query = select(func.count(Subscriber.id))
-
+        search: Optional[str] = None,
+        cursor: Optional[SubscriberCursor] = None
+    ) -> tuple[list, int]:
+        """
+        Get subscribers with filtering, newest first.
+        Returns rows with the list-view columns plus tag_count.
+        With cursor, returns the page after that (created_at, id) position
+        and ignores skip.
+        """
         conditions = []
 
         if status:
@@ -292,52 +498,88 @@ class NewsletterCRUD:
             )
 
         if tag_id:
-            subscriber_ids = db.exec(
-                select(SubscriberTag.subscriber_id).where(SubscriberTag.tag_id == tag_id)
-            ).all()
-            if subscriber_ids:
-                conditions.append(Subscriber.id.in_(subscriber_ids))
-            else:
-                return [], 0
-
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-
-        total = db.exec(count_query).first() or 0
-        query = query.order_by(Subscriber.created_at.desc())
-        query = query.offset(skip).limit(limit)
-
-        subscribers = db.exec(query).all()
-        return list(subscribers), total
-
-    def get_active_subscribers(
+            conditions.append(
+                exists().where(
+                    SubscriberTag.subscriber_id == Subscriber.id,
+                    SubscriberTag.tag_id == tag_id
+                )
+            )
+
+        tag_count = (
+            select(func.count())
+            .select_from(SubscriberTag)
+            .where(SubscriberTag.subscriber_id == Subscriber.id)
+            .correlate(Subscriber)
+            .scalar_subquery()
+            .label("tag_count")
+        )
+        after = None
+        if cursor:
+            after = tuple_(Subscriber.created_at, Subscriber.id) < cursor
+
+        return await _paginate(
+            db, Subscriber, conditions,
+            [Subscriber.created_at.desc(), Subscriber.id.desc()], skip, limit,
+            columns=[
+                Subscriber.id, Subscriber.email, Subscriber.name, Subscriber.status,
+                Subscriber.subscribed_at, Subscriber.created_at, tag_count
+            ],
+            after=after
+        )
+
+    async def get_active_subscribers(
         self,
-        db: Session,
+        db: AsyncSession,
         tag_ids: Optional[List[int]] = None
     ) -> List[Subscriber]:
         """Get all active subscribers, optionally filtered by tags."""
         query = select(Subscriber).where(Subscriber.status == SubscriptionStatus.active)
 
         if tag_ids:
-            subscriber_ids = db.exec(
-                select(SubscriberTag.subscriber_id).where(SubscriberTag.tag_id.in_(tag_ids))
-            ).all()
-            if subscriber_ids:
-                query = query.where(Subscriber.id.in_(subscriber_ids))
-            else:
-                return []
+            query = query.where(
+                exists().where(
+                    SubscriberTag.subscriber_id == Subscriber.id,
+                    SubscriberTag.tag_id.in_(tag_ids)
+                )
+            )
 
-        return list(db.exec(query).all())
+        return list((await db.exec(query)).all())
 
-    def update_subscriber(
+    async def get_active_subscriber_ids(
         self,
-        db: Session,
+        db: AsyncSession,
+        tag_ids: Optional[List[int]] = None,
+        after_id: int = 0,
+        limit: int = RECIPIENT_INSERT_BATCH_SIZE
+    ) -> List[int]:
+        """
+        Get the next chunk of active subscriber ids (optionally filtered by
+        tags), keyset-paginated on id: pass the last id seen as after_id.
+        """
+        query = select(Subscriber.id).where(
+            Subscriber.status == SubscriptionStatus.active,
+            Subscriber.id > after_id
+        )
+
+        if tag_ids:
+            query = query.where(
+                exists().where(
+                    SubscriberTag.subscriber_id == Subscriber.id,
+                    SubscriberTag.tag_id.in_(tag_ids)
+                )
+            )
+
+        query = query.order_by(Subscriber.id).limit(limit)
+        return list((await db.exec(query)).all())
+
+    async def update_subscriber(
+        self,
+        db: AsyncSession,
         subscriber_id: int,
         data: SubscriberUpdate
     ) -> Optional[Subscriber]:
         """Update subscriber."""
-        subscriber = db.get(Subscriber, subscriber_id)
+        subscriber = await db.get(Subscriber, subscriber_id)
         if not subscriber:
             return None
 
@@ -351,24 +593,19 @@ class NewsletterCRUD:
         # Update tags if provided
         if data.tag_ids is not None:
             # Remove existing tags
-            for st in db.exec(select(SubscriberTag).where(SubscriberTag.subscriber_id == subscriber_id)).all():
-                db.delete(st)
+            await db.execute(
+                delete(SubscriberTag).where(SubscriberTag.subscriber_id == subscriber_id)
+            )
 
             # Add new tags
-            for tag_id in data.tag_ids:
-                subscriber_tag = SubscriberTag(
-                    subscriber_id=subscriber_id,
-                    tag_id=tag_id
-                )
-                db.add(subscriber_tag)
+            await _insert_subscriber_tags(db, subscriber_id, data.tag_ids)
 
-        db.commit()
-        db.refresh(subscriber)
+        await db.flush()
         return subscriber
 
-    def confirm_subscriber(self, db: Session, subscriber_id: int) -> Optional[Subscriber]:
+    async def confirm_subscriber(self, db: AsyncSession, subscriber_id: int) -> Optional[Subscriber]:
         """Confirm subscriber's email."""
-        subscriber = db.get(Subscriber, subscriber_id)
+        subscriber = await db.get(Subscriber, subscriber_id)
         if not subscriber:
             return None
 
@@ -378,13 +615,12 @@ class NewsletterCRUD:
         subscriber.confirmation_expires = None
         subscriber.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(subscriber)
+        await db.flush()
         return subscriber
 
-    def unsubscribe(self, db: Session, subscriber_id: int) -> Optional[Subscriber]:
+    async def unsubscribe(self, db: AsyncSession, subscriber_id: int) -> Optional[Subscriber]:
         """Unsubscribe a subscriber."""
-        subscriber = db.get(Subscriber, subscriber_id)
+        subscriber = await db.get(Subscriber, subscriber_id)
         if not subscriber:
             return None
 
@@ -392,177 +628,163 @@ class NewsletterCRUD:
         subscriber.unsubscribed_at = datetime.utcnow()
         subscriber.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(subscriber)
+        await db.flush()
         return subscriber
 
-    def delete_subscriber(self, db: Session, subscriber_id: int) -> bool:
+    async def delete_subscriber(self, db: AsyncSession, subscriber_id: int) -> bool:
         """Delete subscriber."""
-        subscriber = db.get(Subscriber, subscriber_id)
+        subscriber = await db.get(Subscriber, subscriber_id)
         if not subscriber:
             return False
 
         # Remove tag associations
-        for st in db.exec(select(SubscriberTag).where(SubscriberTag.subscriber_id == subscriber_id)).all():
-            db.delete(st)
+        await db.execute(
+            delete(SubscriberTag).where(SubscriberTag.subscriber_id == subscriber_id)
+        )
 
-        db.delete(subscriber)
-        db.commit()
+        await db.delete(subscriber)
+        await db.flush()
         return True
 
-    def add_tags_to_subscriber(
+    async def add_tags_to_subscriber(
         self,
-        db: Session,
+        db: AsyncSession,
         subscriber_id: int,
         tag_ids: List[int]
     ) -> Optional[Subscriber]:
         """Add tags to a subscriber."""
-        subscriber = db.get(Subscriber, subscriber_id)
+        subscriber = await db.get(Subscriber, subscriber_id)
         if not subscriber:
             return None
 
-        for tag_id in tag_ids:
-            # Check if association already exists
-            existing = db.exec(
-                select(SubscriberTag).where(
-                    and_(
-                        SubscriberTag.subscriber_id == subscriber_id,
-                        SubscriberTag.tag_id == tag_id
-                    )
-                )
-            ).first()
+        await _insert_subscriber_tags(db, subscriber_id, tag_ids)
 
-            if not existing:
-                subscriber_tag = SubscriberTag(
-                    subscriber_id=subscriber_id,
-                    tag_id=tag_id
-                )
-                db.add(subscriber_tag)
-
-        db.commit()
-        db.refresh(subscriber)
+        await db.flush()
         return subscriber
 
-    def remove_tag_from_subscriber(
+    async def remove_tag_from_subscriber(
         self,
-        db: Session,
+        db: AsyncSession,
         subscriber_id: int,
         tag_id: int
     ) -> bool:
         """Remove a tag from a subscriber."""
-        subscriber_tag = db.exec(
+        subscriber_tag = (await db.exec(
             select(SubscriberTag).where(
                 and_(
                     SubscriberTag.subscriber_id == subscriber_id,
                     SubscriberTag.tag_id == tag_id
                 )
             )
-        ).first()
+        )).first()
 
         if not subscriber_tag:
             return False
 
-        db.delete(subscriber_tag)
-        db.commit()
+        await db.delete(subscriber_tag)
+        await db.flush()
         return True
 
-    def get_subscriber_tag_count(self, db: Session, subscriber_id: int) -> int:
+    async def get_subscriber_tag_count(self, db: AsyncSession, subscriber_id: int) -> int:
         """Get number of tags for a subscriber."""
-        return db.exec(
-            select(func.count(SubscriberTag.id)).where(SubscriberTag.subscriber_id == subscriber_id)
-        ).first() or 0
+        return (await db.exec(
+            select(func.count()).select_from(SubscriberTag).where(
+                SubscriberTag.subscriber_id == subscriber_id
+            )
+        )).first() or 0
 
     # ============================================================
     # Email Template Operations
     # ============================================================
 
-    def create_template(
+    async def create_template(
         self,
-        db: Session,
+        db: AsyncSession,
         data: EmailTemplateCreate,
         created_by_id: int
     ) -> EmailTemplate:
         """Create a new email template."""
-        slug = generate_slug(data.name, db, EmailTemplate)
-
         template = EmailTemplate(
             **data.model_dump(),
-            slug=slug,
+            slug=slugify(data.name),
             created_by_id=created_by_id
         )
-        db.add(template)
-        db.commit()
-        db.refresh(template)
-        return template
+        return await _insert_with_unique_slug(db, EmailTemplate, template)
 
-    def get_template(self, db: Session, template_id: int) -> Optional[EmailTemplate]:
+    async def get_template(self, db: AsyncSession, template_id: int) -> Optional[EmailTemplate]:
         """Get template by ID."""
-        return db.get(EmailTemplate, template_id)
+        return await db.get(EmailTemplate, template_id)
+
+    async def get_template_by_slug(self, db: AsyncSession, slug: str) -> Optional[EmailTemplate]:
+        """Get template by slug, resolving the slug to an id through the cache."""
+        async def load() -> Optional[str]:
+            template_id = (await db.exec(
+                select(EmailTemplate.id).where(EmailTemplate.slug == slug)
+            )).first()
+            return str(template_id) if template_id is not None else None
 
-    def get_template_by_slug(self, db: Session, slug: str) -> Optional[EmailTemplate]:
-        """Get template by slug."""
-        return db.exec(select(EmailTemplate).where(EmailTemplate.slug == slug)).first()
+        cached = await get_or_set(template_slug_cache_key(slug), SLUG_CACHE_TTL, load)
+        return await db.get(EmailTemplate, int(cached)) if cached else None
 
-    def get_templates(
+    async def get_templates(
         self,
-        db: Session,
+        db: AsyncSession,
         active_only: bool = False
     ) -> tuple[List[EmailTemplate], int]:
         """Get all templates."""
         query = select(EmailTemplate)
-        count_query = select(func.count(EmailTemplate.id))
 
         if active_only:
             query = query.where(EmailTemplate.is_active == True)
-            count_query = count_query.where(EmailTemplate.is_active == True)
 
-        total = db.exec(count_query).first() or 0
         query = query.order_by(EmailTemplate.name)
 
-        templates = db.exec(query).all()
-        return list(templates), total
+        # Unpaginated, so the total is simply the number of rows
+        templates = list((await db.exec(query)).all())
+        return templates, len(templates)
 
-    def update_template(
+    async def update_template(
         self,
-        db: Session,
+        db: AsyncSession,
         template_id: int,
         data: EmailTemplateUpdate
     ) -> Optional[EmailTemplate]:
         """Update template."""
-        template = db.get(EmailTemplate, template_id)
+        template = await db.get(EmailTemplate, template_id)
         if not template:
             return None
 
         update_data = data.model_dump(exclude_unset=True)
 
         if 'name' in update_data and update_data['name'] != template.name:
-            update_data['slug'] = generate_slug(update_data['name'], db, EmailTemplate)
+            await get_cache().delete(template_slug_cache_key(template.slug))
+            update_data['slug'] = await generate_slug(update_data['name'], db, EmailTemplate)
 
         for field, value in update_data.items():
             setattr(template, field, value)
 
         template.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(template)
+        await db.flush()
         return template
 
-    def delete_template(self, db: Session, template_id: int) -> bool:
+    async def delete_template(self, db: AsyncSession, template_id: int) -> bool:
         """Delete template."""
-        template = db.get(EmailTemplate, template_id)
+        template = await db.get(EmailTemplate, template_id)
         if not template:
             return False
 
-        db.delete(template)
-        db.commit()
+        await get_cache().delete(template_slug_cache_key(template.slug))
+        await db.delete(template)
+        await db.flush()
         return True
 
     # ============================================================
     # Campaign Operations
     # ============================================================
 
-    def create_campaign(
+    async def create_campaign(
         self,
-        db: Session,
+        db: AsyncSession,
         data: CampaignCreate,
         created_by_id: int
     ) -> Campaign:
@@ -572,61 +794,63 @@ class NewsletterCRUD:
             created_by_id=created_by_id
         )
         db.add(campaign)
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
-    def get_campaign(self, db: Session, campaign_id: int) -> Optional[Campaign]:
+    async def get_campaign(self, db: AsyncSession, campaign_id: int) -> Optional[Campaign]:
         """Get campaign by ID."""
-        return db.get(Campaign, campaign_id)
+        return await db.get(Campaign, campaign_id)
 
-    def get_campaigns(
+    async def get_campaigns(
         self,
-        db: Session,
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 20,
         status: Optional[CampaignStatus] = None
-    ) -> tuple[List[Campaign], int]:
-        """Get campaigns with optional status filtering."""
-        query = select(Campaign)
-        count_query = select(func.count(Campaign.id))
+    ) -> tuple[list, int]:
+        """
+        Get campaigns with optional status filtering.
+        Returns rows with the list-view columns (no HTML/text bodies).
+        """
+        conditions = []
 
         if status:
-            query = query.where(Campaign.status == status)
-            count_query = count_query.where(Campaign.status == status)
-
-        total = db.exec(count_query).first() or 0
-        query = query.order_by(Campaign.created_at.desc())
-        query = query.offset(skip).limit(limit)
-
-        campaigns = db.exec(query).all()
-        return list(campaigns), total
+            conditions.append(Campaign.status == status)
+
+        return await _paginate(
+            db, Campaign, conditions, [Campaign.created_at.desc()], skip, limit,
+            columns=[
+                Campaign.id, Campaign.name, Campaign.subject, Campaign.status,
+                Campaign.scheduled_at, Campaign.sent_at, Campaign.total_recipients,
+                Campaign.total_opened, Campaign.total_clicked, Campaign.created_at
+            ]
+        )
 
-    def get_scheduled_campaigns(self, db: Session, before: datetime) -> List[Campaign]:
+    async def get_scheduled_campaigns(self, db: AsyncSession, before: datetime) -> List[Campaign]:
         """Get campaigns scheduled to be sent before a certain time."""
-        return list(db.exec(
+        return list((await db.exec(
             select(Campaign).where(
                 and_(
                     Campaign.status == CampaignStatus.scheduled,
                     Campaign.scheduled_at <= before
                 )
             )
-        ).all())
+        )).all())
 
-    def get_sending_campaigns(self, db: Session) -> List[Campaign]:
+    async def get_sending_campaigns(self, db: AsyncSession) -> List[Campaign]:
         """Get campaigns that are currently sending."""
-        return list(db.exec(
+        return list((await db.exec(
             select(Campaign).where(Campaign.status == CampaignStatus.sending)
-        ).all())
+        )).all())
 
-    def update_campaign(
+    async def update_campaign(
         self,
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         data: CampaignUpdate
     ) -> Optional[Campaign]:
         """Update campaign (only if draft)."""
-        campaign = db.get(Campaign, campaign_id)
+        campaign = await db.get(Campaign, campaign_id)
         if not campaign:
             return None
 
@@ -640,18 +864,17 @@ class NewsletterCRUD:
             setattr(campaign, field, value)
 
         campaign.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
-    def schedule_campaign(
+    async def schedule_campaign(
         self,
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         scheduled_at: datetime
     ) -> Optional[Campaign]:
         """Schedule a campaign for sending."""
-        campaign = db.get(Campaign, campaign_id)
+        campaign = await db.get(Campaign, campaign_id)
         if not campaign or campaign.status != CampaignStatus.draft:
             return None
 
@@ -659,26 +882,24 @@ class NewsletterCRUD:
         campaign.scheduled_at = scheduled_at
         campaign.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
-    def start_campaign_sending(self, db: Session, campaign_id: int) -> Optional[Campaign]:
+    async def start_campaign_sending(self, db: AsyncSession, campaign_id: int) -> Optional[Campaign]:
         """Mark campaign as sending."""
-        campaign = db.get(Campaign, campaign_id)
+        campaign = await db.get(Campaign, campaign_id)
         if not campaign:
             return None
 
         campaign.status = CampaignStatus.sending
         campaign.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
-    def complete_campaign(self, db: Session, campaign_id: int) -> Optional[Campaign]:
+    async def complete_campaign(self, db: AsyncSession, campaign_id: int) -> Optional[Campaign]:
         """Mark campaign as sent."""
-        campaign = db.get(Campaign, campaign_id)
+        campaign = await db.get(Campaign, campaign_id)
         if not campaign:
             return None
 
@@ -686,13 +907,12 @@ class NewsletterCRUD:
         campaign.sent_at = datetime.utcnow()
         campaign.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
-    def cancel_campaign(self, db: Session, campaign_id: int) -> Optional[Campaign]:
+    async def cancel_campaign(self, db: AsyncSession, campaign_id: int) -> Optional[Campaign]:
         """Cancel a scheduled campaign."""
-        campaign = db.get(Campaign, campaign_id)
+        campaign = await db.get(Campaign, campaign_id)
         if not campaign or campaign.status not in [CampaignStatus.draft, CampaignStatus.scheduled]:
             return None
 
@@ -700,130 +920,220 @@ class NewsletterCRUD:
         campaign.scheduled_at = None
         campaign.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
-    def delete_campaign(self, db: Session, campaign_id: int) -> bool:
+    async def delete_campaign(self, db: AsyncSession, campaign_id: int) -> bool:
         """Delete campaign (only if draft)."""
-        campaign = db.get(Campaign, campaign_id)
+        campaign = await db.get(Campaign, campaign_id)
         if not campaign or campaign.status != CampaignStatus.draft:
             return False
 
         # Delete recipients
-        for recipient in db.exec(select(CampaignRecipient).where(CampaignRecipient.campaign_id == campaign_id)).all():
-            db.delete(recipient)
+        await db.execute(
+            delete(CampaignRecipient).where(CampaignRecipient.campaign_id == campaign_id)
+        )
 
-        db.delete(campaign)
-        db.commit()
+        await db.delete(campaign)
+        await db.flush()
         return True
 
-    def update_campaign_stats(
+    async def update_campaign_stats(
         self,
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         field: str,
         increment: int = 1
     ) -> Optional[Campaign]:
-        """Increment a campaign statistic field."""
-        campaign = db.get(Campaign, campaign_id)
-        if not campaign:
-            return None
-
-        current_value = getattr(campaign, field, 0)
-        setattr(campaign, field, current_value + increment)
-        campaign.updated_at = datetime.utcnow()
+        """
+        Increment a campaign statistic field.
+        Done as a single UPDATE ... SET field = field + n so concurrent
+        opens/clicks never lose increments.
+        """
+        if field not in CAMPAIGN_STAT_FIELDS:
+            raise ValueError(f"Invalid campaign stat field: {field}")
+
+        column = getattr(Campaign, field)
+        statement = (
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values({field: column + increment, 'updated_at': datetime.utcnow()})
+            .returning(Campaign)
+            .execution_options(populate_existing=True)
+        )
+        campaign = (await db.execute(statement)).scalar_one_or_none()
 
-        db.commit()
-        db.refresh(campaign)
+        await db.flush()
         return campaign
 
     # ============================================================
     # Campaign Recipient Operations
     # ============================================================
 
-    def create_campaign_recipient(
+    async def create_campaign_recipient(
         self,
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         subscriber_id: int
     ) -> CampaignRecipient:
         """Create a campaign recipient."""
+        open_token, click_token = generate_tokens(2)
         recipient = CampaignRecipient(
             campaign_id=campaign_id,
             subscriber_id=subscriber_id,
-            open_token=generate_token(),
-            click_token=generate_token()
+            open_token=open_token,
+            click_token=click_token
         )
         db.add(recipient)
-        db.commit()
-        db.refresh(recipient)
+        await db.flush()
         return recipient
 
-    def get_campaign_recipient(self, db: Session, recipient_id: int) -> Optional[CampaignRecipient]:
+    async def bulk_create_campaign_recipients(
+        self,
+        db: AsyncSession,
+        campaign_id: int,
+        subscriber_ids: List[int]
+    ) -> int:
+        """
+        Create recipients for many subscribers with batched multi-row INSERTs.
+        Returns the number of recipients created.
+        """
+        now = datetime.utcnow()
+        for start in range(0, len(subscriber_ids), RECIPIENT_INSERT_BATCH_SIZE):
+            batch = subscriber_ids[start:start + RECIPIENT_INSERT_BATCH_SIZE]
+            tokens = generate_tokens(2 * len(batch))
+            await db.execute(
+                insert(CampaignRecipient),
+                [
+                    {
+                        "campaign_id": campaign_id,
+                        "subscriber_id": subscriber_id,
+                        "status": RecipientStatus.pending,
+                        "open_token": tokens[2 * i],
+                        "click_token": tokens[2 * i + 1],
+                        "created_at": now
+                    }
+                    for i, subscriber_id in enumerate(batch)
+                ]
+            )
+
+        return len(subscriber_ids)
+
+    async def get_campaign_recipient(self, db: AsyncSession, recipient_id: int) -> Optional[CampaignRecipient]:
         """Get campaign recipient by ID."""
-        return db.get(CampaignRecipient, recipient_id)
+        return await db.get(CampaignRecipient, recipient_id)
 
-    def get_recipient_by_open_token(self, db: Session, token: str) -> Optional[CampaignRecipient]:
+    async def get_recipient_by_open_token(self, db: AsyncSession, token: str) -> Optional[CampaignRecipient]:
         """Get recipient by open tracking token."""
-        return db.exec(
+        return (await db.exec(
             select(CampaignRecipient).where(CampaignRecipient.open_token == token)
-        ).first()
+        )).first()
 
-    def get_recipient_by_click_token(self, db: Session, token: str) -> Optional[CampaignRecipient]:
+    async def get_recipient_by_click_token(self, db: AsyncSession, token: str) -> Optional[CampaignRecipient]:
         """Get recipient by click tracking token."""
-        return db.exec(
+        return (await db.exec(
             select(CampaignRecipient).where(CampaignRecipient.click_token == token)
-        ).first()
+        )).first()
 
-    def get_pending_recipients(
+    async def get_pending_recipients(
         self,
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         limit: int = 50
     ) -> List[CampaignRecipient]:
-        """Get pending recipients for a campaign."""
-        return list(db.exec(
-            select(CampaignRecipient).where(
+        """
+        Claim up to limit pending recipients for a campaign, with their
+        subscribers loaded, by moving them to the sending status.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED, so concurrent send
+        workers each claim a disjoint batch; commit to make the claim
+        durable before sending. Claims older than RECIPIENT_CLAIM_TIMEOUT
+        are re-queued first.
+        """
+        now = datetime.utcnow()
+        await db.execute(
+            update(CampaignRecipient)
+            .where(
+                and_(
+                    CampaignRecipient.campaign_id == campaign_id,
+                    CampaignRecipient.status == RecipientStatus.sending,
+                    CampaignRecipient.claimed_at < now - RECIPIENT_CLAIM_TIMEOUT
+                )
+            )
+            .values(status=RecipientStatus.pending, claimed_at=None)
+        )
+
+        recipients = list((await db.exec(
+            select(CampaignRecipient).options(
+                joinedload(CampaignRecipient.subscriber)
+            ).where(
                 and_(
                     CampaignRecipient.campaign_id == campaign_id,
                     CampaignRecipient.status == RecipientStatus.pending
                 )
-            ).limit(limit)
-        ).all())
+            ).order_by(CampaignRecipient.id).limit(limit).with_for_update(
+                skip_locked=True, of=CampaignRecipient
+            )
+        )).all())
+
+        if recipients:
+            await db.execute(
+                update(CampaignRecipient)
+                .where(CampaignRecipient.id.in_([r.id for r in recipients]))
+                .values(status=RecipientStatus.sending, claimed_at=now)
+            )
+        return recipients
+
+    async def count_unfinished_recipients(self, db: AsyncSession, campaign_id: int) -> int:
+        """
+        Count a campaign's recipients still pending or claimed by a send
+        worker (sending); the campaign is done only when this is zero.
+        """
+        return (await db.exec(
+            select(func.count()).select_from(CampaignRecipient).where(
+                CampaignRecipient.campaign_id == campaign_id,
+                CampaignRecipient.status.in_(
+                    [RecipientStatus.pending, RecipientStatus.sending]
+                )
+            )
+        )).one()
 
-    def get_campaign_recipients(
+    async def get_campaign_recipients(
         self,
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         skip: int = 0,
         limit: int = 50,
-        status: Optional[RecipientStatus] = None
+        status: Optional[RecipientStatus] = None,
+        after_id: Optional[int] = None
     ) -> tuple[List[CampaignRecipient], int]:
-        """Get campaign recipients with optional status filtering."""
-        query = select(CampaignRecipient).where(CampaignRecipient.campaign_id == campaign_id)
-        count_query = select(func.count(CampaignRecipient.id)).where(
-            CampaignRecipient.campaign_id == campaign_id
-        )
+        """
+        Get campaign recipients with optional status filtering, in id order.
+        With after_id, returns the page after that recipient and ignores skip.
+        """
+        conditions = [CampaignRecipient.campaign_id == campaign_id]
 
         if status:
-            query = query.where(CampaignRecipient.status == status)
-            count_query = count_query.where(CampaignRecipient.status == status)
+            conditions.append(CampaignRecipient.status == status)
 
-        total = db.exec(count_query).first() or 0
-        query = query.offset(skip).limit(limit)
+        after = None
+        if after_id is not None:
+            after = CampaignRecipient.id > after_id
 
-        recipients = db.exec(query).all()
-        return list(recipients), total
+        return await _paginate(
+            db, CampaignRecipient, conditions, [CampaignRecipient.id], skip, limit,
+            options=[joinedload(CampaignRecipient.subscriber)],
+            after=after
+        )
 
-    def update_recipient_status(
+    async def update_recipient_status(
         self,
-        db: Session,
+        db: AsyncSession,
         recipient_id: int,
         status: RecipientStatus
     ) -> Optional[CampaignRecipient]:
         """Update recipient status."""
-        recipient = db.get(CampaignRecipient, recipient_id)
+        recipient = await db.get(CampaignRecipient, recipient_id)
         if not recipient:
             return None
 
@@ -839,13 +1149,42 @@ class NewsletterCRUD:
             if not recipient.clicked_at:  # Only set first click
                 recipient.clicked_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(recipient)
+        await db.flush()
         return recipient
 
-    def record_link_click(
+    async def bulk_update_recipient_status(
+        self,
+        db: AsyncSession,
+        recipient_ids: List[int],
+        status: RecipientStatus
+    ) -> int:
+        """
+        Move many recipients to status in one UPDATE.
+        The matching timestamp is only set if still empty, so the first
+        send/open/click wins. Returns the number of rows updated.
+        """
+        if not recipient_ids:
+            return 0
+
+        values = {"status": status}
+        now = datetime.utcnow()
+        if status == RecipientStatus.sent:
+            values["sent_at"] = func.coalesce(CampaignRecipient.sent_at, now)
+        elif status == RecipientStatus.opened:
+            values["opened_at"] = func.coalesce(CampaignRecipient.opened_at, now)
+        elif status == RecipientStatus.clicked:
+            values["clicked_at"] = func.coalesce(CampaignRecipient.clicked_at, now)
+
+        result = await db.execute(
+            update(CampaignRecipient)
+            .where(CampaignRecipient.id.in_(recipient_ids))
+            .values(**values)
+        )
+        return result.rowcount
+
+    async def record_link_click(
         self,
-        db: Session,
+        db: AsyncSession,
         recipient_id: int,
         original_url: str,
         ip_address: Optional[str] = None,
@@ -859,8 +1198,7 @@ class NewsletterCRUD:
             user_agent=user_agent
         )
         db.add(click)
-        db.commit()
-        db.refresh(click)
+        await db.flush()
         return click
 
 
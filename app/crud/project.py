@@ -1,8 +1,13 @@
 # app/crud/project.py
+from sqlalchemy import bindparam, insert, lambda_stmt, literal_column, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select, func, and_, or_, text
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime, date
+import re
 
+from app.models.mixins import utcnow
 from app.models.project import Project, ProjectTeam, Milestone, EnvironmentalMetric
 from app.models.user import User, UserType
 from app.models.volunteer import Volunteer, VolunteerTimeLog
@@ -12,6 +17,110 @@ from app.schemas.project import (
     MilestoneCreate, MilestoneUpdate, EnvironmentalMetricCreate, EnvironmentalMetricUpdate
 )
 
+# Per-project aggregates; mv_project_dashboard materializes exactly this
+# query on PostgreSQL (see migration 027). Each table is aggregated on its
+# own so joining one does not multiply the rows (and sums) of another.
+_PROJECT_AGGREGATES_SQL = """
+    SELECT
+        p.id,
+        COALESCE(team.team_size, 0) AS team_size,
+        COALESCE(team.volunteers_count, 0) AS volunteers_count,
+        COALESCE(task.total_tasks, 0) AS total_tasks,
+        COALESCE(task.completed_tasks, 0) AS completed_tasks,
+        COALESCE(hours.volunteer_hours, 0) AS volunteer_hours
+    FROM projects p
+    LEFT JOIN (
+        SELECT project_id,
+               COUNT(DISTINCT user_id) AS team_size,
+               COUNT(DISTINCT CASE WHEN is_volunteer THEN user_id END) AS volunteers_count
+        FROM project_teams
+        WHERE is_active = true
+        GROUP BY project_id
+    ) team ON team.project_id = p.id
+    LEFT JOIN (
+        SELECT project_id,
+               COUNT(*) AS total_tasks,
+               COUNT(CASE WHEN status = 'completed' THEN 1 END) AS completed_tasks
+        FROM tasks
+        GROUP BY project_id
+    ) task ON task.project_id = p.id
+    LEFT JOIN (
+        SELECT project_id, SUM(hours) AS volunteer_hours
+        FROM volunteer_time_logs
+        WHERE approved = true
+        GROUP BY project_id
+    ) hours ON hours.project_id = p.id
+"""
+
+# One page of projects with their aggregates. Project columns are live;
+# from the materialized view the aggregates are as of the last refresh,
+# and projects created since then show zeros.
+_DASHBOARD_SQL_TEMPLATE = """
+    SELECT
+        p.id, p.name, p.status, p.category, p.start_date, p.end_date,
+        p.budget, p.actual_cost,
+        COALESCE(agg.team_size, 0) AS team_size,
+        COALESCE(agg.volunteers_count, 0) AS volunteers_count,
+        COALESCE(agg.total_tasks, 0) AS total_tasks,
+        COALESCE(agg.completed_tasks, 0) AS completed_tasks,
+        COALESCE(agg.volunteer_hours, 0) AS volunteer_hours
+    FROM projects p
+    LEFT JOIN {aggregates} agg ON agg.id = p.id
+    ORDER BY p.created_at DESC
+    LIMIT :limit OFFSET :skip
+"""
+
+# Mean active team size over projects that have a team
+_AVG_TEAM_SIZE_SQL_TEMPLATE = """
+    SELECT AVG(team_size) FROM {aggregates} agg WHERE team_size > 0
+"""
+
+_VIEW = "mv_project_dashboard"
+_LIVE = f"({_PROJECT_AGGREGATES_SQL})"
+
+_DASHBOARD_SQL = text(_DASHBOARD_SQL_TEMPLATE.format(aggregates=_VIEW))
+_DASHBOARD_LIVE_SQL = text(_DASHBOARD_SQL_TEMPLATE.format(aggregates=_LIVE))
+_AVG_TEAM_SIZE_SQL = text(_AVG_TEAM_SIZE_SQL_TEMPLATE.format(aggregates=_VIEW))
+_AVG_TEAM_SIZE_LIVE_SQL = text(_AVG_TEAM_SIZE_SQL_TEMPLATE.format(aggregates=_LIVE))
+
+_REFRESH_DASHBOARD_SQL = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_project_dashboard")
+_DASHBOARD_VIEW_EXISTS_SQL = text("SELECT to_regclass('mv_project_dashboard') IS NOT NULL")
+
+
+def _is_postgres(db: Session) -> bool:
+    """
+    The dashboard view, projects.search_vector and the approved-hours
+    trigger only exist on PostgreSQL (e.g. not in SQLite tests).
+    """
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _has_dashboard_view(db: Session) -> bool:
+    """mv_project_dashboard also needs migration 027 to have run."""
+    return _is_postgres(db) and bool(db.execute(_DASHBOARD_VIEW_EXISTS_SQL).scalar())
+
+
+# projects.search_vector is a generated tsvector over name and description
+# (migration 033). It is not mapped on Project because the SQLite test
+# schema cannot create it.
+_PROJECT_SEARCH_VECTOR = literal_column("projects.search_vector")
+
+# Shorter search terms keep the substring ILIKE match
+_FULL_TEXT_MIN_LENGTH = 3
+
+
+def _prefix_tsquery(search: str) -> Optional[str]:
+    """
+    to_tsquery text matching every word of search as a prefix, so a
+    partly typed word still matches. None when search has no word
+    characters.
+    """
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
 class ProjectCRUD:
     def create_project(self, db: Session, project_data: ProjectCreate, current_user_id: int) -> Project:
         """Create a new project."""
@@ -32,18 +141,16 @@ class ProjectCRUD:
         """Get project by ID."""
         return db.get(Project, project_id)
     
-    def get_projects(
-        self, 
-        db: Session, 
-        skip: int = 0, 
-        limit: int = 100,
+    def _projects_query(
+        self,
+        db: Session,
         status: Optional[str] = None,
         category: Optional[str] = None,
         manager_id: Optional[int] = None,
         requires_volunteers: Optional[bool] = None,
         search: Optional[str] = None
-    ) -> List[Project]:
-        """Get projects with filtering options."""
+    ):
+        """Filtered project select shared by get_projects and stream_projects."""
         query = select(Project)
         
         if status:
@@ -55,61 +162,149 @@ class ProjectCRUD:
         if requires_volunteers is not None:
             query = query.where(Project.requires_volunteers == requires_volunteers)
         if search:
-            query = query.where(
-                or_(
-                    Project.name.ilike(f"%{search}%"),
-                    Project.description.ilike(f"%{search}%")
-                )
+            # Substring match; pg_trgm indexes serve these.
+            # One named parameter shared by both columns.
+            pattern = bindparam("search_pattern", f"%{search}%")
+            condition = or_(
+                Project.name.ilike(pattern),
+                Project.description.ilike(pattern)
             )
-        
-        query = query.offset(skip).limit(limit).order_by(Project.created_at.desc())
+            tsquery = _prefix_tsquery(search)
+            if len(search) >= _FULL_TEXT_MIN_LENGTH and tsquery and _is_postgres(db):
+                # Also match words in any order through the GIN-indexed
+                # tsvector. Prefix terms and OR-ing keep every hit a
+                # shorter, substring-matched term had, so results only
+                # narrow as the user types.
+                condition = or_(
+                    _PROJECT_SEARCH_VECTOR.op("@@")(func.to_tsquery("simple", tsquery)),
+                    condition
+                )
+            query = query.where(condition)
+        return query
+    
+    def get_projects(
+        self, 
+        db: Session, 
+        skip: int = 0, 
+        limit: int = 100,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        manager_id: Optional[int] = None,
+        requires_volunteers: Optional[bool] = None,
+        search: Optional[str] = None,
+        before: Optional[Tuple[datetime, int]] = None
+    ) -> List[Project]:
+        """
+        Get projects with filtering options, newest first.
+        Pass before=(created_at, id) of the last project seen for keyset
+        pagination; skip is then ignored.
+        """
+        query = self._projects_query(db, status, category, manager_id, requires_volunteers, search)
+        
+        if before is not None:
+            query = query.where(tuple_(Project.created_at, Project.id) < before)
+        else:
+            query = query.offset(skip)
+
+        query = query.limit(limit).order_by(Project.created_at.desc(), Project.id.desc())
         return db.exec(query).all()
     
+    def stream_projects(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        manager_id: Optional[int] = None,
+        requires_volunteers: Optional[bool] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Project]:
+        """
+        Yield filtered projects, newest first, for exports.
+        Rows are fetched and hydrated batch_size at a time over a
+        server-side cursor instead of all at once. The session must stay
+        open until the generator is exhausted.
+        """
+        query = self._projects_query(db, status, category, manager_id, requires_volunteers, search)
+        query = query.order_by(Project.created_at.desc(), Project.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        yield from db.exec(query.execution_options(yield_per=batch_size))
+    
     def update_project(self, db: Session, project_id: int, project_data: ProjectUpdate) -> Optional[Project]:
-        """Update project."""
-        project = db.get(Project, project_id)
-        if not project:
-            return None
-        
+        """Update project in one UPDATE ... RETURNING."""
         update_data = project_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(project, field, value)
-        
-        project.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(project)
+        if not update_data:
+            return self.get_project(db, project_id)
+        project = db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**update_data)
+            .returning(Project)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if project:
+            db.commit()
+            # The commit expires the returned row; reload it for the caller
+            db.refresh(project)
         return project
     
     def delete_project(self, db: Session, project_id: int) -> bool:
         """Delete project (soft delete by changing status)."""
-        project = db.get(Project, project_id)
-        if not project:
+        cancelled_id = db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(status="cancelled")
+            .returning(Project.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if cancelled_id is None:
             return False
-        
-        project.status = "cancelled"
-        project.updated_at = datetime.utcnow()
         db.commit()
         return True
     
     def get_project_with_details(self, db: Session, project_id: int) -> Optional[Dict[str, Any]]:
         """Get project with all related details."""
-        project = db.get(Project, project_id)
-        if not project:
+        manager_user = aliased(User)
+        creator_user = aliased(User)
+
+        # Project, manager, creator and the task/hour aggregates in one query
+        total_tasks_query = (
+            select(func.count(Task.id))
+            .where(Task.project_id == Project.id)
+            .scalar_subquery()
+        )
+        completed_tasks_query = (
+            select(func.count(Task.id))
+            .where(and_(Task.project_id == Project.id, Task.status == 'completed'))
+            .scalar_subquery()
+        )
+        # PostgreSQL keeps the approved-hours total on the project row
+        if _is_postgres(db):
+            volunteer_hours_query = Project.total_approved_hours
+        else:
+            volunteer_hours_query = (
+                select(func.coalesce(func.sum(VolunteerTimeLog.hours), 0))
+                .where(and_(VolunteerTimeLog.project_id == Project.id, VolunteerTimeLog.approved == True))
+                .scalar_subquery()
+            )
+        row = db.exec(
+            select(
+                Project, manager_user, creator_user,
+                total_tasks_query, completed_tasks_query, volunteer_hours_query
+            )
+            .outerjoin(manager_user, Project.project_manager_id == manager_user.id)
+            .outerjoin(creator_user, Project.created_by_id == creator_user.id)
+            .where(Project.id == project_id)
+        ).first()
+        if not row:
             return None
+        project, manager, creator, total_tasks, completed_tasks, volunteer_hours = row
         
-        # Get project manager info
-        manager = None
-        if project.project_manager_id:
-            manager = db.get(User, project.project_manager_id)
-        
-        # Get created by info
-        creator = None
-        if project.created_by_id:
-            creator = db.get(User, project.created_by_id)
-        
-        # Get team members with user info
+        # Get team members with user info; only the type name is needed
         team_query = (
-            select(ProjectTeam, User, UserType)
+            select(ProjectTeam, User, UserType.name)
             .join(User, ProjectTeam.user_id == User.id)
             .join(UserType, User.user_type_id == UserType.id)
             .where(and_(ProjectTeam.project_id == project_id, ProjectTeam.is_active == True))
@@ -128,22 +323,6 @@ class ProjectCRUD:
         )
         metrics_data = db.exec(metrics_query).all()
         
-        # Get tasks count
-        total_tasks = db.exec(
-            select(func.count(Task.id)).where(Task.project_id == project_id)
-        ).first()
-        
-        completed_tasks = db.exec(
-            select(func.count(Task.id))
-            .where(and_(Task.project_id == project_id, Task.status == 'completed'))
-        ).first()
-        
-        # Get volunteer hours
-        volunteer_hours = db.exec(
-            select(func.coalesce(func.sum(VolunteerTimeLog.hours), 0))
-            .where(and_(VolunteerTimeLog.project_id == project_id, VolunteerTimeLog.approved == True))
-        ).first()
-        
         return {
             "project": project,
             "manager": manager,
@@ -156,76 +335,73 @@ class ProjectCRUD:
             "volunteer_hours": float(volunteer_hours or 0)
         }
     
+    def get_task_counts_for_projects(self, db: Session, project_ids: List[int]) -> Dict[int, Tuple[int, int]]:
+        """
+        (total_tasks, completed_tasks) per project in one grouped query.
+        Projects without tasks are absent from the result.
+        """
+        if not project_ids:
+            return {}
+        rows = db.exec(
+            select(
+                Task.project_id,
+                func.count(Task.id),
+                func.count(Task.id).filter(Task.status == 'completed')
+            )
+            .where(Task.project_id.in_(project_ids))
+            .group_by(Task.project_id)
+        ).all()
+        return {project_id: (total, completed) for project_id, total, completed in rows}
+    
     def get_project_dashboard_data(self, db: Session, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """Get dashboard data for projects."""
-        query = text("""
-        SELECT
-            p.id, p.name, p.status, p.category, p.start_date, p.end_date,
-            p.budget, p.actual_cost,
-            COUNT(DISTINCT pt.user_id) as team_size,
-            COUNT(DISTINCT CASE WHEN pt.is_volunteer THEN pt.user_id END) as volunteers_count,
-            COUNT(DISTINCT t.id) as total_tasks,
-            COUNT(DISTINCT CASE WHEN t.status = 'completed' THEN t.id END) as completed_tasks,
-            COALESCE(SUM(vtl.hours), 0) as volunteer_hours
-        FROM projects p
-        LEFT JOIN project_teams pt ON p.id = pt.project_id AND pt.is_active = true
-        LEFT JOIN tasks t ON p.id = t.project_id
-        LEFT JOIN volunteer_time_logs vtl ON p.id = vtl.project_id AND vtl.approved = true
-        GROUP BY p.id, p.name, p.status, p.category, p.start_date, p.end_date, p.budget, p.actual_cost
-        ORDER BY p.created_at DESC
-        OFFSET :skip LIMIT :limit
-        """)
-
-        result = db.execute(query, {"skip": skip, "limit": limit})
-        return [dict(row._mapping) for row in result]
+        statement = _DASHBOARD_SQL if _has_dashboard_view(db) else _DASHBOARD_LIVE_SQL
+        result = db.execute(statement, {"skip": skip, "limit": limit})
+        return [dict(row) for row in result.mappings()]
+    
+    def refresh_dashboard_view(self, db: Session) -> None:
+        """Recompute mv_project_dashboard without blocking readers."""
+        if not _has_dashboard_view(db):
+            return
+        db.execute(_REFRESH_DASHBOARD_SQL)
+        db.commit()
     
     def get_project_stats(self, db: Session) -> Dict[str, Any]:
         """Get project statistics."""
-        total_projects = db.exec(select(func.count(Project.id))).first()
-        active_projects = db.exec(
-            select(func.count(Project.id))
-            .where(Project.status.in_(["planning", "in_progress"]))
-        ).first()
-        completed_projects = db.exec(
-            select(func.count(Project.id))
-            .where(Project.status == "completed")
-        ).first()
-        
-        # Projects by status
+        # Projects by status; the overall counts derive from it
         status_query = select(Project.status, func.count(Project.id)).group_by(Project.status)
         status_data = db.exec(status_query).all()
         projects_by_status = {status: count for status, count in status_data}
+        total_projects = sum(projects_by_status.values())
+        active_projects = sum(
+            count for status, count in projects_by_status.items()
+            if status in ("planning", "in_progress")
+        )
+        completed_projects = projects_by_status.get("completed", 0)
         
         # Projects by category
         category_query = select(Project.category, func.count(Project.id)).group_by(Project.category)
         category_data = db.exec(category_query).all()
         projects_by_category = {category: count for category, count in category_data}
         
-        # Financial stats
-        total_budget = db.exec(
-            select(func.coalesce(func.sum(Project.budget), 0))
-        ).first()
-        total_spent = db.exec(
-            select(func.coalesce(func.sum(Project.actual_cost), 0))
-        ).first()
-        
-        # Volunteer hours
-        total_volunteer_hours = db.exec(
+        # Financial totals and approved volunteer hours in one query
+        approved_hours = (
             select(func.coalesce(func.sum(VolunteerTimeLog.hours), 0))
             .where(VolunteerTimeLog.approved == True)
-        ).first()
-        
-        # Average team size - use subquery to avoid nesting aggregates
-        team_counts_subquery = (
-            select(func.count(ProjectTeam.id).label("team_count"))
-            .join(Project, ProjectTeam.project_id == Project.id)
-            .where(ProjectTeam.is_active == True)
-            .group_by(Project.id)
-            .subquery()
+            .scalar_subquery()
         )
-        avg_team_size = db.exec(
-            select(func.avg(team_counts_subquery.c.team_count))
-        ).first()
+        total_budget, total_spent, total_volunteer_hours = db.exec(
+            select(
+                func.coalesce(func.sum(Project.budget), 0),
+                func.coalesce(func.sum(Project.actual_cost), 0),
+                approved_hours
+            )
+        ).one()
+        
+        # Average team size
+        avg_team_size = db.execute(
+            _AVG_TEAM_SIZE_SQL if _has_dashboard_view(db) else _AVG_TEAM_SIZE_LIVE_SQL
+        ).scalar()
         
         return {
             "total_projects": total_projects or 0,
@@ -241,49 +417,104 @@ class ProjectCRUD:
 
 class ProjectTeamCRUD:
     def add_team_member(self, db: Session, project_id: int, team_data: ProjectTeamCreate) -> Optional[ProjectTeam]:
-        """Add team member to project."""
-        # Check if already exists and active
-        existing = db.exec(
-            select(ProjectTeam)
-            .where(and_(
-                ProjectTeam.project_id == project_id,
-                ProjectTeam.user_id == team_data.user_id,
-                ProjectTeam.is_active == True
-            ))
-        ).first()
-        
-        if existing:
-            return None  # Already a team member
-        
+        """
+        Add team member to project.
+        Returns None if the user is already an active member: the insert
+        yields to the unique (project_id, user_id) WHERE is_active index,
+        so concurrent adds cannot create duplicates.
+        """
         team_member = ProjectTeam(
             project_id=project_id,
             **team_data.model_dump()
         )
-        db.add(team_member)
-        db.commit()
-        db.refresh(team_member)
+        team_member = db.execute(
+            pg_insert(ProjectTeam)
+            .values(**team_member.model_dump(exclude={'id'}))
+            .on_conflict_do_nothing(
+                index_elements=["project_id", "user_id"],
+                index_where=text("is_active")
+            )
+            .returning(ProjectTeam)
+        ).scalar_one_or_none()
+        if team_member:
+            db.commit()
+            # The commit expires the returned row; reload it for the caller
+            db.refresh(team_member)
         return team_member
     
+    def add_team_members(self, db: Session, project_id: int, team_data: List[ProjectTeamCreate]) -> List[ProjectTeam]:
+        """
+        Add several team members in one INSERT ... RETURNING.
+        Users who are already active members are skipped, as in add_team_member.
+        """
+        if not team_data:
+            return []
+        rows = [
+            ProjectTeam(project_id=project_id, **member.model_dump()).model_dump(exclude={'id'})
+            for member in team_data
+        ]
+        team_members = db.execute(
+            pg_insert(ProjectTeam)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=["project_id", "user_id"],
+                index_where=text("is_active")
+            )
+            .returning(ProjectTeam)
+        ).scalars().all()
+        db.commit()
+        return team_members
+    
     def get_team_members(self, db: Session, project_id: int) -> List[Dict[str, Any]]:
         """Get team members with user info."""
-        query = (
-            select(ProjectTeam, User, UserType)
+        query = lambda_stmt(
+            lambda: select(ProjectTeam, User, UserType.name)
             .join(User, ProjectTeam.user_id == User.id)
             .join(UserType, User.user_type_id == UserType.id)
             .where(and_(ProjectTeam.project_id == project_id, ProjectTeam.is_active == True))
         )
-        results = db.exec(query).all()
+        results = db.execute(query).all()
         
         team_members = []
         for team_member, user, user_type in results:
             team_members.append({
                 "team_member": team_member,
                 "user": user,
-                "user_type": user_type.name
+                "user_type": user_type
             })
         
         return team_members
     
+    def get_project_team(self, db: Session, project_id: int) -> List[ProjectTeam]:
+        """Active memberships of a project, without user details."""
+        query = select(ProjectTeam).where(
+            and_(ProjectTeam.project_id == project_id, ProjectTeam.is_active == True)
+        )
+        return db.exec(query).all()
+    
+    def get_teams_for_projects(self, db: Session, project_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Active team members of several projects in one query, keyed by
+        project id, in the same shape as get_team_members. Use this
+        instead of calling get_team_members once per project in a list.
+        """
+        teams: Dict[int, List[Dict[str, Any]]] = {project_id: [] for project_id in project_ids}
+        if not project_ids:
+            return teams
+        query = (
+            select(ProjectTeam, User, UserType.name)
+            .join(User, ProjectTeam.user_id == User.id)
+            .join(UserType, User.user_type_id == UserType.id)
+            .where(and_(ProjectTeam.project_id.in_(project_ids), ProjectTeam.is_active == True))
+        )
+        for team_member, user, user_type in db.exec(query).all():
+            teams[team_member.project_id].append({
+                "team_member": team_member,
+                "user": user,
+                "user_type": user_type
+            })
+        return teams
+    
     def update_team_member(
         self, 
         db: Session, 
@@ -291,45 +522,52 @@ class ProjectTeamCRUD:
         user_id: int, 
         update_data: ProjectTeamUpdate
     ) -> Optional[ProjectTeam]:
-        """Update team member."""
-        team_member = db.exec(
+        """Update team member (the active membership, else the latest one)."""
+        update_dict = update_data.model_dump(exclude_unset=True)
+        if not update_dict.get('is_active', True):
+            update_dict['removed_at'] = utcnow()
+
+        membership = (
             select(ProjectTeam)
             .where(and_(
                 ProjectTeam.project_id == project_id,
                 ProjectTeam.user_id == user_id
             ))
-        ).first()
-        
-        if not team_member:
-            return None
-        
-        update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(team_member, field, value)
-        
-        if not update_dict.get('is_active', True):
-            team_member.removed_at = datetime.utcnow()
-        
-        db.commit()
-        db.refresh(team_member)
+            .order_by(ProjectTeam.is_active.desc(), ProjectTeam.id.desc())
+            .limit(1)
+        )
+        if not update_dict:
+            return db.exec(membership).first()
+
+        membership_id = membership.with_only_columns(ProjectTeam.id).scalar_subquery()
+        team_member = db.execute(
+            update(ProjectTeam)
+            .where(ProjectTeam.id == membership_id)
+            .values(**update_dict)
+            .returning(ProjectTeam)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        ).scalar_one_or_none()
+        if team_member:
+            db.commit()
+            # The commit expires the returned row; reload it for the caller
+            db.refresh(team_member)
         return team_member
     
     def remove_team_member(self, db: Session, project_id: int, user_id: int) -> bool:
         """Remove team member from project."""
-        team_member = db.exec(
-            select(ProjectTeam)
+        removed_ids = db.execute(
+            update(ProjectTeam)
             .where(and_(
                 ProjectTeam.project_id == project_id,
                 ProjectTeam.user_id == user_id,
                 ProjectTeam.is_active == True
             ))
-        ).first()
-        
-        if not team_member:
+            .values(is_active=False, removed_at=utcnow())
+            .returning(ProjectTeam.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if not removed_ids:
             return False
-        
-        team_member.is_active = False
-        team_member.removed_at = datetime.utcnow()
         db.commit()
         return True
 
@@ -342,28 +580,45 @@ class MilestoneCRUD:
         db.refresh(milestone)
         return milestone
     
+    def create_milestones(self, db: Session, milestones_data: List[MilestoneCreate]) -> List[Milestone]:
+        """Create several milestones in one INSERT ... RETURNING, in input order."""
+        if not milestones_data:
+            return []
+        rows = [Milestone(**data.model_dump()).model_dump(exclude={'id'}) for data in milestones_data]
+        milestones = db.scalars(
+            insert(Milestone).returning(Milestone, sort_by_parameter_order=True),
+            rows
+        ).all()
+        db.commit()
+        return milestones
+    
     def get_milestone(self, db: Session, milestone_id: int) -> Optional[Milestone]:
         """Get milestone by ID."""
         return db.get(Milestone, milestone_id)
     
     def get_project_milestones(self, db: Session, project_id: int) -> List[Milestone]:
         """Get milestones for a project."""
-        query = select(Milestone).where(Milestone.project_id == project_id).order_by(Milestone.target_date)
-        return db.exec(query).all()
+        query = lambda_stmt(
+            lambda: select(Milestone).where(Milestone.project_id == project_id).order_by(Milestone.target_date)
+        )
+        return db.execute(query).scalars().all()
     
     def update_milestone(self, db: Session, milestone_id: int, milestone_data: MilestoneUpdate) -> Optional[Milestone]:
-        """Update milestone."""
-        milestone = db.get(Milestone, milestone_id)
-        if not milestone:
-            return None
-        
+        """Update milestone in one UPDATE ... RETURNING."""
         update_data = milestone_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(milestone, field, value)
-        
-        milestone.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(milestone)
+        if not update_data:
+            return self.get_milestone(db, milestone_id)
+        milestone = db.execute(
+            update(Milestone)
+            .where(Milestone.id == milestone_id)
+            .values(**update_data)
+            .returning(Milestone)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if milestone:
+            db.commit()
+            # The commit expires the returned row; reload it for the caller
+            db.refresh(milestone)
         return milestone
     
     def delete_milestone(self, db: Session, milestone_id: int) -> bool:
@@ -385,32 +640,47 @@ class EnvironmentalMetricCRUD:
         db.refresh(metric)
         return metric
     
+    def create_metrics(self, db: Session, metrics_data: List[EnvironmentalMetricCreate]) -> List[EnvironmentalMetric]:
+        """Create several environmental metrics in one INSERT ... RETURNING, in input order."""
+        if not metrics_data:
+            return []
+        rows = [EnvironmentalMetric(**data.model_dump()).model_dump(exclude={'id'}) for data in metrics_data]
+        metrics = db.scalars(
+            insert(EnvironmentalMetric).returning(EnvironmentalMetric, sort_by_parameter_order=True),
+            rows
+        ).all()
+        db.commit()
+        return metrics
+    
     def get_metric(self, db: Session, metric_id: int) -> Optional[EnvironmentalMetric]:
         """Get metric by ID."""
         return db.get(EnvironmentalMetric, metric_id)
     
     def get_project_metrics(self, db: Session, project_id: int) -> List[EnvironmentalMetric]:
         """Get metrics for a project."""
-        query = (
-            select(EnvironmentalMetric)
+        query = lambda_stmt(
+            lambda: select(EnvironmentalMetric)
             .where(EnvironmentalMetric.project_id == project_id)
             .order_by(EnvironmentalMetric.measurement_date.desc())
         )
-        return db.exec(query).all()
+        return db.execute(query).scalars().all()
     
     def update_metric(self, db: Session, metric_id: int, metric_data: EnvironmentalMetricUpdate) -> Optional[EnvironmentalMetric]:
-        """Update environmental metric."""
-        metric = db.get(EnvironmentalMetric, metric_id)
-        if not metric:
-            return None
-        
+        """Update environmental metric in one UPDATE ... RETURNING."""
         update_data = metric_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(metric, field, value)
-        
-        metric.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(metric)
+        if not update_data:
+            return self.get_metric(db, metric_id)
+        metric = db.execute(
+            update(EnvironmentalMetric)
+            .where(EnvironmentalMetric.id == metric_id)
+            .values(**update_data)
+            .returning(EnvironmentalMetric)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if metric:
+            db.commit()
+            # The commit expires the returned row; reload it for the caller
+            db.refresh(metric)
         return metric
     
     def delete_metric(self, db: Session, metric_id: int) -> bool:
@@ -1,12 +1,16 @@
 # app/crud/resource.py
+from sqlalchemy import insert, lambda_stmt, tuple_, update
 from sqlmodel import Session, select, func, and_
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
+from app.crud.utils import count_rows
 from app.models.resource import Resource, ProjectResource
 from app.models.project import Project
 from app.models.user import User
-from app.schemas.resource import ResourceCreate, ResourceUpdate, ProjectResourceCreate, ProjectResourceUpdate
+from app.schemas.resource import (
+    ResourceCreate, ResourceUpdate, ProjectResourceCreate, ProjectResourceUpdate,
+    ProjectResourceAllocation
+)
 
 class ResourceCRUD:
     def create_resource(self, db: Session, resource_data: ResourceCreate) -> Resource:
@@ -17,33 +21,64 @@ class ResourceCRUD:
         db.refresh(resource)
         return resource
     
+    def create_resources(self, db: Session, resources_data: List[ResourceCreate]) -> List[Resource]:
+        """Create several resources in one INSERT ... RETURNING, in input order."""
+        if not resources_data:
+            return []
+        rows = [Resource(**data.model_dump()).model_dump(exclude={'id'}) for data in resources_data]
+        resources = db.scalars(
+            insert(Resource).returning(Resource, sort_by_parameter_order=True),
+            rows
+        ).all()
+        db.commit()
+        return resources
+    
     def get_resource(self, db: Session, resource_id: int) -> Optional[Resource]:
         """Get resource by ID."""
         return db.get(Resource, resource_id)
     
-    def get_resources(self, db: Session, skip: int = 0, limit: int = 100, resource_type: Optional[str] = None) -> List[Resource]:
-        """Get resources with filtering."""
+    def get_resources(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        resource_type: Optional[str] = None,
+        after: Optional[Tuple[str, int]] = None
+    ) -> List[Resource]:
+        """
+        Get active resources with filtering, by name.
+        Pass after=(name, id) of the last resource seen for keyset
+        pagination; skip is then ignored.
+        """
         query = select(Resource).where(Resource.is_active == True)
         
         if resource_type:
             query = query.where(Resource.type == resource_type)
         
-        query = query.offset(skip).limit(limit).order_by(Resource.name)
+        if after is not None:
+            query = query.where(tuple_(Resource.name, Resource.id) > after)
+        else:
+            query = query.offset(skip)
+
+        query = query.limit(limit).order_by(Resource.name, Resource.id)
         return db.exec(query).all()
     
     def update_resource(self, db: Session, resource_id: int, resource_data: ResourceUpdate) -> Optional[Resource]:
-        """Update resource."""
-        resource = db.get(Resource, resource_id)
-        if not resource:
-            return None
-        
+        """Update resource in one UPDATE ... RETURNING."""
         update_data = resource_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(resource, field, value)
-        
-        resource.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(resource)
+        if not update_data:
+            return self.get_resource(db, resource_id)
+        resource = db.execute(
+            update(Resource)
+            .where(Resource.id == resource_id)
+            .values(**update_data)
+            .returning(Resource)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if resource:
+            db.commit()
+            # The commit expires the returned row; reload it for the caller
+            db.refresh(resource)
         return resource
     
     def get_resource_stats(self, db: Session) -> Dict[str, Any]:
@@ -58,7 +93,8 @@ class ResourceCRUD:
         return {
             "total_resources": total_resources or 0,
             "resources_by_type": resources_by_type,
-            "total_allocations": 0,  # Would need to calculate from ProjectResource
+            # Planner estimate once project_resources is large
+            "total_allocations": count_rows(db, ProjectResource),
             "total_cost_allocated": 0.0,
             "utilization_rate": 0.0,
             "most_used_resources": []
@@ -77,6 +113,31 @@ class ProjectResourceCRUD:
         db.refresh(allocation)
         return allocation
     
+    def allocate_resources(
+        self,
+        db: Session,
+        project_id: int,
+        allocations_data: List[ProjectResourceCreate],
+        user_id: int
+    ) -> List[ProjectResource]:
+        """Allocate several resources to a project in one INSERT ... RETURNING, in input order."""
+        if not allocations_data:
+            return []
+        rows = [
+            ProjectResource(
+                project_id=project_id,
+                **data.model_dump(),
+                allocated_by_id=user_id
+            ).model_dump(exclude={'id'})
+            for data in allocations_data
+        ]
+        allocations = db.scalars(
+            insert(ProjectResource).returning(ProjectResource, sort_by_parameter_order=True),
+            rows
+        ).all()
+        db.commit()
+        return allocations
+    
     def get_project_resources(self, db: Session, project_id: int) -> List[Dict[str, Any]]:
         """Get resources allocated to a project."""
         query = (
@@ -97,42 +158,78 @@ class ProjectResourceCRUD:
 
         return resources
 
-    def get_project_allocations(self, db: Session, project_id: int, skip: int = 0, limit: int = 100) -> List[Any]:
-        """Get paginated resource allocations for a project."""
-        from app.schemas.resource import ResourceAllocation
-
+    def get_resources_for_projects(self, db: Session, project_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Resources allocated to several projects in one query, keyed by
+        project id, in the same shape as get_project_resources.
+        """
+        resources: Dict[int, List[Dict[str, Any]]] = {project_id: [] for project_id in project_ids}
+        if not project_ids:
+            return resources
         query = (
             select(ProjectResource, Resource, User)
             .join(Resource, ProjectResource.resource_id == Resource.id)
             .outerjoin(User, ProjectResource.allocated_by_id == User.id)
+            .where(ProjectResource.project_id.in_(project_ids))
+        )
+        for allocation, resource, user in db.exec(query).all():
+            resources[allocation.project_id].append({
+                "allocation": allocation,
+                "resource": resource,
+                "allocated_by": user
+            })
+        return resources
+
+    def get_project_allocations(
+        self, db: Session, project_id: int, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[ProjectResourceAllocation], int]:
+        """
+        Get paginated resource allocations for a project, plus the total
+        allocation count from a COUNT(*) OVER () window on the same query.
+        Only the columns of ProjectResourceAllocation are selected, and each
+        row is validated into it directly.
+        """
+        query = (
+            select(
+                ProjectResource.id,
+                ProjectResource.project_id,
+                ProjectResource.resource_id,
+                ProjectResource.quantity_allocated,
+                ProjectResource.quantity_used,
+                ProjectResource.allocation_date,
+                ProjectResource.notes,
+                ProjectResource.allocated_by_id,
+                Resource.name.label("resource_name"),
+                Resource.type.label("resource_type"),
+                Resource.unit.label("resource_unit"),
+                User.name.label("allocated_by_name"),
+                func.count().over().label("total"),
+            )
+            .join(Resource, ProjectResource.resource_id == Resource.id)
+            .outerjoin(User, ProjectResource.allocated_by_id == User.id)
             .where(ProjectResource.project_id == project_id)
+            .order_by(ProjectResource.id)
             .offset(skip)
             .limit(limit)
         )
-        results = db.exec(query).all()
-
-        allocations = []
-        for allocation, resource, user in results:
-            allocations.append(ResourceAllocation(
-                id=allocation.id,
-                project_id=allocation.project_id,
-                resource_id=allocation.resource_id,
-                resource_name=resource.name,
-                resource_type=resource.resource_type,
-                quantity_allocated=allocation.quantity_allocated,
-                quantity_used=allocation.quantity_used,
-                allocation_date=allocation.allocation_date,
-                allocated_by_id=allocation.allocated_by_id,
-                allocated_by_name=user.name if user else None,
-                created_at=allocation.created_at
-            ))
+        rows = db.exec(query).all()
 
-        return allocations
+        allocations = [ProjectResourceAllocation.model_validate(row) for row in rows]
+        if rows:
+            return allocations, rows[0].total
+        # Page past the end: the window count is unavailable without rows
+        return allocations, self.count_project_allocations(db, project_id) if skip else 0
 
     def count_project_allocations(self, db: Session, project_id: int) -> int:
-        """Count resource allocations for a project."""
-        query = select(func.count(ProjectResource.id)).where(ProjectResource.project_id == project_id)
-        return db.exec(query).one()
+        """
+        Count resource allocations for a project.
+        get_project_allocations already returns the total; this is only
+        needed on its own or for a page past the end.
+        """
+        query = lambda_stmt(
+            lambda: select(func.count(ProjectResource.id)).where(ProjectResource.project_id == project_id)
+        )
+        return db.execute(query).scalar_one()
 
 # Create instances
 resource_crud = ResourceCRUD()
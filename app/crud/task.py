@@ -1,9 +1,15 @@
 # app/crud/task.py
-from sqlmodel import Session, select, func, and_, or_
-from sqlalchemy.exc import IntegrityError
-from typing import List, Optional, Dict, Any
+from sqlmodel import Session, select, func, and_, or_, text
+from sqlalchemy import insert, literal, literal_column, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import aliased
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from contextlib import contextmanager
 from datetime import datetime, date
 
+from app.core.config import settings
+from app.models.mixins import utcnow
 from app.models.task import Task, TaskDependency
 from app.models.project import Project
 from app.models.user import User
@@ -11,6 +17,71 @@ from app.models.volunteer import TaskVolunteer, Volunteer, VolunteerTimeLog
 from app.schemas.task import TaskCreate, TaskUpdate, TaskDependencyCreate
 
 
+# tasks.search_tsv is a generated, weighted tsvector over title (A) and
+# description (B) (migration 038). It is not mapped on Task because the
+# SQLite test schema cannot create it.
+_TASK_SEARCH_TSV = literal_column("tasks.search_tsv")
+
+
+def _task_search_query(db: Session, search: Optional[str]):
+    """
+    Full-text query for multi-word searches on PostgreSQL, else None.
+    Single words keep the substring ILIKE match (trigram indexed), which
+    also tolerates partial words.
+    """
+    if not search or len(search.split()) < 2:
+        return None
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    return func.websearch_to_tsquery("simple", search)
+
+
+# SQLSTATE of a statement cancelled by statement_timeout
+_QUERY_CANCELED = "57014"
+
+
+@contextmanager
+def _limit_search_time(db: Session, search: Optional[str]) -> Iterator[None]:
+    """
+    Cap how long a free-text search may run on PostgreSQL, so a pathological
+    pattern is cancelled by the server instead of holding a connection.
+    The previous statement_timeout is restored afterwards; a cancelled
+    search rolls back and raises SearchTimeoutError.
+    """
+    if (
+        not search
+        or not settings.SEARCH_STATEMENT_TIMEOUT_MS
+        or db.get_bind().dialect.name != "postgresql"
+    ):
+        yield
+        return
+    previous = db.execute(
+        text(
+            "SELECT current_setting('statement_timeout'), "
+            "set_config('statement_timeout', :timeout, true)"
+        ),
+        {"timeout": f"{settings.SEARCH_STATEMENT_TIMEOUT_MS}ms"},
+    ).first()[0]
+    try:
+        yield
+    except OperationalError as e:
+        if getattr(e.orig, "pgcode", None) != _QUERY_CANCELED:
+            raise
+        # The rollback also discards the transaction-local timeout
+        db.rollback()
+        raise SearchTimeoutError() from e
+    db.execute(
+        text("SELECT set_config('statement_timeout', :timeout, true)"),
+        {"timeout": previous},
+    )
+
+
+class SearchTimeoutError(Exception):
+    """Raised when a task search exceeds SEARCH_STATEMENT_TIMEOUT_MS."""
+
+    pass
+
+
 class DuplicateAssignmentError(Exception):
     """Raised when a volunteer is already actively assigned to a task."""
 
@@ -31,104 +102,200 @@ class TaskCRUD:
         db.refresh(task)
         return task
 
+    def bulk_create_tasks(
+        self, db: Session, tasks_data: List[TaskCreate], current_user_id: int
+    ) -> List[Task]:
+        """Create several tasks in one INSERT ... RETURNING, in input order."""
+        if not tasks_data:
+            return []
+        rows = [
+            Task(
+                **data.model_dump(exclude={"created_by_id"}),
+                created_by_id=current_user_id,
+            ).model_dump(exclude={"id"})
+            for data in tasks_data
+        ]
+        tasks = db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True), rows
+        ).all()
+        db.commit()
+        return tasks
+
     def get_task(self, db: Session, task_id: int) -> Optional[Task]:
         """Get task by ID."""
         return db.get(Task, task_id)
 
-    def get_tasks(
+    def _task_filters(
         self,
         db: Session,
-        skip: int = 0,
-        limit: int = 100,
         project_id: Optional[int] = None,
         status: Optional[str] = None,
         priority: Optional[str] = None,
         assigned_to_id: Optional[int] = None,
         suitable_for_volunteers: Optional[bool] = None,
         search: Optional[str] = None,
-    ) -> List[Task]:
-        """Get tasks with filtering options."""
-        query = select(Task)
-
+    ) -> list:
+        """WHERE conditions shared by the task list and count queries."""
+        conditions = []
         if project_id:
-            query = query.where(Task.project_id == project_id)
+            conditions.append(Task.project_id == project_id)
         if status:
-            query = query.where(Task.status == status)
+            conditions.append(Task.status == status)
         if priority:
-            query = query.where(Task.priority == priority)
+            conditions.append(Task.priority == priority)
         if assigned_to_id:
-            query = query.where(Task.assigned_to_id == assigned_to_id)
+            conditions.append(Task.assigned_to_id == assigned_to_id)
         if suitable_for_volunteers is not None:
-            query = query.where(Task.suitable_for_volunteers == suitable_for_volunteers)
-        if search:
-            query = query.where(
+            conditions.append(Task.suitable_for_volunteers == suitable_for_volunteers)
+        ts_query = _task_search_query(db, search)
+        if ts_query is not None:
+            conditions.append(_TASK_SEARCH_TSV.op("@@")(ts_query))
+        elif search:
+            conditions.append(
                 or_(
                     Task.title.ilike(f"%{search}%"),
                     Task.description.ilike(f"%{search}%"),
                 )
             )
+        return conditions
 
-        query = query.offset(skip).limit(limit).order_by(Task.created_at.desc())
-        return db.exec(query).all()
+    def _task_order(self, db: Session, search: Optional[str], ranked: bool = True) -> list:
+        """Newest first, or best full-text match first when ranking applies."""
+        order = [Task.created_at.desc(), Task.id.desc()]
+        ts_query = _task_search_query(db, search)
+        if ranked and ts_query is not None:
+            order.insert(0, func.ts_rank_cd(_TASK_SEARCH_TSV, ts_query).desc())
+        return order
 
-    def count_tasks(
+    def get_tasks(
         self,
         db: Session,
+        skip: int = 0,
+        limit: int = 100,
         project_id: Optional[int] = None,
         status: Optional[str] = None,
         priority: Optional[str] = None,
         assigned_to_id: Optional[int] = None,
         suitable_for_volunteers: Optional[bool] = None,
         search: Optional[str] = None,
-    ) -> int:
-        """Count tasks with filtering options (for pagination)."""
-        query = select(func.count(Task.id))
+        before: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Task]:
+        """
+        Get tasks with filtering options, newest first.
+        Multi-word searches on PostgreSQL are ranked by relevance instead;
+        page those with skip. Pass before=(created_at, id) of the last task
+        seen for keyset pagination of newest-first results; skip is then
+        ignored.
+        """
+        conditions = self._task_filters(
+            db, project_id, status, priority, assigned_to_id, suitable_for_volunteers, search
+        )
+        query = select(Task).where(*conditions)
 
-        if project_id:
-            query = query.where(Task.project_id == project_id)
-        if status:
-            query = query.where(Task.status == status)
-        if priority:
-            query = query.where(Task.priority == priority)
-        if assigned_to_id:
-            query = query.where(Task.assigned_to_id == assigned_to_id)
-        if suitable_for_volunteers is not None:
-            query = query.where(Task.suitable_for_volunteers == suitable_for_volunteers)
-        if search:
-            query = query.where(
-                or_(
-                    Task.title.ilike(f"%{search}%"),
-                    Task.description.ilike(f"%{search}%"),
-                )
+        if before is not None:
+            query = query.where(tuple_(Task.created_at, Task.id) < before)
+        else:
+            query = query.offset(skip)
+
+        order = self._task_order(db, search, ranked=before is None)
+        query = query.limit(limit).order_by(*order)
+        with _limit_search_time(db, search):
+            return db.exec(query).all()
+
+    def get_tasks_with_total(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        assigned_to_id: Optional[int] = None,
+        suitable_for_volunteers: Optional[bool] = None,
+        search: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Task], Optional[int]]:
+        """
+        Get a page of tasks plus the filtered total, counted with a
+        COUNT(*) OVER () window on the same query instead of a second one.
+        With include_total=False no count runs and the total is None;
+        ask for one extra row to learn whether another page exists.
+        """
+        if not include_total:
+            tasks = self.get_tasks(
+                db, skip, limit, project_id, status, priority,
+                assigned_to_id, suitable_for_volunteers, search,
             )
+            return tasks, None
 
-        return db.exec(query).one()
+        conditions = self._task_filters(
+            db, project_id, status, priority, assigned_to_id, suitable_for_volunteers, search
+        )
+        query = (
+            select(Task, func.count().over().label("total_count"))
+            .where(*conditions)
+            .offset(skip)
+            .limit(limit)
+            .order_by(*self._task_order(db, search))
+        )
+        with _limit_search_time(db, search):
+            rows = db.exec(query).all()
+
+            tasks = [task for task, _ in rows]
+            if rows:
+                return tasks, rows[0].total_count
+            # Page past the end: the window count is unavailable without rows
+            return tasks, db.exec(select(func.count(Task.id)).where(*conditions)).one() if skip else 0
+
+    def count_tasks(
+        self,
+        db: Session,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        assigned_to_id: Optional[int] = None,
+        suitable_for_volunteers: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> int:
+        """
+        Count tasks with filtering options.
+        Paged listings should use get_tasks_with_total instead.
+        """
+        conditions = self._task_filters(
+            db, project_id, status, priority, assigned_to_id, suitable_for_volunteers, search
+        )
+        with _limit_search_time(db, search):
+            return db.exec(select(func.count(Task.id)).where(*conditions)).one()
 
     def update_task(
         self, db: Session, task_id: int, task_data: TaskUpdate
     ) -> Optional[Task]:
-        """Update task."""
-        task = db.get(Task, task_id)
-        if not task:
-            return None
-
+        """Update task in one UPDATE ... RETURNING."""
         update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-
-        task.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(task)
+        if not update_data:
+            return self.get_task(db, task_id)
+        task = db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**update_data)
+            .returning(Task)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if task:
+            db.commit()
         return task
 
     def delete_task(self, db: Session, task_id: int) -> bool:
         """Delete task (mark as cancelled)."""
-        task = db.get(Task, task_id)
-        if not task:
+        cancelled_id = db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(status="cancelled")
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if cancelled_id is None:
             return False
-
-        task.status = "cancelled"
-        task.updated_at = datetime.utcnow()
         db.commit()
         return True
 
@@ -136,27 +303,39 @@ class TaskCRUD:
         self, db: Session, task_id: int
     ) -> Optional[Dict[str, Any]]:
         """Get task with all related details."""
-        task = db.get(Task, task_id)
-        if not task:
-            return None
-
-        # Get project info
-        project = db.get(Project, task.project_id)
+        assigned_user_alias = aliased(User)
+        creator_alias = aliased(User)
+        parent_alias = aliased(Task)
 
-        # Get assigned user info
-        assigned_user = None
-        if task.assigned_to_id:
-            assigned_user = db.get(User, task.assigned_to_id)
-
-        # Get creator info
-        creator = None
-        if task.created_by_id:
-            creator = db.get(User, task.created_by_id)
-
-        # Get parent task
-        parent_task = None
-        if task.parent_task_id:
-            parent_task = db.get(Task, task.parent_task_id)
+        # Task, project, assigned user, creator, parent and approved hours in one query
+        volunteer_hours_query = (
+            select(func.coalesce(func.sum(VolunteerTimeLog.hours), 0))
+            .where(
+                and_(
+                    VolunteerTimeLog.task_id == Task.id,
+                    VolunteerTimeLog.approved == True,
+                )
+            )
+            .scalar_subquery()
+        )
+        row = db.exec(
+            select(
+                Task,
+                Project,
+                assigned_user_alias,
+                creator_alias,
+                parent_alias,
+                volunteer_hours_query,
+            )
+            .outerjoin(Project, Task.project_id == Project.id)
+            .outerjoin(assigned_user_alias, Task.assigned_to_id == assigned_user_alias.id)
+            .outerjoin(creator_alias, Task.created_by_id == creator_alias.id)
+            .outerjoin(parent_alias, Task.parent_task_id == parent_alias.id)
+            .where(Task.id == task_id)
+        ).first()
+        if not row:
+            return None
+        task, project, assigned_user, creator, parent_task, volunteer_hours = row
 
         # Get subtasks
         subtasks = db.exec(select(Task).where(Task.parent_task_id == task_id)).all()
@@ -172,28 +351,30 @@ class TaskCRUD:
         )
         volunteer_data = db.exec(volunteer_assignments_query).all()
 
-        # Get dependencies
-        predecessor_deps = db.exec(
-            select(TaskDependency, Task)
-            .join(Task, TaskDependency.predecessor_task_id == Task.id)
-            .where(TaskDependency.successor_task_id == task_id)
-        ).all()
-
-        successor_deps = db.exec(
-            select(TaskDependency, Task)
-            .join(Task, TaskDependency.successor_task_id == Task.id)
-            .where(TaskDependency.predecessor_task_id == task_id)
-        ).all()
-
-        # Get volunteer hours for this task
-        volunteer_hours = db.exec(
-            select(func.coalesce(func.sum(VolunteerTimeLog.hours), 0)).where(
-                and_(
-                    VolunteerTimeLog.task_id == task_id,
-                    VolunteerTimeLog.approved == True,
-                )
+        # Get dependencies in both directions, joined to the task on the other side
+        dependency_rows = db.exec(
+            select(TaskDependency, Task).join(
+                Task,
+                or_(
+                    and_(
+                        TaskDependency.successor_task_id == task_id,
+                        Task.id == TaskDependency.predecessor_task_id,
+                    ),
+                    and_(
+                        TaskDependency.predecessor_task_id == task_id,
+                        Task.id == TaskDependency.successor_task_id,
+                    ),
+                ),
             )
-        ).first()
+        ).all()
+        predecessor_deps = [
+            (dep, other) for dep, other in dependency_rows
+            if dep.successor_task_id == task_id
+        ]
+        successor_deps = [
+            (dep, other) for dep, other in dependency_rows
+            if dep.predecessor_task_id == task_id
+        ]
 
         return {
             "task": task,
@@ -205,7 +386,7 @@ class TaskCRUD:
             "volunteer_assignments": volunteer_data,
             "predecessor_dependencies": predecessor_deps,
             "successor_dependencies": successor_deps,
-            "volunteer_hours": float(volunteer_hours or 0),
+            "volunteer_hours": float(volunteer_hours),
         }
 
     def get_project_tasks(self, db: Session, project_id: int) -> List[Task]:
@@ -235,82 +416,75 @@ class TaskCRUD:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """Get tasks suitable for volunteers, optionally filtered by volunteer skills."""
-        query = (
-            select(Task, Project)
-            .join(Project, Task.project_id == Project.id)
+        # Active assignments per task; an index lookup on the partial task_id index
+        assigned_count = (
+            select(func.count(TaskVolunteer.id))
             .where(
-                and_(
-                    Task.suitable_for_volunteers == True,
-                    Task.status.in_(["not_started", "in_progress"]),
-                    Task.volunteer_spots > 0,
-                )
+                and_(TaskVolunteer.task_id == Task.id, TaskVolunteer.is_active == True)
             )
+            .correlate(Task)
+            .scalar_subquery()
         )
 
-        # Get current volunteer assignments count
-        subquery = (
-            select(
-                TaskVolunteer.task_id,
-                func.count(TaskVolunteer.id).label("assigned_count"),
-            )
-            .where(TaskVolunteer.is_active == True)
-            .group_by(TaskVolunteer.task_id)
-            .subquery()
-        )
-
-        # Filter tasks that still have available spots
+        # Only tasks that still have available spots
         query = (
-            select(
-                Task,
-                Project,
-                func.coalesce(subquery.c.assigned_count, 0).label("assigned_count"),
-            )
+            select(Task, Project, assigned_count.label("assigned_count"))
             .join(Project, Task.project_id == Project.id)
-            .outerjoin(subquery, Task.id == subquery.c.task_id)
             .where(
                 and_(
                     Task.suitable_for_volunteers == True,
                     Task.status.in_(["not_started", "in_progress"]),
-                    Task.volunteer_spots > func.coalesce(subquery.c.assigned_count, 0),
+                    Task.volunteer_spots > assigned_count,
                 )
             )
             .offset(skip)
             .limit(limit)
         )
 
-        results = db.exec(query).all()
-
-        tasks_data = []
-        for task, project, assigned_count in results:
-            tasks_data.append(
-                {
-                    "task": task,
-                    "project": project,
-                    "assigned_volunteers": assigned_count or 0,
-                    "available_spots": task.volunteer_spots - (assigned_count or 0),
-                }
-            )
-
-        return tasks_data
+        return [
+            {
+                "task": task,
+                "project": project,
+                "assigned_volunteers": assigned_count,
+                "available_spots": task.volunteer_spots - assigned_count,
+            }
+            for task, project, assigned_count in db.exec(query)
+        ]
 
     def get_task_stats(
         self, db: Session, project_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get task statistics."""
-        base_query = select(Task)
-        if project_id:
-            base_query = base_query.where(Task.project_id == project_id)
-
-        # Total counts
-        total_tasks = db.exec(select(func.count(Task.id))).first()
+        open_statuses = ["not_started", "in_progress"]
+        today = date.today()
 
-        # Status counts
-        status_counts = {}
-        for status in ["not_started", "in_progress", "completed", "cancelled"]:
-            count = db.exec(
-                select(func.count(Task.id)).where(Task.status == status)
-            ).first()
-            status_counts[status] = count or 0
+        # Status counts, overdue, volunteer-suitable and hour totals in one pass
+        totals_query = select(
+            func.count(Task.id),
+            func.count(Task.id).filter(Task.status == "not_started"),
+            func.count(Task.id).filter(Task.status == "in_progress"),
+            func.count(Task.id).filter(Task.status == "completed"),
+            func.count(Task.id).filter(Task.status == "cancelled"),
+            func.count(Task.id).filter(
+                and_(Task.end_date < today, Task.status.in_(open_statuses))
+            ),
+            func.count(Task.id).filter(Task.suitable_for_volunteers == True),
+            func.coalesce(func.sum(Task.estimated_hours), 0),
+            func.coalesce(func.sum(Task.actual_hours), 0),
+        )
+        if project_id:
+            totals_query = totals_query.where(Task.project_id == project_id)
+        (
+            total_tasks,
+            not_started,
+            in_progress,
+            completed,
+            cancelled,
+            overdue_count,
+            volunteer_suitable_count,
+            estimated_hours,
+            actual_hours,
+        ) = db.exec(totals_query).one()
 
         # Priority counts
         priority_query = select(Task.priority, func.count(Task.id)).group_by(
@@ -332,45 +506,19 @@ class TaskCRUD:
             project_data = db.exec(project_query).all()
             tasks_by_project = {project: count for project, count in project_data}
 
-        # Overdue tasks
-        today = date.today()
-        overdue_count = db.exec(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.end_date < today,
-                    Task.status.in_(["not_started", "in_progress"]),
-                )
-            )
-        ).first()
-
-        # Volunteer suitable tasks
-        volunteer_suitable_count = db.exec(
-            select(func.count(Task.id)).where(Task.suitable_for_volunteers == True)
-        ).first()
-
-        # Hours statistics
-        estimated_hours = db.exec(
-            select(func.coalesce(func.sum(Task.estimated_hours), 0))
-        ).first()
-
-        actual_hours = db.exec(
-            select(func.coalesce(func.sum(Task.actual_hours), 0))
-        ).first()
-
-        # Completion rate
-        completed_tasks = status_counts.get("completed", 0)
-        completion_rate = (completed_tasks / max(total_tasks or 1, 1)) * 100
+        # COUNT never returns NULL and the SUMs are coalesced in SQL
+        completion_rate = (completed / max(total_tasks, 1)) * 100
 
         return {
-            "total_tasks": total_tasks or 0,
-            "not_started": status_counts.get("not_started", 0),
-            "in_progress": status_counts.get("in_progress", 0),
-            "completed": status_counts.get("completed", 0),
-            "cancelled": status_counts.get("cancelled", 0),
-            "overdue_tasks": overdue_count or 0,
-            "volunteer_suitable_tasks": volunteer_suitable_count or 0,
-            "total_estimated_hours": float(estimated_hours or 0),
-            "total_actual_hours": float(actual_hours or 0),
+            "total_tasks": total_tasks,
+            "not_started": not_started,
+            "in_progress": in_progress,
+            "completed": completed,
+            "cancelled": cancelled,
+            "overdue_tasks": overdue_count,
+            "volunteer_suitable_tasks": volunteer_suitable_count,
+            "total_estimated_hours": float(estimated_hours),
+            "total_actual_hours": float(actual_hours),
             "completion_rate": completion_rate,
             "tasks_by_priority": tasks_by_priority,
             "tasks_by_project": tasks_by_project,
@@ -381,91 +529,102 @@ class TaskVolunteerCRUD:
     def assign_volunteer(
         self, db: Session, task_id: int, volunteer_id: int
     ) -> Optional[TaskVolunteer]:
-        """Assign volunteer to task."""
-        # Check if there's any existing assignment (active or inactive)
-        # The database has a unique constraint on (task_id, volunteer_id),
-        # so we need to check for ANY existing assignment regardless of is_active status
-        existing = db.exec(
-            select(TaskVolunteer).where(
-                and_(
-                    TaskVolunteer.task_id == task_id,
-                    TaskVolunteer.volunteer_id == volunteer_id,
-                )
-            )
+        """
+        Assign volunteer to task.
+        Returns None if the task is not open to volunteers or has no spot
+        left; raises DuplicateAssignmentError if already actively assigned.
+        """
+        # Lock the task row so concurrent assignments take spots one at a time
+        task = db.exec(
+            select(Task).where(Task.id == task_id).with_for_update()
         ).first()
-
-        if existing:
-            if existing.is_active:
-                # Signal to the router that this is a conflict, not a generic error
-                raise DuplicateAssignmentError(
-                    "Volunteer is already assigned to this task."
-                )
-            else:
-                # Reactivate the existing assignment instead of creating a new one
-                existing.is_active = True
-                existing.removed_at = None
-                db.add(existing)
-                db.commit()
-                db.refresh(existing)
-                return existing
-
-        # Check if task has available spots
-        task = db.get(Task, task_id)
         if not task or not task.suitable_for_volunteers:
+            db.rollback()
             return None
 
-        current_assignments = db.exec(
-            select(func.count(TaskVolunteer.id)).where(
+        # Insert the assignment only while a spot is free. The table is unique
+        # on (task_id, volunteer_id), so a removed assignment is reactivated
+        # in place and an active one is left alone (no row returned).
+        active_count = (
+            select(func.count(TaskVolunteer.id))
+            .where(
                 and_(TaskVolunteer.task_id == task_id, TaskVolunteer.is_active == True)
             )
-        ).first()
-
-        if current_assignments >= task.volunteer_spots:
-            return None  # No available spots
-
-        # Wrap the INSERT to handle race conditions: two concurrent requests may
-        # both pass the pre-check above and then race to INSERT.  The DB unique
-        # constraint will reject the second attempt with an IntegrityError, which
-        # we catch here and convert to a clean DuplicateAssignmentError so no raw
-        # SQL details ever leak to the caller.
-        try:
-            assignment = TaskVolunteer(task_id=task_id, volunteer_id=volunteer_id)
-            db.add(assignment)
+            .scalar_subquery()
+        )
+        assignment = db.execute(
+            pg_insert(TaskVolunteer)
+            .from_select(
+                ["task_id", "volunteer_id"],
+                select(Task.id, literal(volunteer_id)).where(
+                    and_(Task.id == task_id, Task.volunteer_spots > active_count)
+                ),
+            )
+            .on_conflict_do_update(
+                index_elements=["task_id", "volunteer_id"],
+                set_={"is_active": True, "removed_at": None},
+                where=TaskVolunteer.is_active == False,
+            )
+            .returning(TaskVolunteer)
+        ).scalar_one_or_none()
+        if assignment:
             db.commit()
-            db.refresh(assignment)
             return assignment
-        except IntegrityError:
-            db.rollback()
+
+        # Nothing written: either already assigned or no spot left
+        already_assigned = db.exec(
+            select(TaskVolunteer.id).where(
+                and_(
+                    TaskVolunteer.task_id == task_id,
+                    TaskVolunteer.volunteer_id == volunteer_id,
+                    TaskVolunteer.is_active == True,
+                )
+            )
+        ).first()
+        db.rollback()
+        if already_assigned:
             raise DuplicateAssignmentError(
                 "Volunteer is already assigned to this task."
             )
+        return None
 
     def get_task_volunteers(self, db: Session, task_id: int) -> List[Dict[str, Any]]:
-        """Get volunteers assigned to a task."""
+        """
+        Get volunteers assigned to a task.
+        Only the volunteer and user columns callers show are selected,
+        not the full (wide) volunteer and user rows.
+        """
         query = (
-            select(TaskVolunteer, Volunteer, User)
+            select(
+                TaskVolunteer,
+                Volunteer.volunteer_id,
+                Volunteer.user_id,
+                User.name,
+                User.email,
+            )
             .join(Volunteer, TaskVolunteer.volunteer_id == Volunteer.id)
             .join(User, Volunteer.user_id == User.id)
             .where(
                 and_(TaskVolunteer.task_id == task_id, TaskVolunteer.is_active == True)
             )
         )
-        results = db.exec(query).all()
-
-        volunteers = []
-        for assignment, volunteer, user in results:
-            volunteers.append(
-                {"assignment": assignment, "volunteer": volunteer, "user": user}
-            )
-
-        return volunteers
+        return [
+            {
+                "assignment": assignment,
+                "volunteer_code": volunteer_code,
+                "user_id": user_id,
+                "user_name": user_name,
+                "user_email": user_email,
+            }
+            for assignment, volunteer_code, user_id, user_name, user_email in db.exec(query)
+        ]
 
     def get_volunteer_tasks(
         self, db: Session, volunteer_id: int
     ) -> List[Dict[str, Any]]:
-        """Get tasks assigned to a volunteer."""
+        """Get tasks assigned to a volunteer, with the project name only."""
         query = (
-            select(TaskVolunteer, Task, Project)
+            select(TaskVolunteer, Task, Project.name)
             .join(Task, TaskVolunteer.task_id == Task.id)
             .join(Project, Task.project_id == Project.id)
             .where(
@@ -476,13 +635,10 @@ class TaskVolunteerCRUD:
             )
             .order_by(Task.priority.desc(), Task.end_date.asc())
         )
-        results = db.exec(query).all()
-
-        tasks = []
-        for assignment, task, project in results:
-            tasks.append({"assignment": assignment, "task": task, "project": project})
-
-        return tasks
+        return [
+            {"assignment": assignment, "task": task, "project_name": project_name}
+            for assignment, task, project_name in db.exec(query)
+        ]
 
     def update_volunteer_assignment(
         self,
@@ -519,21 +675,21 @@ class TaskVolunteerCRUD:
 
     def remove_volunteer(self, db: Session, task_id: int, volunteer_id: int) -> bool:
         """Remove volunteer from task."""
-        assignment = db.exec(
-            select(TaskVolunteer).where(
+        removed_id = db.execute(
+            update(TaskVolunteer)
+            .where(
                 and_(
                     TaskVolunteer.task_id == task_id,
                     TaskVolunteer.volunteer_id == volunteer_id,
                     TaskVolunteer.is_active == True,
                 )
             )
-        ).first()
-
-        if not assignment:
+            .values(is_active=False, removed_at=utcnow())
+            .returning(TaskVolunteer.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if removed_id is None:
             return False
-
-        assignment.is_active = False
-        assignment.removed_at = datetime.utcnow()
         db.commit()
         return True
 
@@ -549,21 +705,49 @@ class TaskDependencyCRUD:
         db.refresh(dependency)
         return dependency
 
+    def create_dependencies(
+        self, db: Session, dependencies_data: List[TaskDependencyCreate]
+    ) -> List[TaskDependency]:
+        """Create several dependencies in one INSERT ... RETURNING, in input order."""
+        if not dependencies_data:
+            return []
+        rows = [
+            TaskDependency(**data.model_dump()).model_dump(exclude={"id"})
+            for data in dependencies_data
+        ]
+        dependencies = db.scalars(
+            insert(TaskDependency).returning(
+                TaskDependency, sort_by_parameter_order=True
+            ),
+            rows,
+        ).all()
+        db.commit()
+        return dependencies
+
     def get_task_dependencies(
         self, db: Session, task_id: int
     ) -> Dict[str, List[TaskDependency]]:
         """Get all dependencies for a task."""
-        # Predecessors (tasks this task depends on)
-        predecessors = db.exec(
-            select(TaskDependency).where(TaskDependency.successor_task_id == task_id)
-        ).all()
-
-        # Successors (tasks that depend on this task)
-        successors = db.exec(
-            select(TaskDependency).where(TaskDependency.predecessor_task_id == task_id)
+        # Both directions in one query (an index on each side), split in Python
+        dependencies = db.exec(
+            select(TaskDependency).where(
+                or_(
+                    TaskDependency.successor_task_id == task_id,
+                    TaskDependency.predecessor_task_id == task_id,
+                )
+            )
         ).all()
 
-        return {"predecessors": predecessors, "successors": successors}
+        return {
+            # Tasks this task depends on
+            "predecessors": [
+                dep for dep in dependencies if dep.successor_task_id == task_id
+            ],
+            # Tasks that depend on this task
+            "successors": [
+                dep for dep in dependencies if dep.predecessor_task_id == task_id
+            ],
+        }
 
     def get_dependency(
         self, db: Session, dependency_id: int
@@ -1,14 +1,32 @@
 # app/crud/user.py
 """User CRUD operations."""
+from sqlalchemy import lambda_stmt, text, tuple_, update
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select, func, or_
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
 from app.models.user import User, UserType
 from app.schemas.user import UserUpdate, UserCreate
 from app.core.auth import get_password_hash
 
 
+# Loose index scan: hop from one department to the next through
+# ix_users_department instead of reading every user row for DISTINCT.
+_DEPARTMENTS_LOOSE_SCAN_SQL = text("""
+    WITH RECURSIVE departments(department) AS (
+        SELECT MIN(department) FROM users WHERE department IS NOT NULL
+        UNION ALL
+        SELECT (
+            SELECT MIN(u.department) FROM users u
+            WHERE u.department > departments.department
+        )
+        FROM departments
+        WHERE departments.department IS NOT NULL
+    )
+    SELECT department FROM departments WHERE department IS NOT NULL
+""")
+
+
 class UserCRUD:
     """CRUD operations for User model."""
 
@@ -17,8 +35,10 @@ class UserCRUD:
         return db.get(User, user_id)
 
     def get_user_by_email(self, db: Session, email: str) -> Optional[User]:
-        """Get user by email."""
-        return db.exec(select(User).where(User.email == email)).first()
+        """Get user by email (login, registration and reset lookups)."""
+        # lambda_stmt caches the built statement; email becomes a bound parameter.
+        query = lambda_stmt(lambda: select(User).where(User.email == email))
+        return db.execute(query).scalars().first()
 
     def create_user(self, db: Session, user_data: UserCreate) -> User:
         """Create a new user (admin only)."""
@@ -57,50 +77,79 @@ class UserCRUD:
         search: Optional[str] = None,
         user_type_id: Optional[int] = None,
         is_active: Optional[bool] = None,
-        department: Optional[str] = None
-    ) -> tuple[List[User], int]:
+        department: Optional[str] = None,
+        after: Optional[Tuple[str, int]] = None,
+        include_total: bool = True
+    ) -> tuple[Sequence[User], Optional[int]]:
         """
-        Get users with optional filtering and search.
+        Get users with optional filtering and search, ordered by name.
+
+        Pass after=(name, id) of the last user seen for keyset pagination;
+        skip is then ignored and the total comes from a separate count.
+        With include_total=False no count runs and the total is None;
+        ask for one extra row to learn whether another page exists.
 
         Returns:
             Tuple of (users list, total count)
         """
-        # Build base query
-        query = select(User).join(UserType, User.user_type_id == UserType.id)
-        count_query = select(func.count(User.id)).join(UserType, User.user_type_id == UserType.id)
-
-        # Apply filters
+        # Build the filtered query once; the window count rides along with the page.
+        # Filters only touch users columns, so user types are loaded in one
+        # batched SELECT ... IN rather than joined into every page.
+        conditions = []
         if search:
             search_pattern = f"%{search}%"
-            search_filter = or_(
+            conditions.append(or_(
                 User.name.ilike(search_pattern),
                 User.email.ilike(search_pattern),
                 User.department.ilike(search_pattern),
                 User.employee_id.ilike(search_pattern)
-            )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
+            ))
 
         if user_type_id:
-            query = query.where(User.user_type_id == user_type_id)
-            count_query = count_query.where(User.user_type_id == user_type_id)
+            conditions.append(User.user_type_id == user_type_id)
 
         if is_active is not None:
-            query = query.where(User.is_active == is_active)
-            count_query = count_query.where(User.is_active == is_active)
+            conditions.append(User.is_active == is_active)
 
         if department:
-            query = query.where(User.department == department)
-            count_query = count_query.where(User.department == department)
-
-        # Get total count
-        total = db.exec(count_query).one()
+            conditions.append(User.department == department)
+
+        count_query = select(func.count(User.id)).where(*conditions)
+
+        if after is not None or not include_total:
+            # The window would only count rows past the position
+            query = (
+                select(User)
+                .options(selectinload(User.user_type))
+                .where(*conditions)
+                .limit(limit)
+                .order_by(User.name, User.id)
+            )
+            if after is not None:
+                query = query.where(tuple_(User.name, User.id) > after)
+            else:
+                query = query.offset(skip)
+            users = db.exec(query).all()
+            return users, db.exec(count_query).one() if include_total else None
+
+        query = (
+            select(User, func.count().over().label("total_count"))
+            .options(selectinload(User.user_type))
+            .where(*conditions)
+            .offset(skip)
+            .limit(limit)
+            .order_by(User.name, User.id)
+        )
+        rows = db.exec(query).all()
 
-        # Apply pagination and fetch results
-        query = query.offset(skip).limit(limit).order_by(User.name)
-        users = db.exec(query).all()
+        users = [user for user, _ in rows]
+        if rows:
+            return users, rows[0].total_count
+        if not skip:
+            return users, 0
 
-        return list(users), total
+        # Page past the end: the window count is unavailable without rows
+        return users, db.exec(count_query).one()
 
     def update_user(
         self, db: Session, user_id: int, user_data: UserUpdate
@@ -112,7 +161,6 @@ class UserCRUD:
 
         update_data = user_data.model_dump(exclude_unset=True)
         if update_data:
-            update_data["updated_at"] = datetime.utcnow()
             for key, value in update_data.items():
                 setattr(user, key, value)
 
@@ -122,38 +170,44 @@ class UserCRUD:
 
         return user
 
-    def deactivate_user(self, db: Session, user_id: int) -> bool:
-        """Deactivate user (soft delete)."""
-        user = self.get_user(db, user_id)
-        if not user:
+    def _set_active(self, db: Session, user_id: int, is_active: bool) -> bool:
+        """Flip is_active in one UPDATE ... RETURNING; False if the user is missing."""
+        updated_id = db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=is_active)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if updated_id is None:
             return False
-
-        user.is_active = False
-        user.updated_at = datetime.utcnow()
-        db.add(user)
         db.commit()
         return True
 
+    def deactivate_user(self, db: Session, user_id: int) -> bool:
+        """Deactivate user (soft delete)."""
+        return self._set_active(db, user_id, False)
+
     def activate_user(self, db: Session, user_id: int) -> bool:
         """Activate user."""
-        user = self.get_user(db, user_id)
-        if not user:
-            return False
-
-        user.is_active = True
-        user.updated_at = datetime.utcnow()
-        db.add(user)
-        db.commit()
-        return True
+        return self._set_active(db, user_id, True)
 
     def get_user_types(self, db: Session) -> List[UserType]:
         """Get all user types."""
         return db.exec(select(UserType)).all()
 
     def get_departments(self, db: Session) -> List[str]:
-        """Get list of unique departments."""
-        query = select(User.department).where(User.department.isnot(None)).distinct()
-        departments = db.exec(query).all()
+        """Get list of unique departments, in name order."""
+        if db.get_bind().dialect.name == "postgresql":
+            departments = db.execute(_DEPARTMENTS_LOOSE_SCAN_SQL).scalars().all()
+        else:
+            query = (
+                select(User.department)
+                .where(User.department.isnot(None))
+                .distinct()
+                .order_by(User.department)
+            )
+            departments = db.exec(query).all()
         return [dept for dept in departments if dept]
 
 
@@ -0,0 +1,31 @@
+# app/crud/utils.py
+from typing import Optional
+
+from sqlmodel import Session, select, func, and_, text
+
+
+# Below this many rows an exact COUNT(*) is cheap and the estimate is noisy
+_ESTIMATE_MIN_ROWS = 10_000
+
+
+def count_rows(db: Session, model_class, conditions: Optional[list] = None) -> int:
+    """
+    Count rows of a table.
+
+    Unfiltered counts on PostgreSQL use the planner estimate from
+    pg_class.reltuples (kept current by autovacuum/ANALYZE) once the table
+    is large, avoiding a full scan. Filtered counts, small tables and
+    other databases fall back to an exact COUNT(*).
+    """
+    if not conditions and db.get_bind().dialect.name == "postgresql":
+        estimate = db.exec(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name")
+            .bindparams(name=model_class.__tablename__)
+        ).scalar()
+        if estimate is not None and estimate >= _ESTIMATE_MIN_ROWS:
+            return int(estimate)
+
+    count_query = select(func.count()).select_from(model_class)
+    if conditions:
+        count_query = count_query.where(and_(*conditions))
+    return db.exec(count_query).one() or 0
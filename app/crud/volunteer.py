@@ -1,4 +1,5 @@
 # app/crud/volunteer.py
+from sqlalchemy.orm import contains_eager
 from sqlmodel import Session, select, func, and_, or_
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
@@ -102,31 +103,77 @@ class VolunteerCRUD:
         return True
     
     def get_volunteer_profile_with_details(self, db: Session, volunteer_id: int) -> Optional[Dict]:
-        """Get volunteer profile with user details and skills."""
+        """Get volunteer profile with user details and skills in one query."""
+        # One row per skill assignment; outer joins keep volunteers without skills
         query = (
-            select(Volunteer, User)
+            select(Volunteer, User, VolunteerSkillAssignment, VolunteerSkill)
             .join(User, Volunteer.user_id == User.id)
+            .outerjoin(
+                VolunteerSkillAssignment,
+                VolunteerSkillAssignment.volunteer_id == Volunteer.id
+            )
+            .outerjoin(VolunteerSkill, VolunteerSkillAssignment.skill_id == VolunteerSkill.id)
             .where(Volunteer.id == volunteer_id)
         )
-        result = db.exec(query).first()
-        if not result:
+        rows = db.exec(query).all()
+        if not rows:
             return None
         
-        volunteer, user = result
-        
-        # Get skills
-        skills_query = (
-            select(VolunteerSkillAssignment, VolunteerSkill)
-            .join(VolunteerSkill, VolunteerSkillAssignment.skill_id == VolunteerSkill.id)
-            .where(VolunteerSkillAssignment.volunteer_id == volunteer_id)
-        )
-        skills = db.exec(skills_query).all()
+        volunteer, user = rows[0][0], rows[0][1]
+        skills = [
+            (assignment, skill)
+            for _, _, assignment, skill in rows
+            if assignment is not None and skill is not None
+        ]
         
         return {
             "volunteer": volunteer,
             "user": user,
             "skills": skills
         }
+    
+    def get_volunteer_summary_details(
+        self, db: Session, volunteer_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Name, email, skill count and latest activity for several volunteers
+        in one query, keyed by volunteer ID. Used by list endpoints instead
+        of a profile lookup per volunteer.
+        """
+        if not volunteer_ids:
+            return {}
+        
+        skills_count = (
+            select(func.count(VolunteerSkillAssignment.id))
+            .join(VolunteerSkill, VolunteerSkillAssignment.skill_id == VolunteerSkill.id)
+            .where(VolunteerSkillAssignment.volunteer_id == Volunteer.id)
+            .correlate(Volunteer)
+            .scalar_subquery()
+        )
+        # Same ordering as get_volunteer_time_logs: most recent log date first
+        recent_activity = (
+            select(VolunteerTimeLog.created_at)
+            .where(VolunteerTimeLog.volunteer_id == Volunteer.id)
+            .order_by(VolunteerTimeLog.date.desc())
+            .limit(1)
+            .correlate(Volunteer)
+            .scalar_subquery()
+        )
+        query = (
+            select(Volunteer.id, User.name, User.email, skills_count, recent_activity)
+            .join(User, Volunteer.user_id == User.id)
+            .where(Volunteer.id.in_(volunteer_ids))
+        )
+        
+        return {
+            volunteer_id: {
+                "name": name,
+                "email": email,
+                "skills_count": count,
+                "recent_activity": activity
+            }
+            for volunteer_id, name, email, count, activity in db.exec(query)
+        }
 
 class VolunteerSkillCRUD:
     
@@ -214,10 +261,11 @@ class VolunteerSkillCRUD:
         return True
     
     def get_volunteer_skills(self, db: Session, volunteer_id: int) -> List[VolunteerSkillAssignment]:
-        """Get all skills for a volunteer."""
+        """Get all skills for a volunteer, with each skill loaded in the same query."""
         query = (
             select(VolunteerSkillAssignment)
             .join(VolunteerSkill, VolunteerSkillAssignment.skill_id == VolunteerSkill.id)
+            .options(contains_eager(VolunteerSkillAssignment.skill))
             .where(VolunteerSkillAssignment.volunteer_id == volunteer_id)
         )
         return db.exec(query).all()
@@ -1,5 +1,8 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import create_engine, SQLModel, Session
-from typing import Generator
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import AsyncGenerator, Generator
 import os
 
 from app.core.config import settings
@@ -13,7 +16,33 @@ engine = create_engine(
     pool_size=10,
     max_overflow=20,
     pool_pre_ping=True,
-    pool_recycle=3600
+    pool_recycle=3600,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
+
+# Async engine for routers that have moved to AsyncSession; same database,
+# asyncpg driver.
+async_engine = create_async_engine(
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    echo=True if os.getenv("DEBUG") else False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # PgBouncer in transaction mode hands each transaction a different
+    # server connection, so asyncpg's prepared statements can't be reused.
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if settings.DB_PGBOUNCER
+        else {}
+    ),
+)
+
+# expire_on_commit=False: expired attributes can't be lazily reloaded
+# outside an await, so keep loaded state after commit.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 def create_db_and_tables():
@@ -21,4 +50,14 @@ def create_db_and_tables():
 
 def get_db() -> Generator[Session, None, None]:
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """One unit of work per request: commit on success, roll back on error."""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -52,9 +52,10 @@ async def lifespan(app: FastAPI):
             from redis import Redis
             import redis.asyncio as redis_async
             from app.core.token_manager import initialize_redis_blacklist
+            from app.core.cache import initialize_redis_cache
             from app.core.rate_limiter import initialize_redis_rate_limiter
 
-            # Sync Redis client for token blacklist and rate limiter
+            # Sync Redis client for rate limiter
             redis_client = Redis.from_url(
                 settings.REDIS_URL, decode_responses=False, socket_connect_timeout=5
             )
@@ -63,15 +64,16 @@ async def lifespan(app: FastAPI):
             redis_client.ping()
 
             # Initialize Redis-backed services
-            initialize_redis_blacklist(redis_client)
             initialize_redis_rate_limiter(redis_client)
             logger.info("✓ Redis (sync) initialized successfully")
 
-            # Async Redis client for EventBus and real-time features
+            # Async Redis client for token blacklist, cache, EventBus and real-time features
             redis_async_client = redis_async.from_url(
                 settings.REDIS_URL, decode_responses=True, socket_connect_timeout=5
             )
             await redis_async_client.ping()
+            initialize_redis_blacklist(redis_async_client)
+            initialize_redis_cache(redis_async_client)
             logger.info("✓ Redis (async) initialized successfully")
         else:
             logger.info(
@@ -159,6 +161,11 @@ async def lifespan(app: FastAPI):
         await redis_async_client.close()
         logger.info("✓ Redis (async) connection closed")
 
+    # Close async database pool
+    from app.database.engine import async_engine
+    await async_engine.dispose()
+    logger.info("✓ Database (async) pool closed")
+
     logger.info("Application shutdown complete")
 
 
@@ -1,5 +1,6 @@
 # app/models/gamification.py
-from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON
+from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from decimal import Decimal
@@ -72,6 +73,7 @@ class Badge(SQLModel, table=True):
 class Achievement(SQLModel, table=True):
     """Achievement definitions with criteria"""
     __tablename__ = "achievements"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, unique=True, index=True)
@@ -81,6 +83,7 @@ class Achievement(SQLModel, table=True):
     # Criteria (stored as JSON for flexibility)
     # Example: {"hours_required": 100, "project_count": 5}
     criteria: Dict[str, Any] = Field(sa_column=Column(JSON))
+    default_target: Optional[Decimal] = Field(default=None, max_digits=10, decimal_places=2)  # Resolved from criteria on write
 
     # Rewards
     points_reward: int = Field(default=50, ge=0)
@@ -104,6 +107,10 @@ class Achievement(SQLModel, table=True):
 class VolunteerBadge(SQLModel, table=True):
     """Badges earned by volunteers"""
     __tablename__ = "volunteer_badges"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_vbadge_vol_badge", "volunteer_id", "badge_id", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     volunteer_id: int = Field(foreign_key="volunteers.id", index=True)
@@ -125,6 +132,10 @@ class VolunteerBadge(SQLModel, table=True):
 class VolunteerAchievement(SQLModel, table=True):
     """Achievements earned by volunteers"""
     __tablename__ = "volunteer_achievements"
+    __table_args__ = (
+        Index("ix_vach_vol_ach", "volunteer_id", "achievement_id", unique=True),
+        Index("ix_vach_vol_completed", "volunteer_id", "is_completed"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     volunteer_id: int = Field(foreign_key="volunteers.id", index=True)
@@ -176,6 +187,10 @@ class VolunteerPoints(SQLModel, table=True):
 class PointsHistory(SQLModel, table=True):
     """Audit trail for points changes"""
     __tablename__ = "points_history"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_phist_vol_created", "volunteer_id", text("created_at DESC")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     volunteer_points_id: int = Field(foreign_key="volunteer_points.id", index=True)
@@ -203,6 +218,18 @@ class PointsHistory(SQLModel, table=True):
 class Leaderboard(SQLModel, table=True):
     """Cached leaderboard snapshots for performance"""
     __tablename__ = "leaderboards"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # At most one current leaderboard per (type, timeframe)
+        Index(
+            "ix_leaderboard_current",
+            "leaderboard_type",
+            "timeframe",
+            unique=True,
+            postgresql_where=text("is_current"),
+        ),
+        Index("ix_lb_current_generated", "is_current", "generated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -216,7 +243,9 @@ class Leaderboard(SQLModel, table=True):
 
     # Rankings (stored as JSON for flexibility)
     # Example: [{"volunteer_id": 1, "rank": 1, "value": 1500, "volunteer_name": "John"}]
-    rankings: List[Dict[str, Any]] = Field(sa_column=Column(JSON))
+    rankings: List[Dict[str, Any]] = Field(
+        sa_column=Column(JSON().with_variant(JSONB, "postgresql"))
+    )
 
     # Cache metadata
     generated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
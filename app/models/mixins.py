@@ -5,11 +5,39 @@ This module provides reusable mixins for SQLModel models, including sync functio
 for offline-first applications.
 """
 
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy import DateTime
 from sqlmodel import Field
 from typing import Optional
 from datetime import datetime
 
 
+class utcnow(FunctionElement):
+    """
+    Current time in UTC as a naive timestamp, evaluated by the database.
+    Matches the naive datetime.utcnow() values the models store.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+def updated_at_column_kwargs() -> dict:
+    """sa_column_kwargs for an updated_at column the database keeps current."""
+    return {"server_default": utcnow(), "onupdate": utcnow()}
+
+
 class SyncMixin:
     """
     Mixin to add sync metadata to models for offline-first applications.
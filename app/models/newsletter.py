@@ -1,5 +1,6 @@
 # app/models/newsletter.py
-from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON
+from sqlalchemy import Enum as SAEnum
+from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON, Index, text
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -24,6 +25,7 @@ class CampaignStatus(str, Enum):
 
 class RecipientStatus(str, Enum):
     pending = "pending"
+    sending = "sending"
     sent = "sent"
     delivered = "delivered"
     opened = "opened"
@@ -32,6 +34,20 @@ class RecipientStatus(str, Enum):
     unsubscribed = "unsubscribed"
 
 
+def _status_column(enum: type, default: str) -> Column:
+    """
+    VARCHAR(20) status column, as created by migration 012.
+    native_enum=False keeps asyncpg from binding values as a PostgreSQL
+    enum type that does not exist in the database.
+    """
+    return Column(
+        SAEnum(enum, native_enum=False, length=20, create_constraint=False),
+        nullable=False,
+        index=True,
+        server_default=default,
+    )
+
+
 # Contact Form Submission
 class ContactSubmission(SQLModel, table=True):
     __tablename__ = "contact_submissions"
@@ -65,17 +81,31 @@ class NewsletterTag(SQLModel, table=True):
 # Newsletter Subscriber
 class Subscriber(SQLModel, table=True):
     __tablename__ = "newsletter_subscribers"
+    __table_args__ = (
+        # Only pending subscribers hold a confirmation token
+        Index(
+            "ix_newsletter_subscribers_confirmation_token",
+            "confirmation_token",
+            unique=True,
+            postgresql_where=text("confirmation_token IS NOT NULL"),
+        ),
+        # Keyset pagination of the admin listing (newest first)
+        Index("ix_newsletter_subscribers_created_at_id", "created_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(max_length=255, unique=True, index=True)
     name: Optional[str] = Field(default=None, max_length=100)
-    status: SubscriptionStatus = Field(default=SubscriptionStatus.pending, index=True)
+    status: SubscriptionStatus = Field(
+        default=SubscriptionStatus.pending,
+        sa_column=_status_column(SubscriptionStatus, "pending"),
+    )
 
     # Optional link to User model
     user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     # Double opt-in
-    confirmation_token: Optional[str] = Field(default=None, max_length=255, index=True)
+    confirmation_token: Optional[str] = Field(default=None, max_length=255)
     confirmation_expires: Optional[datetime] = Field(default=None)
     confirmed_at: Optional[datetime] = Field(default=None)
 
@@ -98,6 +128,9 @@ class Subscriber(SQLModel, table=True):
 # Junction table for Subscriber-Tag relationship
 class SubscriberTag(SQLModel, table=True):
     __tablename__ = "subscriber_tags"
+    __table_args__ = (
+        Index("ix_subscriber_tags_subscriber_tag", "subscriber_id", "tag_id", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     subscriber_id: int = Field(foreign_key="newsletter_subscribers.id", index=True)
@@ -144,7 +177,10 @@ class Campaign(SQLModel, table=True):
     template_id: Optional[int] = Field(default=None, foreign_key="email_templates.id")
 
     # Status and scheduling
-    status: CampaignStatus = Field(default=CampaignStatus.draft, index=True)
+    status: CampaignStatus = Field(
+        default=CampaignStatus.draft,
+        sa_column=_status_column(CampaignStatus, "draft"),
+    )
     scheduled_at: Optional[datetime] = Field(default=None, index=True)
     sent_at: Optional[datetime] = Field(default=None)
 
@@ -173,12 +209,21 @@ class Campaign(SQLModel, table=True):
 # Campaign Recipient for tracking individual sends
 class CampaignRecipient(SQLModel, table=True):
     __tablename__ = "campaign_recipients"
+    __table_args__ = (
+        # Keyset pagination of a campaign's recipients
+        Index("ix_campaign_recipients_campaign_id_id", "campaign_id", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     campaign_id: int = Field(foreign_key="newsletter_campaigns.id", index=True)
     subscriber_id: int = Field(foreign_key="newsletter_subscribers.id", index=True)
 
-    status: RecipientStatus = Field(default=RecipientStatus.pending, index=True)
+    status: RecipientStatus = Field(
+        default=RecipientStatus.pending,
+        sa_column=_status_column(RecipientStatus, "pending"),
+    )
+    # Set when a send worker claims the row; see get_pending_recipients
+    claimed_at: Optional[datetime] = Field(default=None)
     sent_at: Optional[datetime] = Field(default=None)
     delivered_at: Optional[datetime] = Field(default=None)
     opened_at: Optional[datetime] = Field(default=None)
@@ -1,10 +1,12 @@
 # app/models/project.py
-from sqlmodel import SQLModel, Field, Relationship, Column, Text
+from sqlmodel import SQLModel, Field, Relationship, Column, Text, Index, text
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 
+from app.models.mixins import updated_at_column_kwargs
+
 class ProjectCategory(str, Enum):
     reforestation = "reforestation"
     environmental_education = "environmental_education"
@@ -31,6 +33,12 @@ class ProjectPriority(str, Enum):
 
 class Project(SQLModel, table=True):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Status-filtered listings, newest first
+        Index("ix_projects_status_created_at", "status", "created_at"),
+        # Keyset pagination of the unfiltered listing
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200, index=True)
@@ -42,6 +50,8 @@ class Project(SQLModel, table=True):
     end_date: Optional[date] = Field(default=None, index=True)
     budget: Optional[Decimal] = Field(default=None, max_digits=12, decimal_places=2)
     actual_cost: Decimal = Field(default=Decimal("0.00"), max_digits=12, decimal_places=2)
+    # Sum of approved volunteer_time_logs.hours, kept by a PostgreSQL trigger (migration 034)
+    total_approved_hours: Decimal = Field(default=Decimal("0.00"), max_digits=12, decimal_places=2)
     location_name: Optional[str] = Field(default=None, max_length=100)
     latitude: Optional[Decimal] = Field(default=None, max_digits=10, decimal_places=8)
     longitude: Optional[Decimal] = Field(default=None, max_digits=11, decimal_places=8)
@@ -52,7 +62,10 @@ class Project(SQLModel, table=True):
     max_volunteers: Optional[int] = Field(default=None)
     volunteer_requirements: Optional[str] = Field(default=None, sa_column=Column(Text))
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs=updated_at_column_kwargs()
+    )
     
     # Relationships
     team_members: List["ProjectTeam"] = Relationship(back_populates="project")
@@ -64,6 +77,18 @@ class Project(SQLModel, table=True):
 
 class ProjectTeam(SQLModel, table=True):
     __tablename__ = "project_teams"
+    __table_args__ = (
+        # One active membership per user and project; also serves the
+        # active-team lookups by project_id
+        Index(
+            "ix_project_teams_active_member",
+            "project_id",
+            "user_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id", index=True)
@@ -79,6 +104,9 @@ class ProjectTeam(SQLModel, table=True):
 
 class Milestone(SQLModel, table=True):
     __tablename__ = "milestones"
+    __table_args__ = (
+        Index("ix_milestones_project_target_date", "project_id", "target_date"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id", index=True)
@@ -88,13 +116,24 @@ class Milestone(SQLModel, table=True):
     actual_date: Optional[date] = Field(default=None)
     status: str = Field(default="pending", max_length=20)  # pending, achieved, missed, cancelled
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs=updated_at_column_kwargs()
+    )
     
     # Relationships
     project: Project = Relationship(back_populates="milestones")
 
 class EnvironmentalMetric(SQLModel, table=True):
     __tablename__ = "environmental_metrics"
+    __table_args__ = (
+        # Scanned backwards for newest-first metric listings
+        Index(
+            "ix_environmental_metrics_project_measurement_date",
+            "project_id",
+            "measurement_date",
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id", index=True)
@@ -107,7 +146,10 @@ class EnvironmentalMetric(SQLModel, table=True):
     description: Optional[str] = Field(default=None, sa_column=Column(Text))
     recorded_by_id: Optional[int] = Field(default=None, foreign_key="users.id")
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs=updated_at_column_kwargs()
+    )
     
     # Relationships
     project: Project = Relationship(back_populates="environmental_metrics")
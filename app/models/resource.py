@@ -1,10 +1,12 @@
 # app/models/resource.py
-from sqlmodel import SQLModel, Field, Relationship, Column, Text
+from sqlmodel import SQLModel, Field, Relationship, Column, Text, Index, text
 from typing import Optional, List
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 
+from app.models.mixins import updated_at_column_kwargs
+
 class ResourceType(str, Enum):
     human = "human"
     equipment = "equipment"
@@ -13,6 +15,15 @@ class ResourceType(str, Enum):
 
 class Resource(SQLModel, table=True):
     __tablename__ = "resources"
+    __table_args__ = (
+        # Keyset pagination of the active-resource listing by name
+        Index(
+            "ix_resources_active_name_id",
+            "name",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100)
@@ -24,7 +35,10 @@ class Resource(SQLModel, table=True):
     location: Optional[str] = Field(default=None, max_length=100)
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs=updated_at_column_kwargs()
+    )
     
     # Relationships
     project_allocations: List["ProjectResource"] = Relationship(back_populates="resource")
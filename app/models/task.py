@@ -1,10 +1,12 @@
 # app/models/task.py
-from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON
+from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON, Index, text
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 
+from app.models.mixins import updated_at_column_kwargs
+
 class TaskStatus(str, Enum):
     not_started = "not_started"
     in_progress = "in_progress"
@@ -25,6 +27,20 @@ class DependencyType(str, Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of newest-first task listings
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # Per-project status and priority stats
+        Index("ix_tasks_project_status_priority", "project_id", "status", "priority"),
+        # Open volunteer-suitable tasks
+        Index("ix_tasks_volunteer_status", "suitable_for_volunteers", "status"),
+        # Overdue counts only look at open tasks
+        Index(
+            "ix_tasks_open_end_date",
+            "end_date",
+            postgresql_where=text("status IN ('not_started', 'in_progress')"),
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id", index=True)
@@ -44,7 +60,10 @@ class Task(SQLModel, table=True):
     required_skills: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     volunteer_spots: int = Field(default=0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs=updated_at_column_kwargs()
+    )
     
     # Relationships
     project: "Project" = Relationship(back_populates="tasks")
@@ -57,6 +76,14 @@ class Task(SQLModel, table=True):
 
 class TaskDependency(SQLModel, table=True):
     __tablename__ = "task_dependencies"
+    __table_args__ = (
+        # Predecessor lookups by successor; the unique pair covers the reverse
+        Index(
+            "ix_task_dependencies_successor",
+            "successor_task_id",
+            postgresql_include=["predecessor_task_id"],
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     predecessor_task_id: int = Field(foreign_key="tasks.id")
@@ -1,8 +1,10 @@
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlmodel import SQLModel, Field, Relationship, Column, JSON, Index, text
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from app.models.mixins import updated_at_column_kwargs
+
 
 class UserType(SQLModel, table=True):
     __tablename__ = "user_types"
@@ -22,6 +24,16 @@ class UserType(SQLModel, table=True):
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination of the name-ordered user listing
+        Index("ix_users_name_id", "name", "id"),
+        # Distinct department lookups walk this index
+        Index(
+            "ix_users_department",
+            "department",
+            postgresql_where=text("department IS NOT NULL"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100)
@@ -72,7 +84,10 @@ class User(SQLModel, table=True):
     # Timestamps
     last_login: Optional[datetime] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs=updated_at_column_kwargs()
+    )
 
     # Relationships
     preferences: Optional["UserPreferences"] = Relationship(
@@ -1,5 +1,5 @@
 # app/models/volunteer.py
-from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON
+from sqlmodel import SQLModel, Field, Relationship, Column, Text, JSON, Index, text, UniqueConstraint
 from typing import Optional, List, Dict, Any
 from datetime import datetime, time
 from decimal import Decimal
@@ -81,6 +81,21 @@ class VolunteerSkillAssignment(SQLModel, table=True):
 
 class VolunteerTimeLog(SQLModel, table=True):
     __tablename__ = "volunteer_time_logs"
+    __table_args__ = (
+        # Approved-hours totals per project
+        Index(
+            "ix_volunteer_time_logs_project_approved",
+            "project_id",
+            postgresql_where=text("approved"),
+        ),
+        # Approved-hours totals per task, answered from the index
+        Index(
+            "ix_volunteer_time_logs_task_approved",
+            "task_id",
+            postgresql_include=["hours"],
+            postgresql_where=text("approved"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     volunteer_id: int = Field(foreign_key="volunteers.id", index=True)
@@ -150,6 +165,15 @@ class VolunteerTrainingRecord(SQLModel, table=True):
 # Models for project integration (referenced in volunteer models)
 class TaskVolunteer(SQLModel, table=True):
     __tablename__ = "task_volunteers"
+    __table_args__ = (
+        UniqueConstraint("task_id", "volunteer_id"),
+        # Active-assignment counts per task
+        Index(
+            "ix_task_volunteers_task_active",
+            "task_id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     task_id: int = Field(foreign_key="tasks.id", index=True)
@@ -51,7 +51,7 @@ async def login(
     # Check if user is already logged in with valid token
     if authorization and authorization.startswith("Bearer "):
         token = authorization.split(" ")[1]
-        token_data = verify_token(token)
+        token_data = await verify_token(token)
         if token_data:
             existing_user = db.exec(select(User).where(User.id == token_data.user_id)).first()
             if existing_user and existing_user.is_active and existing_user.email == login_data.email:
@@ -96,8 +96,8 @@ async def login(
     
     # Create tokens
     token_data = {"sub": user.id, "email": user.email}
-    access_token = create_access_token(token_data)
-    refresh_token = create_refresh_token(token_data)
+    access_token = await create_access_token(token_data)
+    refresh_token = await create_refresh_token(token_data)
     
     # Store refresh token hash
     user.refresh_token_hash = get_password_hash(refresh_token)
@@ -157,7 +157,7 @@ async def refresh_token(
     db: Session = Depends(get_db)
 ):
     # Verify refresh token
-    token_data = verify_token(refresh_data.refresh_token, token_type="refresh")
+    token_data = await verify_token(refresh_data.refresh_token, token_type="refresh")
     if not token_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -188,8 +188,8 @@ async def refresh_token(
     
     # Create new tokens
     new_token_data = {"sub": user.id, "email": user.email}
-    access_token = create_access_token(new_token_data)
-    new_refresh_token = create_refresh_token(new_token_data)
+    access_token = await create_access_token(new_token_data)
+    new_refresh_token = await create_refresh_token(new_token_data)
     
     # Update stored refresh token
     user.refresh_token_hash = get_password_hash(new_refresh_token)
@@ -376,7 +376,7 @@ async def get_auth_status(
         }
     
     token = authorization.split(" ")[1]
-    token_data = verify_token(token)
+    token_data = await verify_token(token)
     
     if not token_data:
         return {
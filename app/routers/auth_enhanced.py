@@ -55,6 +55,7 @@ from app.core.oauth import (
 )
 from app.models.user import User, UserType
 from app.models.volunteer import Volunteer
+from app.crud.user import user_crud
 from app.crud.volunteer import volunteer_crud
 from app.schemas.volunteer import VolunteerCreate
 from app.schemas.auth import (
@@ -118,7 +119,7 @@ async def login(
         )
 
     # Find user by email
-    user = db.exec(select(User).where(User.email == login_data.email)).first()
+    user = user_crud.get_user_by_email(db, login_data.email)
 
     if not user:
         audit_logger.log_login_failed(
@@ -189,7 +190,7 @@ async def login(
     reset_login_rate_limit(ip_address or "unknown")
 
     # Create tokens with audit logging
-    access_token, refresh_token, token_family = log_and_create_tokens(
+    access_token, refresh_token, token_family = await log_and_create_tokens(
         user_id=user.id, email=user.email, ip_address=ip_address, user_agent=user_agent
     )
 
@@ -242,7 +243,7 @@ async def refresh_token(
         )
 
     # Verify refresh token
-    token_data = verify_token(refresh_data.refresh_token, token_type="refresh")
+    token_data = await verify_token(refresh_data.refresh_token, token_type="refresh")
     if not token_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
@@ -267,7 +268,7 @@ async def refresh_token(
     if not verify_password(refresh_data.refresh_token, user.refresh_token_hash):
         # Token reuse detected - revoke entire family
         if token_data.token_family:
-            revoked_count = revoke_refresh_token_family(token_data.token_family)
+            revoked_count = await revoke_refresh_token_family(token_data.token_family)
             audit_logger.log_token_reuse_detected(
                 user_id=user.id,
                 token_family=token_data.token_family,
@@ -287,10 +288,10 @@ async def refresh_token(
 
     # Revoke old refresh token (add to blacklist)
     if token_data.jti:
-        revoke_token(token_data.jti, user.refresh_token_expires)
+        await revoke_token(token_data.jti, user.refresh_token_expires)
 
     # Create new tokens (rotate refresh token, keep same family)
-    access_token, new_refresh_token, token_family = log_and_create_tokens(
+    access_token, new_refresh_token, token_family = await log_and_create_tokens(
         user_id=user.id,
         email=user.email,
         ip_address=ip_address,
@@ -333,7 +334,7 @@ async def logout(
     audit_logger = get_audit_logger()
 
     # Revoke all user tokens
-    revoked_count = revoke_all_user_tokens(current_user.id)
+    revoked_count = await revoke_all_user_tokens(current_user.id)
 
     # Clear refresh token from database
     current_user.refresh_token_hash = None
@@ -366,7 +367,7 @@ async def logout_all_devices(
     audit_logger = get_audit_logger()
 
     # Revoke all user tokens
-    revoked_count = revoke_all_user_tokens(current_user.id)
+    revoked_count = await revoke_all_user_tokens(current_user.id)
 
     # Clear refresh token from database
     current_user.refresh_token_hash = None
@@ -451,9 +452,7 @@ async def register(
         )
 
     # Check if user already exists
-    existing_user = db.exec(
-        select(User).where(User.email == register_data.email)
-    ).first()
+    existing_user = user_crud.get_user_by_email(db, register_data.email)
     if existing_user:
         # Don't reveal if email exists (prevent enumeration)
         audit_logger.log_event(
@@ -608,7 +607,7 @@ async def resend_verification(
     ip_address = get_client_ip(request)
     audit_logger = get_audit_logger()
 
-    user = db.exec(select(User).where(User.email == request_data.email)).first()
+    user = user_crud.get_user_by_email(db, request_data.email)
 
     if not user:
         # Don't reveal if email exists or not
@@ -676,7 +675,7 @@ async def forgot_password(
             headers={"Retry-After": str(e.retry_after)},
         )
 
-    user = db.exec(select(User).where(User.email == reset_data.email)).first()
+    user = user_crud.get_user_by_email(db, reset_data.email)
 
     if user:
         # Generate reset token
@@ -755,7 +754,7 @@ async def reset_password(
     user.token_family = None
 
     # Revoke all existing tokens
-    revoke_all_user_tokens(user.id)
+    await revoke_all_user_tokens(user.id)
 
     db.commit()
 
@@ -822,7 +821,7 @@ async def change_password(
     current_user.token_family = None
 
     # Revoke all existing tokens
-    revoke_all_user_tokens(current_user.id)
+    await revoke_all_user_tokens(current_user.id)
 
     db.commit()
 
@@ -964,7 +963,7 @@ async def google_callback(
         )
 
     # Check if user exists
-    user = db.exec(select(User).where(User.email == email)).first()
+    user = user_crud.get_user_by_email(db, email)
 
     if user:
         # Existing user - update OAuth info if not set
@@ -1052,7 +1051,7 @@ async def google_callback(
         )
 
     # Create tokens with audit logging
-    access_token, refresh_token, token_family = log_and_create_tokens(
+    access_token, refresh_token, token_family = await log_and_create_tokens(
         user_id=user.id, email=user.email, ip_address=ip_address, user_agent=user_agent
     )
 
@@ -1081,7 +1080,7 @@ async def get_auth_status(
         return {"authenticated": False, "user": None, "message": "No token provided"}
 
     token = authorization.split(" ")[1]
-    token_data = verify_token(token)
+    token_data = await verify_token(token)
 
     if not token_data:
         return {"authenticated": False, "user": None, "message": "Invalid token"}
@@ -10,7 +10,7 @@ from app.database.engine import get_db
 from app.core.deps import get_current_user, get_optional_user
 from app.models.user import User
 from app.models.blog import BlogPostStatus
-from app.crud.blog import blog_crud
+from app.crud.blog import blog_crud, encode_post_cursor, decode_post_cursor
 from app.schemas.blog import (
     # Blog Post schemas
     BlogPostCreate,
@@ -107,6 +107,8 @@ def get_blog_posts(
     tag: Optional[str] = None,
     author_id: Optional[int] = None,
     search: Optional[str] = None,
+    with_total: bool = Query(True),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
@@ -121,12 +123,19 @@ def get_blog_posts(
     - search: Search in title, excerpt, and content
     - skip: Number of posts to skip (pagination)
     - limit: Maximum number of posts to return (max 100)
+    - with_total: Set false to skip counting; total is then null
+    - cursor: next_cursor from a previous page (keyset pagination; skip is ignored)
 
     **Permissions**:
     - Published posts: Anyone (including unauthenticated)
     - Draft posts: Admin users only
     """
     try:
+        try:
+            position = decode_post_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
         # Determine if user can see drafts
         include_drafts = False
         if current_user and current_user.user_type.name == "admin":
@@ -142,6 +151,8 @@ def get_blog_posts(
             author_id=author_id,
             search=search,
             include_drafts=include_drafts,
+            with_total=with_total,
+            cursor=position,
         )
 
         # Build response with details
@@ -162,8 +173,14 @@ def get_blog_posts(
             )
             post_summaries.append(summary)
 
+        next_cursor = encode_post_cursor(posts[-1]) if len(posts) == limit else None
+
         return BlogPostListResponse(
-            items=post_summaries, total=total, skip=skip, limit=limit
+            items=post_summaries,
+            total=total,
+            skip=skip,
+            limit=limit,
+            next_cursor=next_cursor,
         )
 
     except HTTPException:
@@ -474,6 +491,7 @@ def create_category(
 def get_categories(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    with_total: bool = Query(True),
     db: Session = Depends(get_db),
 ):
     """
@@ -482,7 +500,9 @@ def get_categories(
     **Permissions**: Public (no authentication required)
     """
     try:
-        categories, total = blog_crud.get_categories(db, skip=skip, limit=limit)
+        categories, total = blog_crud.get_categories(
+            db, skip=skip, limit=limit, with_total=with_total
+        )
 
         # Add post counts
         categories_with_counts = []
@@ -650,6 +670,7 @@ def create_tag(
 def get_tags(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    with_total: bool = Query(True),
     db: Session = Depends(get_db),
 ):
     """
@@ -658,7 +679,9 @@ def get_tags(
     **Permissions**: Public (no authentication required)
     """
     try:
-        tags, total = blog_crud.get_tags(db, skip=skip, limit=limit)
+        tags, total = blog_crud.get_tags(
+            db, skip=skip, limit=limit, with_total=with_total
+        )
 
         # Add post counts
         tags_with_counts = []
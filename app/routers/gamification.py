@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer
 from sqlmodel import Session, select
 from sqlalchemy import func
+from pydantic import TypeAdapter
 from typing import List, Optional
 from decimal import Decimal
 
@@ -23,7 +24,14 @@ from app.crud.gamification import (
     points_crud,
     leaderboard_crud,
 )
-from app.services.gamification_service import GamificationService
+from app.core.cache import get_or_set
+from app.services.gamification_service import (
+    GamificationService,
+    LEADERBOARD_CACHE_TTL,
+    TOP_VOLUNTEERS_CACHE_KEY,
+    TOP_VOLUNTEERS_CACHE_LIMIT,
+    leaderboard_cache_key,
+)
 from app.schemas.gamification import (
     # Badge schemas
     Badge,
@@ -77,6 +85,9 @@ def _ranking_get(ranking, key: str):
     return getattr(ranking, key, None)
 
 
+_global_rankings_adapter = TypeAdapter(List[GlobalRanking])
+
+
 router = APIRouter(
     prefix="/gamification",
     tags=["gamification"],
@@ -86,6 +97,20 @@ router = APIRouter(
 security = HTTPBearer()
 
 
+def _keyset(
+    before_created_at: Optional[datetime], before_id: Optional[int]
+) -> Optional[tuple[datetime, int]]:
+    """Build a (created_at, id) keyset position; both parts are required."""
+    if before_created_at is None and before_id is None:
+        return None
+    if before_created_at is None or before_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before_created_at and before_id must be provided together",
+        )
+    return before_created_at, before_id
+
+
 # ============================================================
 # BADGE ENDPOINTS
 # ============================================================
@@ -370,6 +395,12 @@ async def list_achievements(
     limit: int = Query(100, ge=1, le=100, description="Max records to return"),
     achievement_type: Optional[str] = Query(None, description="Filter by type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    before_created_at: Optional[datetime] = Query(
+        None, description="created_at of the last achievement seen (keyset pagination)"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="id of the last achievement seen (keyset pagination)"
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -384,6 +415,7 @@ async def list_achievements(
         achievement_type=achievement_type,
         is_active=is_active,
         include_secret=include_secret,
+        before=_keyset(before_created_at, before_id),
     )
     return achievements
 
@@ -755,6 +787,12 @@ async def get_points_history(
     volunteer_id: int,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Max records to return"),
+    before_created_at: Optional[datetime] = Query(
+        None, description="created_at of the last entry seen (keyset pagination)"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="id of the last entry seen (keyset pagination)"
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -773,7 +811,13 @@ async def get_points_history(
             detail="Not authorized to view this history",
         )
 
-    history = points_crud.get_points_history(db, volunteer_id, skip=skip, limit=limit)
+    history = points_crud.get_points_history(
+        db,
+        volunteer_id,
+        skip=skip,
+        limit=limit,
+        before=_keyset(before_created_at, before_id),
+    )
     return history
 
 
@@ -882,36 +926,41 @@ async def get_global_rankings(
     db: Session = Depends(get_db),
 ):
     """Get global rankings by points."""
-    top_volunteers = points_crud.get_top_volunteers(db, limit=limit)
-
-    rankings = []
-    for vp in top_volunteers:
-        volunteer = db.get(Volunteer, vp.volunteer_id)
-        if volunteer:
-            user = db.get(User, volunteer.user_id)
-            if user:
-                badges_count = volunteer_badge_crud.count_volunteer_badges(
-                    db, vp.volunteer_id
-                )
-                achievements_count = (
-                    volunteer_achievement_crud.count_completed_achievements(
+
+    def load() -> str:
+        top_volunteers = points_crud.get_top_volunteers(db, limit=TOP_VOLUNTEERS_CACHE_LIMIT)
+
+        rankings = []
+        for vp in top_volunteers:
+            volunteer = db.get(Volunteer, vp.volunteer_id)
+            if volunteer:
+                user = db.get(User, volunteer.user_id)
+                if user:
+                    badges_count = volunteer_badge_crud.count_volunteer_badges(
                         db, vp.volunteer_id
                     )
-                )
+                    achievements_count = (
+                        volunteer_achievement_crud.count_completed_achievements(
+                            db, vp.volunteer_id
+                        )
+                    )
 
-                rankings.append(
-                    GlobalRanking(
-                        rank=vp.rank or 0,
-                        volunteer_id=vp.volunteer_id,
-                        volunteer_name=user.name,
-                        volunteer_avatar=user.profile_picture,
-                        total_points=vp.total_points,
-                        badges_count=badges_count,
-                        achievements_count=achievements_count,
+                    rankings.append(
+                        GlobalRanking(
+                            rank=vp.rank or 0,
+                            volunteer_id=vp.volunteer_id,
+                            volunteer_name=user.name,
+                            volunteer_avatar=user.profile_picture,
+                            total_points=vp.total_points,
+                            badges_count=badges_count,
+                            achievements_count=achievements_count,
+                        )
                     )
-                )
 
-    return rankings
+        return _global_rankings_adapter.dump_json(rankings).decode()
+
+    cached = await get_or_set(TOP_VOLUNTEERS_CACHE_KEY, LEADERBOARD_CACHE_TTL, load)
+    return _global_rankings_adapter.validate_json(cached)[:limit]
 
 
 # ============================================================
@@ -926,47 +975,56 @@ async def get_leaderboard(
     db: Session = Depends(get_db),
 ):
     """Get leaderboard by type and timeframe. Public — no auth required."""
-    leaderboard = leaderboard_crud.get_current_leaderboard(
-        db, leaderboard_type, timeframe
-    )
-    if not leaderboard:
-        # No pre-generated leaderboard exists — generate it on demand
-        try:
-            if leaderboard_type == "points":
-                GamificationService.generate_points_leaderboard(db, timeframe)
-            elif leaderboard_type == "hours":
-                GamificationService.generate_hours_leaderboard(db, timeframe)
-            elif leaderboard_type == "projects":
-                GamificationService.generate_projects_leaderboard(db, timeframe)
-            else:
+
+    def load() -> Optional[str]:
+        leaderboard = leaderboard_crud.get_current_leaderboard(
+            db, leaderboard_type, timeframe
+        )
+        if not leaderboard:
+            # No pre-generated leaderboard exists — generate it on demand
+            try:
+                if leaderboard_type == "points":
+                    GamificationService.generate_points_leaderboard(db, timeframe)
+                elif leaderboard_type == "hours":
+                    GamificationService.generate_hours_leaderboard(db, timeframe)
+                elif leaderboard_type == "projects":
+                    GamificationService.generate_projects_leaderboard(db, timeframe)
+                else:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Invalid leaderboard type '{leaderboard_type}'. Must be points, hours, or projects.",
+                    )
+                leaderboard = leaderboard_crud.get_current_leaderboard(
+                    db, leaderboard_type, timeframe
+                )
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(
+                    "Failed to auto-generate leaderboard %s/%s: %s",
+                    leaderboard_type,
+                    timeframe,
+                    e,
+                )
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid leaderboard type '{leaderboard_type}'. Must be points, hours, or projects.",
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to generate leaderboard",
                 )
-            leaderboard = leaderboard_crud.get_current_leaderboard(
-                db, leaderboard_type, timeframe
-            )
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(
-                "Failed to auto-generate leaderboard %s/%s: %s",
-                leaderboard_type,
-                timeframe,
-                e,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate leaderboard",
-            )
 
-    if not leaderboard:
+        if not leaderboard:
+            return None
+        return Leaderboard.model_validate(leaderboard).model_dump_json()
+
+    cached = await get_or_set(
+        leaderboard_cache_key(leaderboard_type, timeframe), LEADERBOARD_CACHE_TTL, load
+    )
+    if cached is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No leaderboard data available for {leaderboard_type}/{timeframe}",
         )
 
-    return leaderboard
+    return Leaderboard.model_validate_json(cached)
 
 
 @router.post("/leaderboards/generate", response_model=dict)
@@ -983,6 +1041,7 @@ async def generate_leaderboards(
 
     try:
         count = GamificationService.update_all_leaderboards(db)
+        await GamificationService.invalidate_leaderboard_cache()
         return {"message": f"Successfully generated {count} leaderboards"}
     except Exception as e:
         logger.error(f"Error generating leaderboards: {e}")
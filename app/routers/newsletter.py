@@ -8,14 +8,16 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response, RedirectResponse
 from fastapi.security import HTTPBearer
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 
-from app.database.engine import get_db
+from app.database.engine import get_async_db
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.models.newsletter import SubscriptionStatus, CampaignStatus, RecipientStatus
-from app.crud.newsletter import newsletter_crud
+from app.crud.newsletter import (
+    newsletter_crud, encode_subscriber_cursor, decode_subscriber_cursor
+)
 from app.services.contact_service import contact_service
 from app.services.newsletter_service import newsletter_service
 from app.services.campaign_service import campaign_service
@@ -78,6 +80,13 @@ def require_admin(current_user: User) -> User:
     return current_user
 
 
+async def _subscriber_response(db: AsyncSession, subscriber) -> Subscriber:
+    """Build a Subscriber response; tags are loaded explicitly since
+    AsyncSession can't lazy-load them during validation."""
+    await db.refresh(subscriber, attribute_names=["tags"])
+    return Subscriber.model_validate(subscriber)
+
+
 # ========================================
 # CONTACT FORM ENDPOINTS (Public)
 # ========================================
@@ -85,7 +94,7 @@ def require_admin(current_user: User) -> User:
 
 @router.post("/contact", status_code=status.HTTP_201_CREATED)
 async def submit_contact_form(
-    data: ContactFormCreate, request: Request, db: Session = Depends(get_db)
+    data: ContactFormCreate, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Submit a contact form from the landing page.
@@ -125,11 +134,11 @@ async def submit_contact_form(
 
 
 @router.get("/contact/submissions", response_model=ContactSubmissionListResponse)
-def get_contact_submissions(
+async def get_contact_submissions(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     unread_only: bool = Query(False),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -139,7 +148,7 @@ def get_contact_submissions(
     """
     require_admin(current_user)
 
-    submissions, total = newsletter_crud.get_contact_submissions(
+    submissions, total = await newsletter_crud.get_contact_submissions(
         db, skip=skip, limit=limit, unread_only=unread_only
     )
 
@@ -152,9 +161,9 @@ def get_contact_submissions(
 
 
 @router.get("/contact/submissions/{submission_id}", response_model=ContactSubmission)
-def get_contact_submission(
+async def get_contact_submission(
     submission_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -164,7 +173,7 @@ def get_contact_submission(
     """
     require_admin(current_user)
 
-    submission = newsletter_crud.get_contact_submission(db, submission_id)
+    submission = await newsletter_crud.get_contact_submission(db, submission_id)
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
@@ -174,9 +183,9 @@ def get_contact_submission(
 @router.patch(
     "/contact/submissions/{submission_id}/read", response_model=ContactSubmission
 )
-def mark_submission_read(
+async def mark_submission_read(
     submission_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -186,7 +195,7 @@ def mark_submission_read(
     """
     require_admin(current_user)
 
-    submission = newsletter_crud.mark_submission_read(db, submission_id)
+    submission = await newsletter_crud.mark_submission_read(db, submission_id)
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
@@ -196,9 +205,9 @@ def mark_submission_read(
 @router.delete(
     "/contact/submissions/{submission_id}", status_code=status.HTTP_204_NO_CONTENT
 )
-def delete_contact_submission(
+async def delete_contact_submission(
     submission_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -208,7 +217,7 @@ def delete_contact_submission(
     """
     require_admin(current_user)
 
-    if not newsletter_crud.delete_contact_submission(db, submission_id):
+    if not await newsletter_crud.delete_contact_submission(db, submission_id):
         raise HTTPException(status_code=404, detail="Submission not found")
 
 
@@ -219,7 +228,7 @@ def delete_contact_submission(
 
 @router.post("/newsletter/subscribe", response_model=SubscribeResponse)
 async def subscribe_to_newsletter(
-    data: SubscribeRequest, request: Request, db: Session = Depends(get_db)
+    data: SubscribeRequest, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Subscribe to the newsletter (double opt-in).
@@ -255,13 +264,15 @@ async def subscribe_to_newsletter(
 
 
 @router.get("/newsletter/confirm/{token}", response_model=ConfirmationResponse)
-def confirm_subscription(token: str, db: Session = Depends(get_db)):
+async def confirm_subscription(
+    token: str, db: AsyncSession = Depends(get_async_db)
+):
     """
     Confirm newsletter subscription via token.
 
     **Permissions**: Public
     """
-    subscriber = newsletter_service.confirm_subscription(db, token)
+    subscriber = await newsletter_service.confirm_subscription(db, token)
 
     if not subscriber:
         raise HTTPException(
@@ -276,13 +287,15 @@ def confirm_subscription(token: str, db: Session = Depends(get_db)):
 
 
 @router.get("/newsletter/unsubscribe/{token}")
-def get_unsubscribe_page(token: str, db: Session = Depends(get_db)):
+async def get_unsubscribe_page(
+    token: str, db: AsyncSession = Depends(get_async_db)
+):
     """
     Get unsubscribe confirmation page info.
 
     **Permissions**: Public
     """
-    subscriber = newsletter_crud.get_subscriber_by_unsubscribe_token(db, token)
+    subscriber = await newsletter_crud.get_subscriber_by_unsubscribe_token(db, token)
 
     if not subscriber:
         raise HTTPException(status_code=404, detail="Invalid unsubscribe link")
@@ -295,7 +308,9 @@ def get_unsubscribe_page(token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/newsletter/unsubscribe/{token}", response_model=UnsubscribeResponse)
-async def unsubscribe_from_newsletter(token: str, db: Session = Depends(get_db)):
+async def unsubscribe_from_newsletter(
+    token: str, db: AsyncSession = Depends(get_async_db)
+):
     """
     Unsubscribe from newsletter via token.
 
@@ -319,41 +334,44 @@ async def unsubscribe_from_newsletter(token: str, db: Session = Depends(get_db))
 
 
 @router.get("/newsletter/subscribers", response_model=SubscriberListResponse)
-def get_subscribers(
+async def get_subscribers(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     status: Optional[SubscriptionStatus] = None,
     tag_id: Optional[int] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get all newsletter subscribers with filtering.
 
+    Pass next_cursor from a previous page as cursor for keyset
+    pagination (skip is then ignored).
+
     **Permissions**: Admin only
     """
     require_admin(current_user)
 
-    subscribers, total = newsletter_crud.get_subscribers(
-        db, skip=skip, limit=limit, status=status, tag_id=tag_id, search=search
+    try:
+        position = decode_subscriber_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    subscribers, total = await newsletter_crud.get_subscribers(
+        db, skip=skip, limit=limit, status=status, tag_id=tag_id, search=search,
+        cursor=position
     )
 
-    items = []
-    for s in subscribers:
-        tag_count = newsletter_crud.get_subscriber_tag_count(db, s.id)
-        items.append(
-            SubscriberSummary(
-                id=s.id,
-                email=s.email,
-                name=s.name,
-                status=s.status,
-                subscribed_at=s.subscribed_at,
-                tag_count=tag_count,
-            )
-        )
+    items = [SubscriberSummary.model_validate(s) for s in subscribers]
+    next_cursor = (
+        encode_subscriber_cursor(subscribers[-1]) if len(subscribers) == limit else None
+    )
 
-    return SubscriberListResponse(items=items, total=total, skip=skip, limit=limit)
+    return SubscriberListResponse(
+        items=items, total=total, skip=skip, limit=limit, next_cursor=next_cursor
+    )
 
 
 @router.post(
@@ -361,9 +379,9 @@ def get_subscribers(
     response_model=Subscriber,
     status_code=status.HTTP_201_CREATED,
 )
-def create_subscriber(
+async def create_subscriber(
     data: SubscriberCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -374,14 +392,14 @@ def create_subscriber(
     require_admin(current_user)
 
     # Check if already exists
-    existing = newsletter_crud.get_subscriber_by_email(db, data.email)
+    existing = await newsletter_crud.get_subscriber_by_email(db, data.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email is already subscribed",
         )
 
-    subscriber = newsletter_crud.create_subscriber(
+    subscriber = await newsletter_crud.create_subscriber(
         db=db,
         email=data.email,
         name=data.name,
@@ -389,13 +407,13 @@ def create_subscriber(
         tag_ids=data.tag_ids,
     )
 
-    return Subscriber.model_validate(subscriber)
+    return await _subscriber_response(db, subscriber)
 
 
 @router.get("/newsletter/subscribers/{subscriber_id}", response_model=Subscriber)
-def get_subscriber(
+async def get_subscriber(
     subscriber_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -405,18 +423,18 @@ def get_subscriber(
     """
     require_admin(current_user)
 
-    subscriber = newsletter_crud.get_subscriber(db, subscriber_id)
+    subscriber = await newsletter_crud.get_subscriber(db, subscriber_id)
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found")
 
-    return Subscriber.model_validate(subscriber)
+    return await _subscriber_response(db, subscriber)
 
 
 @router.patch("/newsletter/subscribers/{subscriber_id}", response_model=Subscriber)
-def update_subscriber(
+async def update_subscriber(
     subscriber_id: int,
     data: SubscriberUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -426,19 +444,19 @@ def update_subscriber(
     """
     require_admin(current_user)
 
-    subscriber = newsletter_crud.update_subscriber(db, subscriber_id, data)
+    subscriber = await newsletter_crud.update_subscriber(db, subscriber_id, data)
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found")
 
-    return Subscriber.model_validate(subscriber)
+    return await _subscriber_response(db, subscriber)
 
 
 @router.delete(
     "/newsletter/subscribers/{subscriber_id}", status_code=status.HTTP_204_NO_CONTENT
 )
-def delete_subscriber(
+async def delete_subscriber(
     subscriber_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -448,15 +466,15 @@ def delete_subscriber(
     """
     require_admin(current_user)
 
-    if not newsletter_crud.delete_subscriber(db, subscriber_id):
+    if not await newsletter_crud.delete_subscriber(db, subscriber_id):
         raise HTTPException(status_code=404, detail="Subscriber not found")
 
 
 @router.post("/newsletter/subscribers/{subscriber_id}/tags", response_model=Subscriber)
-def add_tags_to_subscriber(
+async def add_tags_to_subscriber(
     subscriber_id: int,
     data: AddTagsRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -466,21 +484,23 @@ def add_tags_to_subscriber(
     """
     require_admin(current_user)
 
-    subscriber = newsletter_crud.add_tags_to_subscriber(db, subscriber_id, data.tag_ids)
+    subscriber = await newsletter_crud.add_tags_to_subscriber(
+        db, subscriber_id, data.tag_ids
+    )
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found")
 
-    return Subscriber.model_validate(subscriber)
+    return await _subscriber_response(db, subscriber)
 
 
 @router.delete(
     "/newsletter/subscribers/{subscriber_id}/tags/{tag_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def remove_tag_from_subscriber(
+async def remove_tag_from_subscriber(
     subscriber_id: int,
     tag_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -490,7 +510,7 @@ def remove_tag_from_subscriber(
     """
     require_admin(current_user)
 
-    if not newsletter_crud.remove_tag_from_subscriber(db, subscriber_id, tag_id):
+    if not await newsletter_crud.remove_tag_from_subscriber(db, subscriber_id, tag_id):
         raise HTTPException(status_code=404, detail="Subscriber or tag not found")
 
 
@@ -500,8 +520,9 @@ def remove_tag_from_subscriber(
 
 
 @router.get("/newsletter/tags", response_model=NewsletterTagListResponse)
-def get_tags(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+async def get_tags(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
     Get all newsletter tags.
@@ -510,22 +531,21 @@ def get_tags(
     """
     require_admin(current_user)
 
-    tags, total = newsletter_crud.get_tags(db)
+    tags, total = await newsletter_crud.get_tags(db)
+    counts = await newsletter_crud.get_tag_subscriber_counts(db, [t.id for t in tags])
 
-    items = []
-    for t in tags:
-        count = newsletter_crud.get_tag_subscriber_count(db, t.id)
-        items.append(
-            NewsletterTag(
-                id=t.id,
-                name=t.name,
-                slug=t.slug,
-                description=t.description,
-                color=t.color,
-                created_at=t.created_at,
-                subscriber_count=count,
-            )
+    items = [
+        NewsletterTag(
+            id=t.id,
+            name=t.name,
+            slug=t.slug,
+            description=t.description,
+            color=t.color,
+            created_at=t.created_at,
+            subscriber_count=counts.get(t.id, 0),
         )
+        for t in tags
+    ]
 
     return NewsletterTagListResponse(items=items, total=total)
 
@@ -535,9 +555,9 @@ def get_tags(
     response_model=NewsletterTag,
     status_code=status.HTTP_201_CREATED,
 )
-def create_tag(
+async def create_tag(
     data: NewsletterTagCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -547,7 +567,7 @@ def create_tag(
     """
     require_admin(current_user)
 
-    tag = newsletter_crud.create_tag(db, data)
+    tag = await newsletter_crud.create_tag(db, data)
     return NewsletterTag(
         id=tag.id,
         name=tag.name,
@@ -560,10 +580,10 @@ def create_tag(
 
 
 @router.patch("/newsletter/tags/{tag_id}", response_model=NewsletterTag)
-def update_tag(
+async def update_tag(
     tag_id: int,
     data: NewsletterTagUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -573,11 +593,11 @@ def update_tag(
     """
     require_admin(current_user)
 
-    tag = newsletter_crud.update_tag(db, tag_id, data)
+    tag = await newsletter_crud.update_tag(db, tag_id, data)
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
 
-    count = newsletter_crud.get_tag_subscriber_count(db, tag.id)
+    count = await newsletter_crud.get_tag_subscriber_count(db, tag.id)
     return NewsletterTag(
         id=tag.id,
         name=tag.name,
@@ -590,9 +610,9 @@ def update_tag(
 
 
 @router.delete("/newsletter/tags/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_tag(
+async def delete_tag(
     tag_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -602,7 +622,7 @@ def delete_tag(
     """
     require_admin(current_user)
 
-    if not newsletter_crud.delete_tag(db, tag_id):
+    if not await newsletter_crud.delete_tag(db, tag_id):
         raise HTTPException(status_code=404, detail="Tag not found")
 
 
@@ -612,9 +632,9 @@ def delete_tag(
 
 
 @router.get("/newsletter/templates", response_model=EmailTemplateListResponse)
-def get_templates(
+async def get_templates(
     active_only: bool = Query(False),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -624,7 +644,7 @@ def get_templates(
     """
     require_admin(current_user)
 
-    templates, total = newsletter_crud.get_templates(db, active_only=active_only)
+    templates, total = await newsletter_crud.get_templates(db, active_only=active_only)
     return EmailTemplateListResponse(
         items=[EmailTemplate.model_validate(t) for t in templates], total=total
     )
@@ -635,9 +655,9 @@ def get_templates(
     response_model=EmailTemplate,
     status_code=status.HTTP_201_CREATED,
 )
-def create_template(
+async def create_template(
     data: EmailTemplateCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -647,14 +667,14 @@ def create_template(
     """
     require_admin(current_user)
 
-    template = newsletter_crud.create_template(db, data, current_user.id)
+    template = await newsletter_crud.create_template(db, data, current_user.id)
     return EmailTemplate.model_validate(template)
 
 
 @router.get("/newsletter/templates/{template_id}", response_model=EmailTemplate)
-def get_template(
+async def get_template(
     template_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -664,7 +684,7 @@ def get_template(
     """
     require_admin(current_user)
 
-    template = newsletter_crud.get_template(db, template_id)
+    template = await newsletter_crud.get_template(db, template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
 
@@ -672,10 +692,10 @@ def get_template(
 
 
 @router.patch("/newsletter/templates/{template_id}", response_model=EmailTemplate)
-def update_template(
+async def update_template(
     template_id: int,
     data: EmailTemplateUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -685,7 +705,7 @@ def update_template(
     """
     require_admin(current_user)
 
-    template = newsletter_crud.update_template(db, template_id, data)
+    template = await newsletter_crud.update_template(db, template_id, data)
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
 
@@ -695,9 +715,9 @@ def update_template(
 @router.delete(
     "/newsletter/templates/{template_id}", status_code=status.HTTP_204_NO_CONTENT
 )
-def delete_template(
+async def delete_template(
     template_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -707,7 +727,7 @@ def delete_template(
     """
     require_admin(current_user)
 
-    if not newsletter_crud.delete_template(db, template_id):
+    if not await newsletter_crud.delete_template(db, template_id):
         raise HTTPException(status_code=404, detail="Template not found")
 
 
@@ -717,11 +737,11 @@ def delete_template(
 
 
 @router.get("/newsletter/campaigns", response_model=CampaignListResponse)
-def get_campaigns(
+async def get_campaigns(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     status: Optional[CampaignStatus] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -731,25 +751,11 @@ def get_campaigns(
     """
     require_admin(current_user)
 
-    campaigns, total = newsletter_crud.get_campaigns(
+    campaigns, total = await newsletter_crud.get_campaigns(
         db, skip=skip, limit=limit, status=status
     )
 
-    items = [
-        CampaignSummary(
-            id=c.id,
-            name=c.name,
-            subject=c.subject,
-            status=c.status,
-            scheduled_at=c.scheduled_at,
-            sent_at=c.sent_at,
-            total_recipients=c.total_recipients,
-            total_opened=c.total_opened,
-            total_clicked=c.total_clicked,
-            created_at=c.created_at,
-        )
-        for c in campaigns
-    ]
+    items = [CampaignSummary.model_validate(c) for c in campaigns]
 
     return CampaignListResponse(items=items, total=total, skip=skip, limit=limit)
 
@@ -759,9 +765,9 @@ def get_campaigns(
     response_model=Campaign,
     status_code=status.HTTP_201_CREATED,
 )
-def create_campaign(
+async def create_campaign(
     data: CampaignCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -771,14 +777,14 @@ def create_campaign(
     """
     require_admin(current_user)
 
-    campaign = newsletter_crud.create_campaign(db, data, current_user.id)
+    campaign = await newsletter_crud.create_campaign(db, data, current_user.id)
     return Campaign.model_validate(campaign)
 
 
 @router.get("/newsletter/campaigns/{campaign_id}", response_model=Campaign)
-def get_campaign(
+async def get_campaign(
     campaign_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -788,7 +794,7 @@ def get_campaign(
     """
     require_admin(current_user)
 
-    campaign = newsletter_crud.get_campaign(db, campaign_id)
+    campaign = await newsletter_crud.get_campaign(db, campaign_id)
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
@@ -796,10 +802,10 @@ def get_campaign(
 
 
 @router.patch("/newsletter/campaigns/{campaign_id}", response_model=Campaign)
-def update_campaign(
+async def update_campaign(
     campaign_id: int,
     data: CampaignUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -809,7 +815,7 @@ def update_campaign(
     """
     require_admin(current_user)
 
-    campaign = newsletter_crud.update_campaign(db, campaign_id, data)
+    campaign = await newsletter_crud.update_campaign(db, campaign_id, data)
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -822,9 +828,9 @@ def update_campaign(
 @router.delete(
     "/newsletter/campaigns/{campaign_id}", status_code=status.HTTP_204_NO_CONTENT
 )
-def delete_campaign(
+async def delete_campaign(
     campaign_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -834,7 +840,7 @@ def delete_campaign(
     """
     require_admin(current_user)
 
-    if not newsletter_crud.delete_campaign(db, campaign_id):
+    if not await newsletter_crud.delete_campaign(db, campaign_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Campaign not found or cannot be deleted (not in draft status)",
@@ -842,10 +848,10 @@ def delete_campaign(
 
 
 @router.post("/newsletter/campaigns/{campaign_id}/schedule", response_model=Campaign)
-def schedule_campaign(
+async def schedule_campaign(
     campaign_id: int,
     data: CampaignScheduleRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -855,7 +861,9 @@ def schedule_campaign(
     """
     require_admin(current_user)
 
-    campaign = campaign_service.schedule_campaign(db, campaign_id, data.scheduled_at)
+    campaign = await campaign_service.schedule_campaign(
+        db, campaign_id, data.scheduled_at
+    )
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -868,7 +876,7 @@ def schedule_campaign(
 @router.post("/newsletter/campaigns/{campaign_id}/send-now", response_model=Campaign)
 async def send_campaign_now(
     campaign_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -889,9 +897,9 @@ async def send_campaign_now(
 
 
 @router.post("/newsletter/campaigns/{campaign_id}/cancel", response_model=Campaign)
-def cancel_campaign(
+async def cancel_campaign(
     campaign_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -901,7 +909,7 @@ def cancel_campaign(
     """
     require_admin(current_user)
 
-    campaign = newsletter_crud.cancel_campaign(db, campaign_id)
+    campaign = await newsletter_crud.cancel_campaign(db, campaign_id)
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -915,7 +923,7 @@ def cancel_campaign(
 async def send_test_email(
     campaign_id: int,
     data: CampaignTestRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -936,9 +944,9 @@ async def send_test_email(
 
 
 @router.get("/newsletter/campaigns/{campaign_id}/stats", response_model=CampaignStats)
-def get_campaign_stats(
+async def get_campaign_stats(
     campaign_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -948,7 +956,7 @@ def get_campaign_stats(
     """
     require_admin(current_user)
 
-    stats = campaign_service.get_campaign_stats(db, campaign_id)
+    stats = await campaign_service.get_campaign_stats(db, campaign_id)
     if not stats:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
@@ -959,28 +967,37 @@ def get_campaign_stats(
     "/newsletter/campaigns/{campaign_id}/recipients",
     response_model=CampaignRecipientListResponse,
 )
-def get_campaign_recipients(
+async def get_campaign_recipients(
     campaign_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     status: Optional[RecipientStatus] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get recipients for a campaign with their status.
 
+    Pass next_cursor from a previous page as cursor for keyset
+    pagination (skip is then ignored).
+
     **Permissions**: Admin only
     """
     require_admin(current_user)
 
-    recipients, total = newsletter_crud.get_campaign_recipients(
-        db, campaign_id, skip=skip, limit=limit, status=status
+    try:
+        after_id = int(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    recipients, total = await newsletter_crud.get_campaign_recipients(
+        db, campaign_id, skip=skip, limit=limit, status=status, after_id=after_id
     )
 
     items = []
     for r in recipients:
-        subscriber = newsletter_crud.get_subscriber(db, r.subscriber_id)
+        subscriber = r.subscriber
         items.append(
             CampaignRecipient(
                 id=r.id,
@@ -993,8 +1010,10 @@ def get_campaign_recipients(
             )
         )
 
+    next_cursor = str(recipients[-1].id) if len(recipients) == limit else None
+
     return CampaignRecipientListResponse(
-        items=items, total=total, skip=skip, limit=limit
+        items=items, total=total, skip=skip, limit=limit, next_cursor=next_cursor
     )
 
 
@@ -1004,7 +1023,9 @@ def get_campaign_recipients(
 
 
 @router.get("/newsletter/track/open/{token}")
-def track_email_open(token: str, request: Request, db: Session = Depends(get_db)):
+async def track_email_open(
+    token: str, request: Request, db: AsyncSession = Depends(get_async_db)
+):
     """
     Track email open (returns 1x1 transparent pixel).
 
@@ -1013,7 +1034,7 @@ def track_email_open(token: str, request: Request, db: Session = Depends(get_db)
     ip_address = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
 
-    pixel = campaign_service.track_open(
+    pixel = await campaign_service.track_open(
         db, token, ip_address=ip_address, user_agent=user_agent
     )
 
@@ -1021,8 +1042,8 @@ def track_email_open(token: str, request: Request, db: Session = Depends(get_db)
 
 
 @router.get("/newsletter/track/click/{token}")
-def track_link_click(
-    token: str, url: str, request: Request, db: Session = Depends(get_db)
+async def track_link_click(
+    token: str, url: str, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Track link click and redirect to destination.
@@ -1032,7 +1053,7 @@ def track_link_click(
     ip_address = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent")
 
-    redirect_url = campaign_service.track_click(
+    redirect_url = await campaign_service.track_click(
         db, token, url, ip_address=ip_address, user_agent=user_agent
     )
 
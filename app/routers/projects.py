@@ -1,9 +1,10 @@
 # app/routers/projects.py
 import logging
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer
-from sqlmodel import Session
+from sqlmodel import Session, select
 from typing import List, Optional
 
 from app.database.engine import get_db
@@ -31,6 +32,7 @@ from app.schemas.project import (
     ProjectTeamMember,
     # Milestone schemas
     MilestoneCreate,
+    MilestoneStatus,
     MilestoneUpdate,
     Milestone,
     # Environmental metrics schemas
@@ -40,7 +42,6 @@ from app.schemas.project import (
 )
 from app.schemas.common import PaginatedResponse, create_pagination_metadata
 from app.services.notification_service import NotificationService
-from app.services.analytics_service import track_project_progress
 from app.services.event_bus import EventType, get_event_bus
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,20 @@ router = APIRouter(
 security = HTTPBearer()
 
 
+def _keyset(
+    before_created_at: Optional[datetime], before_id: Optional[int]
+) -> Optional[tuple[datetime, int]]:
+    """Build a (created_at, id) keyset position; both parts are required."""
+    if before_created_at is None and before_id is None:
+        return None
+    if before_created_at is None or before_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before_created_at and before_id must be provided together",
+        )
+    return before_created_at, before_id
+
+
 def _can_manage_project(current_user: User, project) -> bool:
     """Project management scope: admin, assigned manager, or project creator."""
     return (
@@ -107,11 +122,18 @@ def get_projects(
     manager_id: Optional[int] = None,
     requires_volunteers: Optional[bool] = None,
     search: Optional[str] = None,
+    before_created_at: Optional[datetime] = Query(
+        None, description="created_at of the last project seen (keyset pagination)"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="id of the last project seen (keyset pagination)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get list of projects with filtering options."""
     try:
+        before = _keyset(before_created_at, before_id)
         projects = project_crud.get_projects(
             db,
             skip=skip,
@@ -121,22 +143,27 @@ def get_projects(
             manager_id=manager_id,
             requires_volunteers=requires_volunteers,
             search=search,
+            before=before,
+        )
+
+        # Managers, teams and task counts for the whole page in three queries
+        project_ids = [project.id for project in projects]
+        manager_ids = {p.project_manager_id for p in projects if p.project_manager_id}
+        managers = (
+            dict(db.exec(select(User.id, User.name).where(User.id.in_(manager_ids))).all())
+            if manager_ids
+            else {}
         )
+        teams = project_team_crud.get_teams_for_projects(db, project_ids)
+        task_counts = project_crud.get_task_counts_for_projects(db, project_ids)
 
         # Convert to summary format
         project_summaries = []
         for project in projects:
-            # Get project manager name
-            manager_name = None
-            if project.project_manager_id:
-                from app.models.user import User
-
-                manager = db.get(User, project.project_manager_id)
-                if manager:
-                    manager_name = manager.name
+            manager_name = managers.get(project.project_manager_id)
 
             # Get team size and volunteers count
-            team_data = project_team_crud.get_team_members(db, project.id)
+            team_data = teams[project.id]
             team_size = len(team_data)
             volunteers_count = len(
                 [tm for tm in team_data if tm["team_member"].is_volunteer]
@@ -144,9 +171,9 @@ def get_projects(
 
             # Calculate progress if has tasks
             progress = 0.0
-            details = project_crud.get_project_with_details(db, project.id)
-            if details and details["total_tasks"] > 0:
-                progress = (details["completed_tasks"] / details["total_tasks"]) * 100
+            total_tasks, completed_tasks = task_counts.get(project.id, (0, 0))
+            if total_tasks > 0:
+                progress = (completed_tasks / total_tasks) * 100
 
             summary = ProjectSummary(
                 id=project.id,
@@ -164,6 +191,7 @@ def get_projects(
                 team_size=team_size,
                 volunteers_count=volunteers_count,
                 progress_percentage=progress,
+                created_at=project.created_at,
             )
             project_summaries.append(summary)
 
@@ -291,7 +319,7 @@ def get_project(
                     **team_member.model_dump(),
                     name=user.name,
                     email=user.email,
-                    user_type=user_type.name if user_type else None,
+                    user_type=user_type,
                 )
             )
 
@@ -347,6 +375,8 @@ async def update_project(
         old_status = project.status
 
         updated_project = project_crud.update_project(db, project_id, project_data)
+        # Build the response now; notifications below commit and expire the row
+        response = Project(**updated_project.model_dump())
 
         # Notify team members about significant updates
         if project_data.status and project_data.status != old_status:
@@ -387,16 +417,7 @@ async def update_project(
             except Exception as e:
                 pass
 
-        # Track progress metrics if changed
-        if project_data.progress_percentage is not None:
-            try:
-                await track_project_progress(
-                    db, project_id, project_data.progress_percentage, current_user.id
-                )
-            except Exception as e:
-                pass
-
-        return Project(**updated_project.model_dump())
+        return response
 
     except HTTPException:
         raise
@@ -520,6 +541,13 @@ async def add_team_member(
 
         user = db.get(User, team_member.user_id)
         user_type = db.get(UserType, user.user_type_id)
+        # Build the response now; the notification below commits and expires the row
+        response = ProjectTeamMember(
+            **team_member.model_dump(),
+            name=user.name,
+            email=user.email,
+            user_type=user_type.name if user_type else None,
+        )
 
         # Notify the new team member
         await NotificationService.create_notification(
@@ -548,12 +576,7 @@ async def add_team_member(
         except Exception as e:
             pass
 
-        return ProjectTeamMember(
-            **team_member.model_dump(),
-            name=user.name,
-            email=user.email,
-            user_type=user_type.name if user_type else None,
-        )
+        return response
 
     except HTTPException:
         raise
@@ -754,14 +777,16 @@ async def update_milestone(
             )
 
         # Track old completion status
-        was_completed = milestone.is_completed
+        was_completed = milestone.status == MilestoneStatus.achieved
 
         updated_milestone = milestone_crud.update_milestone(
             db, milestone_id, milestone_data
         )
+        # Build the response now; notifications below commit and expire the row
+        response = Milestone(**updated_milestone.model_dump())
 
         # Notify team if milestone was just completed
-        if milestone_data.is_completed and not was_completed:
+        if milestone_data.status == MilestoneStatus.achieved and not was_completed:
             # Get all team members
             team_members = project_team_crud.get_project_team(db, milestone.project_id)
             users_to_notify = set()
@@ -799,7 +824,7 @@ async def update_milestone(
             except Exception as e:
                 pass
 
-        return Milestone(**updated_milestone.model_dump())
+        return response
 
     except HTTPException:
         raise
@@ -1016,6 +1041,9 @@ def get_project_tasks(
     ),
     priority: Optional[str] = Query(None, regex="^(low|medium|high|critical)$"),
     suitable_for_volunteers: Optional[bool] = None,
+    include_total: bool = Query(
+        True, description="Set false to skip counting; metadata.total is then null"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -1035,25 +1063,19 @@ def get_project_tasks(
         # Calculate skip offset
         skip = (page - 1) * page_size
 
-        # Get tasks for this project
-        tasks = task_crud.get_tasks(
+        # Get tasks for this project with the total count for pagination
+        tasks, total = task_crud.get_tasks_with_total(
             db,
             skip=skip,
-            limit=page_size,
-            project_id=project_id,
-            status=status,
-            priority=priority,
-            suitable_for_volunteers=suitable_for_volunteers,
-        )
-
-        # Get total count for pagination
-        total = task_crud.count_tasks(
-            db,
+            limit=page_size if include_total else page_size + 1,
             project_id=project_id,
             status=status,
             priority=priority,
             suitable_for_volunteers=suitable_for_volunteers,
+            include_total=include_total,
         )
+        has_next = len(tasks) > page_size
+        tasks = tasks[:page_size]
 
         # Convert to summary format
         task_summaries = []
@@ -1078,7 +1100,7 @@ def get_project_tasks(
             )
 
         # Create pagination metadata
-        metadata = create_pagination_metadata(total, page, page_size)
+        metadata = create_pagination_metadata(total, page, page_size, has_next)
 
         return PaginatedResponse[TaskSummary](data=task_summaries, metadata=metadata)
 
@@ -1192,7 +1214,7 @@ def get_project_resources(
     current_user: User = Depends(get_current_user),
 ):
     """Get all resources allocated to a specific project."""
-    from app.schemas.resource import ResourceAllocation
+    from app.schemas.resource import ProjectResourceAllocation
     from app.crud.resource import project_resource_crud
 
     try:
@@ -1206,18 +1228,15 @@ def get_project_resources(
         # Calculate skip offset
         skip = (page - 1) * page_size
 
-        # Get resource allocations for this project
-        allocations = project_resource_crud.get_project_allocations(
+        # Get resource allocations for this project, with the total count
+        allocations, total = project_resource_crud.get_project_allocations(
             db, project_id, skip=skip, limit=page_size
         )
 
-        # Get total count
-        total = project_resource_crud.count_project_allocations(db, project_id)
-
         # Create pagination metadata
         metadata = create_pagination_metadata(total, page, page_size)
 
-        return PaginatedResponse[ResourceAllocation](
+        return PaginatedResponse[ProjectResourceAllocation](
             data=allocations, metadata=metadata
         )
 
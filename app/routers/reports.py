@@ -123,9 +123,9 @@ def export_projects_csv(
     Export projects to CSV format.
     """
     try:
-        # Get projects
-        projects = project_crud.get_projects(
-            db, skip=0, limit=10000, status=status, category=category
+        # Stream projects in batches rather than loading them all at once
+        projects = project_crud.stream_projects(
+            db, limit=10000, status=status, category=category
         )
 
         # Create CSV in memory
@@ -65,12 +65,27 @@ def get_resources(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     resource_type: Optional[str] = None,
+    after_name: Optional[str] = Query(
+        None, description="name of the last resource seen (keyset pagination)"
+    ),
+    after_id: Optional[int] = Query(
+        None, description="id of the last resource seen (keyset pagination)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get list of resources."""
+    if (after_name is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_name and after_id must be provided together",
+        )
     resources = resource_crud.get_resources(
-        db, skip=skip, limit=limit, resource_type=resource_type
+        db,
+        skip=skip,
+        limit=limit,
+        resource_type=resource_type,
+        after=(after_name, after_id) if after_id is not None else None,
     )
     return [Resource(**r.model_dump()) for r in resources]
 
@@ -79,7 +94,11 @@ def get_resources(
 def get_resource_stats(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
-    """Get resource statistics."""
+    """
+    Get resource statistics.
+    total_allocations is approximate on large tables; the exact count for
+    a project is the total returned by /projects/{project_id}/resources.
+    """
     stats = resource_crud.get_resource_stats(db)
     return ResourceStats(**stats)
 
@@ -1,13 +1,17 @@
 # app/routers/tasks.py
 import logging
+from datetime import datetime
 
+from anyio import from_thread
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from typing import List, Optional, Dict
 
 from app.database.engine import get_db
+from app.core.cache import get_cache, get_or_set
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.models.analytics import NotificationType
@@ -16,6 +20,7 @@ from app.crud.task import (
     task_volunteer_crud,
     task_dependency_crud,
     DuplicateAssignmentError,
+    SearchTimeoutError,
 )
 from app.crud.project import project_crud
 
@@ -51,6 +56,25 @@ router = APIRouter(
 
 security = HTTPBearer()
 
+TASK_STATS_CACHE_TTL = 60  # seconds
+
+
+def task_stats_cache_key(project_id: Optional[int] = None) -> str:
+    """Cache key for task stats, overall or for one project."""
+    return f"task_stats:{project_id or 'all'}"
+
+
+async def invalidate_task_stats_cache(*project_ids: Optional[int]) -> None:
+    """
+    Drop the overall task stats and those of the given projects.
+    Plain def endpoints run in the threadpool and call this through
+    anyio's from_thread.run.
+    """
+    await get_cache().delete(
+        task_stats_cache_key(),
+        *(task_stats_cache_key(pid) for pid in project_ids if pid),
+    )
+
 
 def _can_manage_project(current_user: User, project) -> bool:
     """Project management scope: admin, assigned manager, or project creator."""
@@ -114,6 +138,7 @@ def create_task(
             )
 
         task = task_crud.create_task(db, task_data, current_user.id)
+        from_thread.run(invalidate_task_stats_cache, task.project_id)
         return Task(**task.model_dump())
 
     except HTTPException:
@@ -138,10 +163,25 @@ def get_tasks(
     assigned_to_id: Optional[int] = None,
     suitable_for_volunteers: Optional[bool] = None,
     search: Optional[str] = None,
+    before_created_at: Optional[datetime] = Query(
+        None, description="created_at of the last task seen (keyset pagination)"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="id of the last task seen (keyset pagination)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get list of tasks with filtering options."""
+    """
+    Get list of tasks with filtering options, newest first.
+    For deep pages pass before_created_at/before_id of the last task
+    seen instead of skip.
+    """
+    if (before_created_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before_created_at and before_id must be provided together",
+        )
     try:
         tasks = task_crud.get_tasks(
             db,
@@ -153,6 +193,7 @@ def get_tasks(
             assigned_to_id=assigned_to_id,
             suitable_for_volunteers=suitable_for_volunteers,
             search=search,
+            before=(before_created_at, before_id) if before_id is not None else None,
         )
 
         # Convert to summary format
@@ -205,11 +246,18 @@ def get_tasks(
                 volunteers_assigned=volunteers_assigned,
                 days_remaining=days_remaining,
                 is_overdue=is_overdue,
+                created_at=task.created_at,
             )
             task_summaries.append(summary)
 
         return task_summaries
 
+    except SearchTimeoutError:
+        # The search ran past SEARCH_STATEMENT_TIMEOUT_MS and was cancelled
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search took too long; try more specific terms.",
+        )
     except Exception as e:
         logger.error("Failed to retrieve tasks: %s", e)
         raise HTTPException(
@@ -219,11 +267,22 @@ def get_tasks(
 
 
 @router.get("/stats", response_model=TaskStats)
-def get_task_stats(project_id: Optional[int] = None, db: Session = Depends(get_db)):
-    """Get task statistics (public endpoint)."""
-    try:
+async def get_task_stats(
+    project_id: Optional[int] = None, db: Session = Depends(get_db)
+):
+    """Get task statistics (public endpoint). Cached briefly; task writes invalidate it."""
+
+    def load() -> str:
         stats = task_crud.get_task_stats(db, project_id=project_id)
-        return TaskStats(**stats)
+        return TaskStats(**stats).model_dump_json()
+
+    try:
+        cached = await get_or_set(
+            task_stats_cache_key(project_id),
+            TASK_STATS_CACHE_TTL,
+            lambda: run_in_threadpool(load),
+        )
+        return TaskStats.model_validate_json(cached)
     except Exception as e:
         logger.error("Failed to retrieve task stats: %s", e)
         raise HTTPException(
@@ -471,8 +530,10 @@ async def update_task(
         # Track old status for notification
         old_status = task.status
         old_title = task.title
+        old_project_id = task.project_id
 
         updated_task = task_crud.update_task(db, task_id, task_data)
+        await invalidate_task_stats_cache(old_project_id, updated_task.project_id)
 
         # Send notifications if status changed
         if task_data.status and task_data.status != old_status:
@@ -488,11 +549,9 @@ async def update_task(
             if updated_task.assigned_to_id:
                 users_to_notify.add(updated_task.assigned_to_id)
 
-            # Add volunteers (get_task_volunteers returns dicts with "volunteer" key)
+            # Add volunteers (get_task_volunteers returns dicts with "user_id" key)
             for entry in volunteer_assignments:
-                vol = entry["volunteer"]
-                if vol:
-                    users_to_notify.add(vol.user_id)
+                users_to_notify.add(entry["user_id"])
 
             # Add project manager
             if project.project_manager_id:
@@ -545,6 +604,8 @@ async def update_task(
                 # Don't fail the request if event publishing fails
                 pass
 
+        # Commits above expire the row returned by the update
+        db.refresh(updated_task)
         return Task(**updated_task.model_dump())
 
     except HTTPException:
@@ -590,6 +651,7 @@ def delete_task(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
             )
 
+        from_thread.run(invalidate_task_stats_cache, task.project_id)
         return {"message": "Task deleted successfully"}
 
     except HTTPException:
@@ -620,8 +682,6 @@ def get_task_volunteers(
         assignments = []
         for data in volunteers_data:
             assignment = data["assignment"]
-            volunteer = data["volunteer"]
-            user = data["user"]
 
             assignments.append(
                 TaskVolunteerAssignment(
@@ -634,9 +694,9 @@ def get_task_volunteers(
                     hours_contributed=float(assignment.hours_contributed),
                     performance_rating=assignment.performance_rating,
                     notes=assignment.notes,
-                    volunteer_name=user.name,
-                    volunteer_id_code=volunteer.volunteer_id,
-                    volunteer_email=user.email,
+                    volunteer_name=data["user_name"],
+                    volunteer_id_code=data["volunteer_code"],
+                    volunteer_email=data["user_email"],
                 )
             )
 
@@ -1097,13 +1157,12 @@ def get_my_task_assignments(
         for data in tasks_data:
             assignment = data["assignment"]
             task = data["task"]
-            project = data["project"]
 
             assignments.append(
                 VolunteerTaskAssignment(
                     task_id=task.id,
                     task_title=task.title,
-                    project_name=project.name,
+                    project_name=data["project_name"],
                     status=task.status,
                     priority=task.priority,
                     estimated_hours=float(task.estimated_hours)
@@ -1162,13 +1221,12 @@ def get_volunteer_task_assignments(
         for data in tasks_data:
             assignment = data["assignment"]
             task = data["task"]
-            project = data["project"]
 
             assignments.append(
                 VolunteerTaskAssignment(
                     task_id=task.id,
                     task_title=task.title,
-                    project_name=project.name,
+                    project_name=data["project_name"],
                     status=task.status,
                     priority=task.priority,
                     estimated_hours=float(task.estimated_hours)
@@ -2,14 +2,18 @@
 """User management endpoints."""
 
 import logging
+from anyio import from_thread
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer
+from pydantic import TypeAdapter
 from sqlmodel import Session, select, func
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 from app.database.engine import get_db
+from app.core.cache import get_cache, get_or_set
 from app.core.deps import get_current_user
 from app.models.user import User, UserType
 from app.crud.user import user_crud
@@ -34,6 +38,14 @@ router = APIRouter(
 
 security = HTTPBearer()
 
+# User types and departments change rarely; department writes invalidate
+USER_LOOKUP_CACHE_TTL = 3600  # seconds
+USER_TYPES_CACHE_KEY = "user_types:all"
+DEPARTMENTS_CACHE_KEY = "departments:all"
+
+_user_types_adapter = TypeAdapter(list[UserTypeResponse])
+_departments_adapter = TypeAdapter(list[str])
+
 
 # ========================================
 # USER ENDPOINTS
@@ -58,6 +70,8 @@ def create_user(
 
     try:
         user = user_crud.create_user(db, user_data)
+        if user.department:
+            from_thread.run(get_cache().delete, DEPARTMENTS_CACHE_KEY)
 
         # If user_type is volunteer, create volunteer profile
         if user_data.user_type == "volunteer":
@@ -119,6 +133,15 @@ def get_users(
     user_type_id: Optional[int] = Query(None, description="Filter by user type ID"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     department: Optional[str] = Query(None, description="Filter by department"),
+    after_name: Optional[str] = Query(
+        None, description="name of the last user seen (keyset pagination)"
+    ),
+    after_id: Optional[int] = Query(
+        None, description="id of the last user seen (keyset pagination)"
+    ),
+    include_total: bool = Query(
+        True, description="Set false to skip counting; metadata.total is then null"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -131,6 +154,10 @@ def get_users(
     - **department**: Filter by specific department
     - **page**: Page number (1-indexed)
     - **page_size**: Number of items per page (max 100)
+    - **after_name** / **after_id**: Keyset position of the last user seen;
+      page is then ignored (offset paging is kept for compatibility)
+    - **include_total**: Set false for infinite scroll; the count is skipped
+      and has_next comes from fetching one extra row
     """
     try:
         # Check permissions - allow roles that manage assignments
@@ -144,6 +171,12 @@ def get_users(
                 detail="Not authorized to list users",
             )
 
+        if (after_name is None) != (after_id is None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="after_name and after_id must be provided together",
+            )
+
         # Calculate skip offset
         skip = (page - 1) * page_size
 
@@ -151,12 +184,16 @@ def get_users(
         users, total = user_crud.get_users(
             db,
             skip=skip,
-            limit=page_size,
+            limit=page_size if include_total else page_size + 1,
             search=search,
             user_type_id=user_type_id,
             is_active=is_active,
             department=department,
+            after=(after_name, after_id) if after_id is not None else None,
+            include_total=include_total,
         )
+        has_next = len(users) > page_size
+        users = users[:page_size]
 
         # Convert to summary format
         user_summaries = [
@@ -173,7 +210,7 @@ def get_users(
         ]
 
         # Create pagination metadata
-        metadata = create_pagination_metadata(total, page, page_size)
+        metadata = create_pagination_metadata(total, page, page_size, has_next)
 
         return PaginatedResponse[UserSummary](data=user_summaries, metadata=metadata)
 
@@ -308,6 +345,8 @@ def update_user(
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Failed to update user"
             )
+        if "department" in update_data.model_dump(exclude_unset=True):
+            from_thread.run(get_cache().delete, DEPARTMENTS_CACHE_KEY)
 
         return UserDetail(
             id=updated_user.id,
@@ -532,16 +571,25 @@ def change_user_role(
 
 
 @router.get("/types/all", response_model=list[UserTypeResponse])
-def get_user_types(
+async def get_user_types(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """Get all user types."""
-    try:
+
+    def load() -> str:
         user_types = user_crud.get_user_types(db)
-        return [
-            UserTypeResponse(id=ut.id, name=ut.name, description=ut.description)
-            for ut in user_types
-        ]
+        return _user_types_adapter.dump_json(
+            [
+                UserTypeResponse(id=ut.id, name=ut.name, description=ut.description)
+                for ut in user_types
+            ]
+        ).decode()
+
+    try:
+        cached = await get_or_set(
+            USER_TYPES_CACHE_KEY, USER_LOOKUP_CACHE_TTL, lambda: run_in_threadpool(load)
+        )
+        return _user_types_adapter.validate_json(cached)
     except Exception as e:
         logger.error("Failed to retrieve user types: %s", e)
         raise HTTPException(
@@ -551,13 +599,19 @@ def get_user_types(
 
 
 @router.get("/departments/all", response_model=list[str])
-def get_departments(
+async def get_departments(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """Get list of all departments."""
+
+    def load() -> str:
+        return _departments_adapter.dump_json(user_crud.get_departments(db)).decode()
+
     try:
-        departments = user_crud.get_departments(db)
-        return departments
+        cached = await get_or_set(
+            DEPARTMENTS_CACHE_KEY, USER_LOOKUP_CACHE_TTL, lambda: run_in_threadpool(load)
+        )
+        return _departments_adapter.validate_json(cached)
     except Exception as e:
         logger.error("Failed to retrieve departments: %s", e)
         raise HTTPException(
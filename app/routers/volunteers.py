@@ -2,6 +2,7 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer
 from sqlmodel import Session, select, func
 from typing import List, Optional
@@ -202,33 +203,26 @@ def get_volunteers(
             db, skip=skip, limit=limit, status=status, skill_id=skill_id, search=search
         )
 
+        # Names, skill counts and latest activity for the whole page at once
+        details = volunteer_crud.get_volunteer_summary_details(
+            db, [volunteer.id for volunteer in volunteers]
+        )
+
         # Convert to summary format with additional info
         volunteer_summaries = []
         for volunteer in volunteers:
-            # Get user info
-            user_info = volunteer_crud.get_volunteer_profile_with_details(
-                db, volunteer.id
-            )
-            if user_info:
-                user = user_info["user"]
-                skills_count = len(user_info["skills"])
-
-                # Get recent activity (last time log)
-                recent_logs = volunteer_time_log_crud.get_volunteer_time_logs(
-                    db, volunteer.id, limit=1
-                )
-                recent_activity = recent_logs[0].created_at if recent_logs else None
-
+            info = details.get(volunteer.id)
+            if info:
                 summary = VolunteerSummary(
                     id=volunteer.id,
                     volunteer_id=volunteer.volunteer_id,
-                    name=user.name,
-                    email=user.email,
+                    name=info["name"],
+                    email=info["email"],
                     volunteer_status=volunteer.volunteer_status,
                     total_hours_contributed=float(volunteer.total_hours_contributed),
                     joined_date=volunteer.joined_date,
-                    skills_count=skills_count,
-                    recent_activity=recent_activity,
+                    skills_count=info["skills_count"],
+                    recent_activity=info["recent_activity"],
                 )
                 volunteer_summaries.append(summary)
 
@@ -417,12 +411,11 @@ def get_volunteer_skills(
         skill_rows = volunteer_skill_crud.get_volunteer_skills(db, volunteer_id)
         result = []
         for sa in skill_rows:
-            skill_obj = volunteer_skill_crud.get_skill(db, sa.skill_id)
             result.append(
                 VolunteerSkillAssignment(
                     **sa.model_dump(),
-                    skill=VolunteerSkill.model_validate(skill_obj)
-                    if skill_obj
+                    skill=VolunteerSkill.model_validate(sa.skill)
+                    if sa.skill
                     else None,
                 )
             )
@@ -785,8 +778,14 @@ async def approve_volunteer_hours(
                 detail="Not authorized to approve time logs",
             )
 
-        approved_log = volunteer_time_log_crud.approve_time_log(
-            db, time_log_id, current_user.id, approval_data
+        # Sync CRUD calls run in the threadpool, as they do for the plain
+        # def endpoints, so this handler doesn't block the event loop.
+        approved_log = await run_in_threadpool(
+            volunteer_time_log_crud.approve_time_log,
+            db,
+            time_log_id,
+            current_user.id,
+            approval_data,
         )
 
         if not approved_log:
@@ -795,7 +794,9 @@ async def approve_volunteer_hours(
             )
 
         # Get volunteer info
-        volunteer = db.get(Volunteer, approved_log.volunteer_id)
+        volunteer = await run_in_threadpool(
+            db.get, Volunteer, approved_log.volunteer_id
+        )
         if volunteer:
             # Notify volunteer about approval/rejection
             if approval_data.approved:
@@ -164,16 +164,17 @@ class BlogPostListResponse(BaseModel):
     """Paginated list of blog posts"""
 
     items: List[BlogPostSummary]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class CategoryListResponse(BaseModel):
     """Paginated list of categories"""
 
     items: List[Category]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
 
@@ -182,6 +183,6 @@ class TagListResponse(BaseModel):
     """Paginated list of tags"""
 
     items: List[Tag]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
@@ -8,10 +8,10 @@ T = TypeVar('T')
 
 class PaginationMetadata(BaseModel):
     """Pagination metadata for list responses."""
-    total: int = Field(..., description="Total number of items")
+    total: Optional[int] = Field(..., description="Total number of items; null when totals are skipped")
     page: int = Field(..., ge=1, description="Current page number (1-indexed)")
     page_size: int = Field(..., ge=1, description="Number of items per page")
-    total_pages: int = Field(..., ge=0, description="Total number of pages")
+    total_pages: Optional[int] = Field(..., ge=0, description="Total number of pages; null when totals are skipped")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_previous: bool = Field(..., description="Whether there is a previous page")
 
@@ -32,21 +32,33 @@ class PaginatedResponse(BaseModel, Generic[T]):
         from_attributes = True
 
 def create_pagination_metadata(
-    total: int,
+    total: Optional[int],
     page: int,
-    page_size: int
+    page_size: int,
+    has_next: bool = False
 ) -> PaginationMetadata:
     """
     Helper function to create pagination metadata.
 
     Args:
-        total: Total number of items
+        total: Total number of items, or None when the count was skipped
         page: Current page number (1-indexed)
         page_size: Number of items per page
+        has_next: Whether a next page exists; only used when total is None
 
     Returns:
         PaginationMetadata object
     """
+    if total is None:
+        return PaginationMetadata(
+            total=None,
+            page=page,
+            page_size=page_size,
+            total_pages=None,
+            has_next=has_next,
+            has_previous=page > 1
+        )
+
     total_pages = ceil(total / page_size) if page_size > 0 else 0
 
     return PaginationMetadata(
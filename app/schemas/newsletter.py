@@ -24,6 +24,7 @@ class CampaignStatus(str, Enum):
 
 class RecipientStatus(str, Enum):
     pending = "pending"
+    sending = "sending"
     sent = "sent"
     delivered = "delivered"
     opened = "opened"
@@ -187,6 +188,7 @@ class SubscriberListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class SubscriberImportResult(BaseModel):
@@ -394,6 +396,7 @@ class CampaignRecipientListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================================
@@ -191,6 +191,7 @@ class ProjectSummary(BaseModel):
     team_size: int = 0
     volunteers_count: int = 0
     progress_percentage: Optional[float] = None
+    created_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -139,6 +139,7 @@ class TaskSummary(BaseModel):
     volunteers_assigned: int = 0
     days_remaining: Optional[int] = None
     is_overdue: bool = False
+    created_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -6,12 +6,10 @@ import logging
 import asyncio
 from typing import Optional, List, Tuple
 from datetime import datetime
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud.newsletter import newsletter_crud
-from app.models.newsletter import (
-    Campaign, CampaignRecipient, Subscriber, CampaignStatus, RecipientStatus
-)
+from app.models.newsletter import Campaign, CampaignStatus, RecipientStatus
 from app.core.email import send_newsletter_email
 from app.core.config import settings
 
@@ -31,8 +29,8 @@ class CampaignService:
     """Service for managing newsletter campaigns."""
 
     @staticmethod
-    def schedule_campaign(
-        db: Session,
+    async def schedule_campaign(
+        db: AsyncSession,
         campaign_id: int,
         scheduled_at: datetime
     ) -> Optional[Campaign]:
@@ -47,7 +45,7 @@ class CampaignService:
         Returns:
             Updated Campaign or None if not found/invalid
         """
-        campaign = newsletter_crud.get_campaign(db, campaign_id)
+        campaign = await newsletter_crud.get_campaign(db, campaign_id)
         if not campaign or campaign.status != CampaignStatus.draft:
             logger.warning(f"Cannot schedule campaign {campaign_id}: not found or not in draft status")
             return None
@@ -57,47 +55,50 @@ class CampaignService:
             return None
 
         # Create recipients
-        CampaignService._create_campaign_recipients(db, campaign)
+        await CampaignService._create_campaign_recipients(db, campaign)
 
         # Schedule the campaign
-        scheduled = newsletter_crud.schedule_campaign(db, campaign_id, scheduled_at)
+        scheduled = await newsletter_crud.schedule_campaign(db, campaign_id, scheduled_at)
         logger.info(f"Campaign {campaign_id} scheduled for {scheduled_at}")
 
         return scheduled
 
     @staticmethod
-    def _create_campaign_recipients(db: Session, campaign: Campaign) -> int:
+    async def _create_campaign_recipients(db: AsyncSession, campaign: Campaign) -> int:
         """
         Create recipient records for a campaign based on targeting.
 
+        The recipient rows are the campaign's audience snapshot; they are
+        built from active subscriber ids read in keyset-paginated chunks.
+
         Returns:
             Number of recipients created
         """
         # Get target subscribers
         tag_ids = campaign.target_tag_ids if not campaign.send_to_all else None
-        subscribers = newsletter_crud.get_active_subscribers(db, tag_ids)
 
         count = 0
-        for subscriber in subscribers:
-            try:
-                newsletter_crud.create_campaign_recipient(
-                    db=db,
-                    campaign_id=campaign.id,
-                    subscriber_id=subscriber.id
-                )
-                count += 1
-            except Exception as e:
-                logger.error(f"Failed to create recipient for subscriber {subscriber.id}: {e}")
+        last_id = 0
+        while True:
+            subscriber_ids = await newsletter_crud.get_active_subscriber_ids(
+                db, tag_ids, after_id=last_id
+            )
+            if not subscriber_ids:
+                break
+            count += await newsletter_crud.bulk_create_campaign_recipients(
+                db, campaign.id, subscriber_ids
+            )
+            last_id = subscriber_ids[-1]
 
-        # Update campaign total recipients
+        # Update campaign total recipients (same transaction as the inserts)
         campaign.total_recipients = count
-        db.commit()
+        await db.flush()
 
         logger.info(f"Created {count} recipients for campaign {campaign.id}")
         return count
 
     @staticmethod
-    async def send_campaign_now(db: Session, campaign_id: int) -> Optional[Campaign]:
+    async def send_campaign_now(db: AsyncSession, campaign_id: int) -> Optional[Campaign]:
         """
         Start sending a campaign immediately.
 
@@ -108,7 +109,7 @@ class CampaignService:
         Returns:
             Campaign in sending status or None if error
         """
-        campaign = newsletter_crud.get_campaign(db, campaign_id)
+        campaign = await newsletter_crud.get_campaign(db, campaign_id)
         if not campaign:
             return None
 
@@ -118,17 +119,17 @@ class CampaignService:
 
         # Create recipients if not already created
         if campaign.total_recipients == 0:
-            CampaignService._create_campaign_recipients(db, campaign)
+            await CampaignService._create_campaign_recipients(db, campaign)
 
         # Mark as sending
-        sending = newsletter_crud.start_campaign_sending(db, campaign_id)
+        sending = await newsletter_crud.start_campaign_sending(db, campaign_id)
         logger.info(f"Campaign {campaign_id} started sending")
 
         return sending
 
     @staticmethod
     async def process_campaign_batch(
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         batch_size: int = 50,
         delay_seconds: float = 1.0
@@ -145,23 +146,33 @@ class CampaignService:
         Returns:
             Tuple of (sent_count, remaining_count)
         """
-        campaign = newsletter_crud.get_campaign(db, campaign_id)
+        campaign = await newsletter_crud.get_campaign(db, campaign_id)
         if not campaign or campaign.status != CampaignStatus.sending:
             return 0, 0
 
-        # Get pending recipients
-        pending = newsletter_crud.get_pending_recipients(db, campaign_id, batch_size)
+        # Claim pending recipients; other workers skip the claimed rows
+        pending = await newsletter_crud.get_pending_recipients(db, campaign_id, batch_size)
+        await db.commit()
 
         if not pending:
-            # No more pending recipients - mark campaign as complete
-            newsletter_crud.complete_campaign(db, campaign_id)
+            # Other workers may still be sending their claimed batches;
+            # complete only once every recipient reached a final status
+            unfinished = await newsletter_crud.count_unfinished_recipients(db, campaign_id)
+            if unfinished:
+                return 0, unfinished
+
+            await newsletter_crud.complete_campaign(db, campaign_id)
+            await db.commit()
             logger.info(f"Campaign {campaign_id} completed - all emails sent")
             return 0, 0
 
-        sent_count = 0
+        sent_ids: List[int] = []
+        bounced_ids: List[int] = []
         for recipient in pending:
-            subscriber = newsletter_crud.get_subscriber(db, recipient.subscriber_id)
+            subscriber = recipient.subscriber
             if not subscriber:
+                # Nothing to send to; don't leave the row claimed as sending
+                bounced_ids.append(recipient.id)
                 continue
 
             # Build tracking URLs
@@ -183,33 +194,43 @@ class CampaignService:
                 )
 
                 if success:
-                    newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.sent)
-                    newsletter_crud.update_campaign_stats(db, campaign_id, 'total_sent', 1)
-                    sent_count += 1
+                    sent_ids.append(recipient.id)
                 else:
-                    newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.bounced)
-                    newsletter_crud.update_campaign_stats(db, campaign_id, 'total_bounced', 1)
+                    bounced_ids.append(recipient.id)
 
             except Exception as e:
                 logger.error(f"Failed to send to {subscriber.email}: {e}")
-                newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.bounced)
-                newsletter_crud.update_campaign_stats(db, campaign_id, 'total_bounced', 1)
+                bounced_ids.append(recipient.id)
 
             # Rate limiting delay
             if delay_seconds > 0:
                 await asyncio.sleep(delay_seconds)
 
+        # Record the batch outcome in one statement per status. Claimed rows
+        # stay 'sending' until then, so a crash mid-batch never resends.
+        sent_count = await newsletter_crud.bulk_update_recipient_status(
+            db, sent_ids, RecipientStatus.sent
+        )
+        bounced_count = await newsletter_crud.bulk_update_recipient_status(
+            db, bounced_ids, RecipientStatus.bounced
+        )
+        if sent_count:
+            await newsletter_crud.update_campaign_stats(db, campaign_id, 'total_sent', sent_count)
+        if bounced_count:
+            await newsletter_crud.update_campaign_stats(db, campaign_id, 'total_bounced', bounced_count)
+        await db.commit()
+
         # Count remaining
-        remaining_recipients, _ = newsletter_crud.get_campaign_recipients(
-            db, campaign_id, status=RecipientStatus.pending
+        _, remaining = await newsletter_crud.get_campaign_recipients(
+            db, campaign_id, limit=1, status=RecipientStatus.pending
         )
 
-        logger.info(f"Campaign {campaign_id}: sent {sent_count} emails, {len(remaining_recipients)} remaining")
-        return sent_count, len(remaining_recipients)
+        logger.info(f"Campaign {campaign_id}: sent {sent_count} emails, {remaining} remaining")
+        return sent_count, remaining
 
     @staticmethod
-    def track_open(
-        db: Session,
+    async def track_open(
+        db: AsyncSession,
         open_token: str,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
@@ -226,20 +247,20 @@ class CampaignService:
         Returns:
             Tracking pixel (1x1 transparent GIF)
         """
-        recipient = newsletter_crud.get_recipient_by_open_token(db, open_token)
+        recipient = await newsletter_crud.get_recipient_by_open_token(db, open_token)
 
         if recipient:
             # Only count first open
             if not recipient.opened_at:
-                newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.opened)
-                newsletter_crud.update_campaign_stats(db, recipient.campaign_id, 'total_opened', 1)
+                await newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.opened)
+                await newsletter_crud.update_campaign_stats(db, recipient.campaign_id, 'total_opened', 1)
                 logger.debug(f"Tracked open for recipient {recipient.id}")
 
         return TRACKING_PIXEL
 
     @staticmethod
-    def track_click(
-        db: Session,
+    async def track_click(
+        db: AsyncSession,
         click_token: str,
         original_url: str,
         ip_address: Optional[str] = None,
@@ -258,14 +279,14 @@ class CampaignService:
         Returns:
             Original URL to redirect to, or None if invalid token
         """
-        recipient = newsletter_crud.get_recipient_by_click_token(db, click_token)
+        recipient = await newsletter_crud.get_recipient_by_click_token(db, click_token)
 
         if not recipient:
             logger.warning(f"Invalid click token: {click_token[:10]}...")
             return None
 
         # Record the click
-        newsletter_crud.record_link_click(
+        await newsletter_crud.record_link_click(
             db=db,
             recipient_id=recipient.id,
             original_url=original_url,
@@ -275,14 +296,14 @@ class CampaignService:
 
         # Update recipient status if first click
         if not recipient.clicked_at:
-            newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.clicked)
-            newsletter_crud.update_campaign_stats(db, recipient.campaign_id, 'total_clicked', 1)
+            await newsletter_crud.update_recipient_status(db, recipient.id, RecipientStatus.clicked)
+            await newsletter_crud.update_campaign_stats(db, recipient.campaign_id, 'total_clicked', 1)
 
         logger.debug(f"Tracked click for recipient {recipient.id}: {original_url}")
         return original_url
 
     @staticmethod
-    def get_campaign_stats(db: Session, campaign_id: int) -> Optional[dict]:
+    async def get_campaign_stats(db: AsyncSession, campaign_id: int) -> Optional[dict]:
         """
         Get detailed statistics for a campaign.
 
@@ -293,7 +314,7 @@ class CampaignService:
         Returns:
             Dictionary with campaign statistics
         """
-        campaign = newsletter_crud.get_campaign(db, campaign_id)
+        campaign = await newsletter_crud.get_campaign(db, campaign_id)
         if not campaign:
             return None
 
@@ -317,7 +338,7 @@ class CampaignService:
 
     @staticmethod
     async def send_test_email(
-        db: Session,
+        db: AsyncSession,
         campaign_id: int,
         test_email: str
     ) -> bool:
@@ -332,7 +353,7 @@ class CampaignService:
         Returns:
             True if test email was sent successfully
         """
-        campaign = newsletter_crud.get_campaign(db, campaign_id)
+        campaign = await newsletter_crud.get_campaign(db, campaign_id)
         if not campaign:
             return False
 
@@ -353,24 +374,24 @@ class CampaignService:
             return False
 
     @staticmethod
-    def get_due_campaigns(db: Session) -> List[Campaign]:
+    async def get_due_campaigns(db: AsyncSession) -> List[Campaign]:
         """
         Get campaigns that are due to be sent.
 
         Returns:
             List of scheduled campaigns with scheduled_at <= now
         """
-        return newsletter_crud.get_scheduled_campaigns(db, datetime.utcnow())
+        return await newsletter_crud.get_scheduled_campaigns(db, datetime.utcnow())
 
     @staticmethod
-    def get_sending_campaigns(db: Session) -> List[Campaign]:
+    async def get_sending_campaigns(db: AsyncSession) -> List[Campaign]:
         """
         Get campaigns that are currently in sending status.
 
         Returns:
             List of campaigns with sending status
         """
-        return newsletter_crud.get_sending_campaigns(db)
+        return await newsletter_crud.get_sending_campaigns(db)
 
 
 # Singleton instance
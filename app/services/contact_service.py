@@ -5,7 +5,7 @@ Sends auto-reply to user and notification to admin.
 """
 import logging
 from typing import Optional
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud.newsletter import newsletter_crud
 from app.schemas.newsletter import ContactFormCreate
@@ -21,7 +21,7 @@ class ContactService:
 
     @staticmethod
     async def submit_contact_form(
-        db: Session,
+        db: AsyncSession,
         data: ContactFormCreate,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
@@ -43,12 +43,14 @@ class ContactService:
             Created ContactSubmission object
         """
         # 1. Save to database
-        submission = newsletter_crud.create_contact_submission(
+        submission = await newsletter_crud.create_contact_submission(
             db=db,
             data=data,
             ip_address=ip_address,
             user_agent=user_agent
         )
+        # Commit before the emails go out so they reference a saved submission
+        await db.commit()
 
         logger.info(f"Contact form submission #{submission.id} created from {data.email}")
 
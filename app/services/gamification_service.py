@@ -25,6 +25,7 @@ from app.models.gamification import (
 )
 from app.models.user import User
 from app.models.volunteer import Volunteer
+from app.core.cache import get_cache
 from app.services.event_bus import EventType, get_event_bus
 from app.services.notification_service import NotificationService
 from app.models.analytics import NotificationType
@@ -48,6 +49,24 @@ POINTS_CONFIG = {
 }
 
 
+# ============================================================
+# LEADERBOARD CACHE
+# ============================================================
+
+LEADERBOARD_TYPES = ["points", "hours", "projects"]
+LEADERBOARD_TIMEFRAMES = ["all_time", "weekly", "monthly"]
+LEADERBOARD_CACHE_TTL = 300  # seconds
+
+# Global rankings are cached once at the maximum page size and sliced
+TOP_VOLUNTEERS_CACHE_KEY = "top:100"
+TOP_VOLUNTEERS_CACHE_LIMIT = 100
+
+
+def leaderboard_cache_key(leaderboard_type: str, timeframe: str) -> str:
+    """Cache key for the current leaderboard of a type/timeframe."""
+    return f"lb:{leaderboard_type}:{timeframe}:current"
+
+
 # ============================================================
 # CORE GAMIFICATION SERVICE
 # ============================================================
@@ -73,6 +92,7 @@ class GamificationService:
     ) -> Dict[str, Any]:
         """
         Award points to a volunteer and create history entry.
+        The award and streak update share one transaction.
         Returns the points history entry and updated balance.
         """
         try:
@@ -86,10 +106,12 @@ class GamificationService:
                 reference_id=reference_id,
                 reference_type=reference_type,
                 awarded_by_id=awarded_by_id,
+                commit=False,
             )
 
             # Update streak
-            points_crud.update_streak(db, volunteer_id)
+            points_crud.update_streak(db, volunteer_id, commit=False)
+            db.commit()
 
             logger.info(
                 f"Awarded {points_change} points to volunteer {volunteer_id} for {event_type}"
@@ -300,7 +322,7 @@ class GamificationService:
                     .where(VolunteerTimeLog.approved == True)
                 )
                 result = db.exec(statement).first()
-                return Decimal(str(result or 0))
+                return result or Decimal("0")  # SUM of a NUMERIC column is already Decimal
 
             elif achievement_type == "projects_completed":
                 # Get completed projects count via the volunteer's user_id.
@@ -317,7 +339,7 @@ class GamificationService:
                     .where(ProjectTeam.is_active == True)
                 )
                 result = db.exec(statement).first()
-                return Decimal(str(result or 0))
+                return Decimal(result or 0)
 
             elif achievement_type == "tasks_completed":
                 # Get completed tasks count
@@ -330,7 +352,7 @@ class GamificationService:
                     .where(Task.status == "completed")
                 )
                 result = db.exec(statement).first()
-                return Decimal(str(result or 0))
+                return Decimal(result or 0)
 
             elif achievement_type == "skills_acquired":
                 # Get certified skills count
@@ -342,7 +364,7 @@ class GamificationService:
                     .where(VolunteerSkillAssignment.certified == True)
                 )
                 result = db.exec(statement).first()
-                return Decimal(str(result or 0))
+                return Decimal(result or 0)
 
             elif achievement_type == "trainings_completed":
                 # Get completed trainings count
@@ -354,7 +376,7 @@ class GamificationService:
                 # Get current streak
                 points_record = points_crud.get_points(db, volunteer_id)
                 if points_record:
-                    return Decimal(str(points_record.current_streak_days))
+                    return Decimal(points_record.current_streak_days)
                 return Decimal("0")
 
             elif achievement_type == "volunteer_referred":
@@ -717,11 +739,9 @@ class GamificationService:
     def update_all_leaderboards(db: Session) -> int:
         """Update all leaderboards (all types and timeframes)."""
         count = 0
-        types = ["points", "hours", "projects"]
-        timeframes = ["all_time", "weekly", "monthly"]
 
-        for lb_type in types:
-            for timeframe in timeframes:
+        for lb_type in LEADERBOARD_TYPES:
+            for timeframe in LEADERBOARD_TIMEFRAMES:
                 try:
                     if lb_type == "points":
                         GamificationService.generate_points_leaderboard(db, timeframe)
@@ -741,6 +761,18 @@ class GamificationService:
         logger.info(f"Updated {count} leaderboards")
         return count
 
+    @staticmethod
+    async def invalidate_leaderboard_cache() -> None:
+        """Drop cached leaderboards and global rankings after they are regenerated."""
+        await get_cache().delete(
+            TOP_VOLUNTEERS_CACHE_KEY,
+            *(
+                leaderboard_cache_key(lb_type, timeframe)
+                for lb_type in LEADERBOARD_TYPES
+                for timeframe in LEADERBOARD_TIMEFRAMES
+            ),
+        )
+
     @staticmethod
     def _get_timeframe_dates(
         timeframe: str,
@@ -5,12 +5,11 @@ Newsletter Service for managing subscriptions with double opt-in.
 import logging
 from typing import Optional, List
 from datetime import datetime
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud.newsletter import newsletter_crud
 from app.models.newsletter import Subscriber, SubscriptionStatus
 from app.core.email import send_subscription_confirmation, send_unsubscribe_confirmation
-from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +19,7 @@ class NewsletterService:
 
     @staticmethod
     async def subscribe(
-        db: Session,
+        db: AsyncSession,
         email: str,
         name: Optional[str] = None,
         ip_address: Optional[str] = None,
@@ -40,7 +39,7 @@ class NewsletterService:
             Tuple of (Subscriber, is_new) - is_new is False if already subscribed
         """
         # Check if already subscribed
-        existing = newsletter_crud.get_subscriber_by_email(db, email)
+        existing = await newsletter_crud.get_subscriber_by_email(db, email)
 
         if existing:
             if existing.status == SubscriptionStatus.active:
@@ -65,14 +64,13 @@ class NewsletterService:
                 existing.name = name or existing.name
                 existing.updated_at = datetime.utcnow()
 
-                db.commit()
-                db.refresh(existing)
+                await db.commit()
 
                 await NewsletterService._send_confirmation_email(existing)
                 return existing, True
 
         # Create new subscriber
-        subscriber = newsletter_crud.create_subscriber(
+        subscriber = await newsletter_crud.create_subscriber(
             db=db,
             email=email,
             name=name,
@@ -81,6 +79,8 @@ class NewsletterService:
             user_id=user_id
         )
 
+        # Commit before emailing so the confirmation token is live
+        await db.commit()
         logger.info(f"New subscriber {email} created with pending status")
 
         # Send confirmation email
@@ -105,8 +105,8 @@ class NewsletterService:
             return False
 
     @staticmethod
-    def confirm_subscription(
-        db: Session,
+    async def confirm_subscription(
+        db: AsyncSession,
         token: str
     ) -> Optional[Subscriber]:
         """
@@ -119,7 +119,7 @@ class NewsletterService:
         Returns:
             Confirmed Subscriber or None if token is invalid/expired
         """
-        subscriber = newsletter_crud.get_subscriber_by_confirmation_token(db, token)
+        subscriber = await newsletter_crud.get_subscriber_by_confirmation_token(db, token)
 
         if not subscriber:
             logger.warning(f"Invalid confirmation token: {token[:10]}...")
@@ -131,14 +131,14 @@ class NewsletterService:
             return None
 
         # Confirm the subscription
-        confirmed = newsletter_crud.confirm_subscriber(db, subscriber.id)
+        confirmed = await newsletter_crud.confirm_subscriber(db, subscriber.id)
         logger.info(f"Subscription confirmed for {subscriber.email}")
 
         return confirmed
 
     @staticmethod
     async def unsubscribe(
-        db: Session,
+        db: AsyncSession,
         token: str,
         send_confirmation: bool = True
     ) -> Optional[Subscriber]:
@@ -153,7 +153,7 @@ class NewsletterService:
         Returns:
             Unsubscribed Subscriber or None if token is invalid
         """
-        subscriber = newsletter_crud.get_subscriber_by_unsubscribe_token(db, token)
+        subscriber = await newsletter_crud.get_subscriber_by_unsubscribe_token(db, token)
 
         if not subscriber:
             logger.warning(f"Invalid unsubscribe token: {token[:10]}...")
@@ -164,7 +164,8 @@ class NewsletterService:
             return subscriber
 
         # Unsubscribe
-        unsubscribed = newsletter_crud.unsubscribe(db, subscriber.id)
+        unsubscribed = await newsletter_crud.unsubscribe(db, subscriber.id)
+        await db.commit()
         logger.info(f"Subscriber {subscriber.email} unsubscribed")
 
         # Send confirmation email
@@ -177,8 +178,8 @@ class NewsletterService:
         return unsubscribed
 
     @staticmethod
-    def get_active_subscribers(
-        db: Session,
+    async def get_active_subscribers(
+        db: AsyncSession,
         tag_ids: Optional[List[int]] = None
     ) -> List[Subscriber]:
         """
@@ -191,16 +192,16 @@ class NewsletterService:
         Returns:
             List of active subscribers
         """
-        return newsletter_crud.get_active_subscribers(db, tag_ids)
+        return await newsletter_crud.get_active_subscribers(db, tag_ids)
 
     @staticmethod
-    def get_subscriber_by_email(db: Session, email: str) -> Optional[Subscriber]:
+    async def get_subscriber_by_email(db: AsyncSession, email: str) -> Optional[Subscriber]:
         """Get subscriber by email address."""
-        return newsletter_crud.get_subscriber_by_email(db, email)
+        return await newsletter_crud.get_subscriber_by_email(db, email)
 
     @staticmethod
-    def link_subscriber_to_user(
-        db: Session,
+    async def link_subscriber_to_user(
+        db: AsyncSession,
         email: str,
         user_id: int
     ) -> Optional[Subscriber]:
@@ -215,14 +216,13 @@ class NewsletterService:
         Returns:
             Updated Subscriber or None if not found
         """
-        subscriber = newsletter_crud.get_subscriber_by_email(db, email)
+        subscriber = await newsletter_crud.get_subscriber_by_email(db, email)
         if not subscriber:
             return None
 
         subscriber.user_id = user_id
         subscriber.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(subscriber)
+        await db.flush()
 
         logger.info(f"Linked subscriber {email} to user {user_id}")
         return subscriber
@@ -30,6 +30,17 @@ def reset_rate_limiter():
     rate_limiter._rate_limiter = InMemoryRateLimiter()
 
 
+@pytest.fixture(autouse=True)
+def reset_cache():
+    """Reset the in-memory cache between tests so cached responses don't leak."""
+    from app.core import cache
+    from app.core.cache import InMemoryCache
+
+    cache._cache = InMemoryCache()
+    yield
+    cache._cache = InMemoryCache()
+
+
 # Test database setup - function-scoped for isolation
 @pytest.fixture(name="session")
 def session_fixture():
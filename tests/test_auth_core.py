@@ -7,6 +7,7 @@ from app.core.auth import (
     create_refresh_token, verify_token, generate_token,
     is_user_locked, increment_login_attempts, reset_login_attempts
 )
+from app.core.token_manager import InMemoryTokenBlacklist, TokenMetadata, TokenStatus
 
 class TestPasswordUtils:
     def test_password_hashing(self):
@@ -18,52 +19,57 @@ class TestPasswordUtils:
         assert not verify_password("wrong_password", hashed)
 
 class TestTokenUtils:
-    def test_create_and_verify_access_token(self):
+    @pytest.mark.asyncio
+    async def test_create_and_verify_access_token(self):
         data = {"sub": 123, "email": "test@example.com"}
-        token = create_access_token(data)
+        token = await create_access_token(data)
         
         assert isinstance(token, str)
         assert len(token) > 0
         
-        token_data = verify_token(token, "access")
+        token_data = await verify_token(token, "access")
         assert token_data is not None
         assert token_data.user_id == 123
         assert token_data.email == "test@example.com"
     
-    def test_create_and_verify_refresh_token(self):
+    @pytest.mark.asyncio
+    async def test_create_and_verify_refresh_token(self):
         data = {"sub": 456, "email": "refresh@example.com"}
-        token, token_family = create_refresh_token(data)
+        token, token_family = await create_refresh_token(data)
 
         assert isinstance(token, str)
         assert len(token) > 0
         assert isinstance(token_family, str)
         assert len(token_family) > 0
 
-        token_data = verify_token(token, "refresh")
+        token_data = await verify_token(token, "refresh")
         assert token_data is not None
         assert token_data.user_id == 456
         # Email may be None if not included in token payload
         if token_data.email:
             assert token_data.email == "refresh@example.com"
     
-    def test_verify_token_wrong_type(self):
+    @pytest.mark.asyncio
+    async def test_verify_token_wrong_type(self):
         data = {"sub": 123, "email": "test@example.com"}
-        access_token = create_access_token(data)
+        access_token = await create_access_token(data)
         
         # Try to verify access token as refresh token
-        token_data = verify_token(access_token, "refresh")
+        token_data = await verify_token(access_token, "refresh")
         assert token_data is None
     
-    def test_verify_invalid_token(self):
-        token_data = verify_token("invalid_token", "access")
+    @pytest.mark.asyncio
+    async def test_verify_invalid_token(self):
+        token_data = await verify_token("invalid_token", "access")
         assert token_data is None
     
-    def test_token_with_custom_expiry(self):
+    @pytest.mark.asyncio
+    async def test_token_with_custom_expiry(self):
         data = {"sub": 123, "email": "test@example.com"}
         custom_expiry = timedelta(minutes=5)
-        token = create_access_token(data, custom_expiry)
+        token = await create_access_token(data, custom_expiry)
         
-        token_data = verify_token(token, "access")
+        token_data = await verify_token(token, "access")
         assert token_data is not None
 
 class TestTokenGeneration:
@@ -137,3 +143,66 @@ class TestUserSecurity:
         assert user.locked_until is None
         assert user.last_login is not None
         db.commit.assert_called_once()
+
+
+def _metadata(jti, user_id=1, family="fam", expires_in=timedelta(minutes=30)):
+    now = datetime.now(timezone.utc)
+    return TokenMetadata(
+        jti=jti,
+        user_id=user_id,
+        token_family=family,
+        issued_at=now,
+        expires_at=now + expires_in,
+        token_type="refresh",
+    )
+
+
+class TestInMemoryTokenBlacklist:
+    @pytest.mark.asyncio
+    async def test_store_and_get_metadata(self):
+        blacklist = InMemoryTokenBlacklist()
+        await blacklist.store_token_metadata(_metadata("a", user_id=7))
+
+        metadata = await blacklist.get_token_metadata("a")
+        assert metadata.user_id == 7
+        assert metadata.token_family == "fam"
+        assert metadata.status == TokenStatus.ACTIVE
+        assert await blacklist.get_token_metadata("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_tokens(self):
+        blacklist = InMemoryTokenBlacklist()
+        await blacklist.store_token_metadata(_metadata("a", user_id=1))
+        await blacklist.store_token_metadata(_metadata("b", user_id=1))
+        await blacklist.store_token_metadata(_metadata("c", user_id=2))
+
+        assert await blacklist.revoke_user_tokens(1) == 2
+        assert await blacklist.is_blacklisted("a")
+        assert await blacklist.is_blacklisted("b")
+        assert not await blacklist.is_blacklisted("c")
+        assert (await blacklist.get_token_metadata("a")).status == TokenStatus.REVOKED
+        # Already revoked tokens are not counted twice
+        assert await blacklist.revoke_user_tokens(1) == 0
+
+    @pytest.mark.asyncio
+    async def test_revoke_token_family(self):
+        blacklist = InMemoryTokenBlacklist()
+        await blacklist.store_token_metadata(_metadata("a", family="f1"))
+        await blacklist.store_token_metadata(_metadata("b", family="f2"))
+
+        assert await blacklist.revoke_token_family("f1") == 1
+        assert (await blacklist.get_token_metadata("a")).status == TokenStatus.COMPROMISED
+        assert not await blacklist.is_blacklisted("b")
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired(self):
+        blacklist = InMemoryTokenBlacklist()
+        await blacklist.store_token_metadata(_metadata("old", expires_in=timedelta(minutes=-1)))
+        await blacklist.store_token_metadata(_metadata("new", user_id=2))
+        await blacklist.add_to_blacklist("old", datetime.now(timezone.utc))
+
+        assert await blacklist.cleanup_expired() == 1
+        assert await blacklist.get_token_metadata("old") is None
+        assert not await blacklist.is_blacklisted("old")
+        assert (await blacklist.get_token_metadata("new")).user_id == 2
+        assert await blacklist.revoke_user_tokens(2) == 1
@@ -0,0 +1,78 @@
+import pytest
+
+from app.core import cache
+from app.core.cache import InMemoryCache, RedisCache, get_or_set
+
+
+class TestInMemoryCache:
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self):
+        store = InMemoryCache()
+        await store.set("key", "value", ttl=60)
+        assert await store.get("key") == "value"
+
+        await store.delete("key", "missing")
+        assert await store.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped(self):
+        store = InMemoryCache()
+        await store.set("key", "value", ttl=0)
+        assert await store.get("key") is None
+
+
+class UnavailableRedis:
+    """redis.asyncio stand-in whose every command fails."""
+
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def setex(self, key, ttl, value):
+        raise ConnectionError("redis down")
+
+    async def delete(self, *keys):
+        raise ConnectionError("redis down")
+
+
+class TestRedisCache:
+    @pytest.mark.asyncio
+    async def test_errors_fall_through_to_loader(self, monkeypatch):
+        store = RedisCache(UnavailableRedis())
+        monkeypatch.setattr(cache, "_cache", store)
+
+        assert await get_or_set("k", 60, lambda: "[]") == "[]"
+        await store.delete("k")
+
+
+class TestGetOrSet:
+    @pytest.mark.asyncio
+    async def test_loader_called_once(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return '{"a": 1}'
+
+        assert await get_or_set("k", 60, loader) == '{"a": 1}'
+        assert await get_or_set("k", 60, loader) == '{"a": 1}'
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_loader(self):
+        async def loader():
+            return "[]"
+
+        assert await get_or_set("k", 60, loader) == "[]"
+        assert await cache.get_cache().get("k") == "[]"
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return None
+
+        assert await get_or_set("k", 60, loader) is None
+        assert await get_or_set("k", 60, loader) is None
+        assert len(calls) == 2
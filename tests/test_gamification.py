@@ -2,10 +2,13 @@
 Tests for Gamification Module
 """
 
+import os
+
 import pytest
 from pydantic import ValidationError
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app.schemas.gamification import (
     # Badge schemas
@@ -699,3 +702,220 @@ class TestIntegrationScenarios:
         assert streak_week.current_streak_days == 7
         assert streak_broken.longest_streak_days == 30
         assert streak_broken.current_streak_days == 1
+
+
+# ============================================================
+# POSTGRESQL CRUD / SERVICE TESTS
+# ============================================================
+
+# The award and progress paths use writable CTEs, GREATEST and
+# ON CONFLICT, so they only run against a real PostgreSQL database,
+# e.g. TEST_POSTGRES_URL=postgresql://postgres@localhost/repensar_test
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+requires_postgres = pytest.mark.skipif(
+    not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set"
+)
+
+
+@pytest.fixture(name="pg_session")
+def pg_session_fixture():
+    engine = create_engine(TEST_POSTGRES_URL)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(name="volunteer_id")
+def volunteer_id_fixture(pg_session: Session) -> int:
+    from app.models.user import User, UserType
+    from app.models.volunteer import Volunteer
+
+    user_type = UserType(name="volunteer")
+    pg_session.add(user_type)
+    pg_session.flush()
+    user = User(
+        name="Points Volunteer",
+        email="points.vol@example.com",
+        password_hash="x",
+        user_type_id=user_type.id,
+    )
+    pg_session.add(user)
+    pg_session.flush()
+    volunteer = Volunteer(user_id=user.id, volunteer_id="VLT001", joined_date=date.today())
+    pg_session.add(volunteer)
+    pg_session.commit()
+    return volunteer.id
+
+
+@requires_postgres
+class TestPointsCRUDPostgres:
+    def test_award_points_creates_record_and_accumulates(self, pg_session, volunteer_id):
+        from app.crud.gamification import points_crud
+        from app.models.gamification import PointsHistory
+
+        first = points_crud.award_points(
+            pg_session, volunteer_id, 10, "task_completed", "First task"
+        )
+        second = points_crud.award_points(
+            pg_session, volunteer_id, 5, "task_completed", "Second task"
+        )
+
+        assert first.balance_after == 10
+        assert second.balance_after == 15
+        points = points_crud.get_points(pg_session, volunteer_id)
+        assert points.total_points == 15
+        assert points.current_points == 15
+        history = pg_session.exec(
+            select(PointsHistory).where(PointsHistory.volunteer_id == volunteer_id)
+        ).all()
+        assert len(history) == 2
+        assert all(h.volunteer_points_id == points.id for h in history)
+
+    def test_update_streak(self, pg_session, volunteer_id):
+        from app.crud.gamification import points_crud
+
+        day = datetime(2026, 3, 2, 9, 0)
+        assert points_crud.update_streak(pg_session, volunteer_id, day).current_streak_days == 1
+        # Same day again leaves the streak alone
+        later = day + timedelta(hours=5)
+        assert points_crud.update_streak(pg_session, volunteer_id, later).current_streak_days == 1
+        assert (
+            points_crud.update_streak(pg_session, volunteer_id, day + timedelta(days=1))
+            .current_streak_days == 2
+        )
+
+        # A missed day resets the streak but keeps the best one
+        points = points_crud.update_streak(pg_session, volunteer_id, day + timedelta(days=3))
+        assert points.current_streak_days == 1
+        assert points.longest_streak_days == 2
+
+
+@requires_postgres
+class TestAchievementProgressPostgres:
+    def _achievement(self, pg_session, **overrides):
+        from app.crud.gamification import achievement_crud
+
+        data = {
+            "name": "Ten Hours",
+            "description": "Log ten hours",
+            "achievement_type": "hours_logged",
+            "criteria": {"hours_required": 10},
+            "points_reward": 50,
+            **overrides,
+        }
+        return achievement_crud.create_achievement(pg_session, AchievementCreate(**data))
+
+    def test_progress_uses_default_target(self, pg_session, volunteer_id):
+        from app.crud.gamification import volunteer_achievement_crud
+
+        achievement = self._achievement(pg_session)
+        assert achievement.default_target == Decimal("10")
+
+        progress = volunteer_achievement_crud.get_or_create_progress(
+            pg_session, volunteer_id, achievement.id
+        )
+        again = volunteer_achievement_crud.get_or_create_progress(
+            pg_session, volunteer_id, achievement.id
+        )
+        assert again.id == progress.id
+        assert progress.target_progress == Decimal("10")
+        assert progress.current_progress == Decimal("0")
+
+    def test_increment_completes_once(self, pg_session, volunteer_id):
+        from app.crud.gamification import volunteer_achievement_crud
+
+        achievement = self._achievement(pg_session)
+
+        # No progress row yet: the first increment creates it
+        progress = volunteer_achievement_crud.increment_progress(
+            pg_session, volunteer_id, achievement.id, Decimal("4")
+        )
+        assert progress.current_progress == Decimal("4")
+        assert not progress.is_completed
+
+        progress = volunteer_achievement_crud.increment_progress(
+            pg_session, volunteer_id, achievement.id, Decimal("6")
+        )
+        assert progress.is_completed
+        assert progress.completed_at is not None
+        assert progress.times_completed == 1
+
+        progress = volunteer_achievement_crud.increment_progress(
+            pg_session, volunteer_id, achievement.id, Decimal("1")
+        )
+        assert progress.current_progress == Decimal("11")
+        assert progress.times_completed == 1
+
+
+@requires_postgres
+class TestGamificationServicePostgres:
+    def test_award_points_updates_streak(self, pg_session, volunteer_id):
+        from app.crud.gamification import points_crud
+        from app.services.gamification_service import GamificationService
+
+        result = GamificationService.award_points(
+            pg_session, volunteer_id, 20, "task_completed", "Finished a task"
+        )
+
+        assert result["new_balance"] == 20
+        points = points_crud.get_points(pg_session, volunteer_id)
+        assert points.total_points == 20
+        assert points.current_streak_days == 1
+        assert points.last_activity_date is not None
+
+    @pytest.mark.asyncio
+    async def test_award_badge_once(self, pg_session, volunteer_id):
+        from app.crud.gamification import badge_crud, points_crud
+        from app.services.gamification_service import GamificationService
+
+        badge = badge_crud.create_badge(
+            pg_session,
+            BadgeCreate(
+                name="Helper",
+                description="Helped out",
+                category="special",
+                rarity="common",
+                points_value=25,
+            ),
+        )
+
+        result = await GamificationService.award_badge(pg_session, volunteer_id, badge.id)
+        assert result["status"] == "awarded"
+        again = await GamificationService.award_badge(pg_session, volunteer_id, badge.id)
+        assert again["status"] == "already_earned"
+        assert points_crud.get_points(pg_session, volunteer_id).total_points == 25
+
+    @pytest.mark.asyncio
+    async def test_check_achievements_completes_and_rewards(self, pg_session, volunteer_id):
+        from app.crud.gamification import achievement_crud, points_crud
+        from app.crud.gamification import volunteer_achievement_crud
+        from app.services.gamification_service import GamificationService
+
+        achievement = achievement_crud.create_achievement(
+            pg_session,
+            AchievementCreate(
+                name="First Day",
+                description="Be active for a day",
+                achievement_type="consecutive_days",
+                criteria={"days_required": 1},
+                points_reward=50,
+            ),
+        )
+        GamificationService.award_points(
+            pg_session, volunteer_id, 10, "task_completed", "Finished a task"
+        )
+
+        await GamificationService.check_achievements(pg_session, volunteer_id)
+        await GamificationService.check_achievements(pg_session, volunteer_id)
+
+        progress = volunteer_achievement_crud.get_or_create_progress(
+            pg_session, volunteer_id, achievement.id
+        )
+        assert progress.is_completed
+        assert progress.times_completed == 1
+        # The reward is paid once, however often achievements are re-checked
+        assert points_crud.get_points(pg_session, volunteer_id).total_points == 60
@@ -1213,4 +1213,13 @@ class TestVolunteerModel:
         # Verify we can access the actual skills and trainings through the relationships
         skill_names = [assignment.skill_id for assignment in volunteer.skill_assignments]
         assert skill1.id in skill_names
-        assert skill2.id in skill_names
\ No newline at end of file
+        assert skill2.id in skill_names
+
+class TestStatementCaching:
+    def test_sqlmodel_selects_use_compiled_cache(self):
+        # Select/SelectOfScalar without inherit_cache produce no cache key,
+        # so every execution would recompile its SQL
+        from sqlmodel import select
+
+        assert select(Project)._generate_cache_key() is not None
+        assert select(Project.id, Project.name)._generate_cache_key() is not None
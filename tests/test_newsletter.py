@@ -0,0 +1,207 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.pool import StaticPool
+
+from app.crud.newsletter import RECIPIENT_CLAIM_TIMEOUT, newsletter_crud
+from app.models.newsletter import (
+    Campaign, CampaignRecipient, CampaignStatus, RecipientStatus,
+    Subscriber, SubscriptionStatus
+)
+from app.models.user import User
+from app.schemas.newsletter import CampaignCreate
+from app.services import campaign_service as campaign_service_module
+from app.services.campaign_service import campaign_service
+
+
+@pytest_asyncio.fixture(name="async_session")
+async def async_session_fixture():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(name="author")
+async def author_fixture(async_session: AsyncSession):
+    user = User(
+        email="author@example.com",
+        name="Author",
+        password_hash="x",
+        user_type_id=1,
+    )
+    async_session.add(user)
+    await async_session.flush()
+    return user
+
+
+class TestStatusColumns:
+    def test_status_binds_as_varchar_under_asyncpg(self):
+        """Migration 012 created the status columns as VARCHAR(20), not PG enums."""
+        for model in (Subscriber, Campaign):
+            column_type = model.__table__.c.status.type
+            assert column_type.native_enum is False
+            assert column_type.length == 20
+
+        query = select(Subscriber.id).where(Subscriber.status == SubscriptionStatus.active)
+        sql = str(query.compile(dialect=asyncpg.dialect()))
+        assert "subscriptionstatus" not in sql.lower()
+
+
+class TestNewsletterCRUD:
+    @pytest.mark.asyncio
+    async def test_campaign_status_round_trip(self, async_session: AsyncSession, author):
+        campaign = await newsletter_crud.create_campaign(
+            async_session,
+            CampaignCreate(name="Launch", subject="Hello", html_content="<p>Hi</p>"),
+            created_by_id=author.id,
+        )
+        await async_session.commit()
+        assert campaign.status == CampaignStatus.draft
+
+        drafts, total = await newsletter_crud.get_campaigns(
+            async_session, status=CampaignStatus.draft
+        )
+        assert total == 1
+        assert drafts[0].status == CampaignStatus.draft
+
+        _, total = await newsletter_crud.get_campaigns(
+            async_session, status=CampaignStatus.sent
+        )
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_subscriber_status_filter(self, async_session: AsyncSession):
+        async_session.add_all([
+            Subscriber(
+                email="active@example.com",
+                status=SubscriptionStatus.active,
+                unsubscribe_token="token-active",
+            ),
+            Subscriber(
+                email="pending@example.com",
+                unsubscribe_token="token-pending",
+            ),
+        ])
+        await async_session.commit()
+
+        rows, total = await newsletter_crud.get_subscribers(
+            async_session, status=SubscriptionStatus.active
+        )
+        assert total == 1
+        assert rows[0].email == "active@example.com"
+        assert rows[0].status == SubscriptionStatus.active
+
+        ids = await newsletter_crud.get_active_subscriber_ids(async_session)
+        assert ids == [rows[0].id]
+
+
+@pytest_asyncio.fixture(name="sending_campaign")
+async def sending_campaign_fixture(async_session: AsyncSession, author, monkeypatch):
+    async def fake_send(**kwargs):
+        return True
+
+    monkeypatch.setattr(campaign_service_module, "send_newsletter_email", fake_send)
+
+    subscriber = Subscriber(
+        email="reader@example.com",
+        status=SubscriptionStatus.active,
+        unsubscribe_token="token-reader",
+    )
+    campaign = Campaign(
+        name="Launch",
+        subject="Hello",
+        html_content="<p>Hi</p>",
+        status=CampaignStatus.sending,
+        created_by_id=author.id,
+    )
+    async_session.add_all([subscriber, campaign])
+    await async_session.flush()
+    return campaign, subscriber
+
+
+def make_recipient(campaign, name, subscriber_id, status=RecipientStatus.pending,
+                   claimed_at=None):
+    return CampaignRecipient(
+        campaign_id=campaign.id,
+        subscriber_id=subscriber_id,
+        status=status,
+        claimed_at=claimed_at,
+        open_token=f"open-{name}",
+        click_token=f"click-{name}",
+    )
+
+
+class TestProcessCampaignBatch:
+    @pytest.mark.asyncio
+    async def test_completes_only_after_claimed_rows_finish(
+        self, async_session: AsyncSession, sending_campaign
+    ):
+        campaign, subscriber = sending_campaign
+        deliverable = make_recipient(campaign, "deliverable", subscriber.id)
+        orphaned = make_recipient(campaign, "orphaned", 9999)
+        # Claimed by another worker that has not finished its batch yet
+        in_flight = make_recipient(
+            campaign, "in-flight", subscriber.id, RecipientStatus.sending,
+            claimed_at=datetime.utcnow(),
+        )
+        async_session.add_all([deliverable, orphaned, in_flight])
+        await async_session.commit()
+
+        sent, remaining = await campaign_service.process_campaign_batch(
+            async_session, campaign.id, delay_seconds=0
+        )
+        assert (sent, remaining) == (1, 0)
+        await async_session.refresh(orphaned)
+        assert orphaned.status == RecipientStatus.bounced
+
+        sent, remaining = await campaign_service.process_campaign_batch(
+            async_session, campaign.id, delay_seconds=0
+        )
+        assert (sent, remaining) == (0, 1)
+        await async_session.refresh(campaign)
+        assert campaign.status == CampaignStatus.sending
+
+        await newsletter_crud.bulk_update_recipient_status(
+            async_session, [in_flight.id], RecipientStatus.sent
+        )
+        await async_session.commit()
+
+        await campaign_service.process_campaign_batch(
+            async_session, campaign.id, delay_seconds=0
+        )
+        await async_session.refresh(campaign)
+        assert campaign.status == CampaignStatus.sent
+
+    @pytest.mark.asyncio
+    async def test_requeues_abandoned_claims(
+        self, async_session: AsyncSession, sending_campaign
+    ):
+        campaign, subscriber = sending_campaign
+        # Claimed by a worker that crashed before finalizing its batch
+        abandoned = make_recipient(
+            campaign, "abandoned", subscriber.id, RecipientStatus.sending,
+            claimed_at=datetime.utcnow() - RECIPIENT_CLAIM_TIMEOUT - timedelta(minutes=1),
+        )
+        async_session.add(abandoned)
+        await async_session.commit()
+
+        sent, remaining = await campaign_service.process_campaign_batch(
+            async_session, campaign.id, delay_seconds=0
+        )
+        assert (sent, remaining) == (1, 0)
+        await async_session.refresh(abandoned)
+        assert abandoned.status == RecipientStatus.sent
+
+        await campaign_service.process_campaign_batch(
+            async_session, campaign.id, delay_seconds=0
+        )
+        await async_session.refresh(campaign)
+        assert campaign.status == CampaignStatus.sent
@@ -177,6 +177,18 @@ class TestResourceStats:
         data = response.json()
         assert data["total_resources"] >= 1
 
+    def test_stats_count_allocations(
+        self, client, project, resource, admin_headers, auth_headers
+    ):
+        # SQLite has no planner estimate, so the count here is exact
+        client.post(
+            f"/resources/projects/{project['id']}/resources",
+            json={"resource_id": resource["id"], "quantity_allocated": 5.0},
+            headers=admin_headers,
+        )
+        response = client.get("/resources/stats", headers=auth_headers)
+        assert response.json()["total_allocations"] == 1
+
 
 # ─────────────────────────────────────────────────────────────
 # RESOURCE DETAIL  (GET /resources/{id})
@@ -7,10 +7,15 @@ Known bugs documented by tests:
   Documented here because a volunteer must exist for the bug to trigger.
 """
 
+import os
+
 import pytest
 from datetime import date
 from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine, text
 
+from app.core.config import settings
+from app.crud.task import SearchTimeoutError, _limit_search_time, task_crud
 from app.models.volunteer import VolunteerSkill
 
 
@@ -206,6 +211,29 @@ class TestTaskList:
         response = client.get("/tasks/?priority=medium", headers=admin_headers)
         assert response.status_code == 200
 
+    def test_list_keyset_excludes_position(
+        self, client, session, task, project, admin_headers
+    ):
+        payload = {**_TASK_PAYLOAD, "title": "Second Task", "project_id": project["id"]}
+        assert client.post("/tasks/", json=payload, headers=admin_headers).status_code == 200
+
+        first = task_crud.get_tasks(session, limit=1)[0]
+        page = task_crud.get_tasks(session, before=(first.created_at, first.id))
+        assert len(page) == 1
+        assert page[0].id != first.id
+        assert (page[0].created_at, page[0].id) < (first.created_at, first.id)
+
+    def test_project_tasks_without_total(self, client, task, project, admin_headers):
+        response = client.get(
+            f"/projects/{project['id']}/tasks?include_total=false&page_size=1",
+            headers=admin_headers,
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert len(data["data"]) == 1
+        assert data["metadata"]["total"] is None
+        assert data["metadata"]["has_next"] is False
+
 
 # ─────────────────────────────────────────────────────────────
 # TASK STATS  (GET /tasks/stats)
@@ -230,6 +258,21 @@ class TestTaskStats:
         data = response.json()
         assert data["total_tasks"] >= 1
 
+    def test_stats_counts_scoped_to_project(self, client, task, project):
+        pid = project["id"]
+        response = client.get(f"/tasks/stats?project_id={pid + 1}")
+        data = response.json()
+        assert data["total_tasks"] == 0
+        assert data["not_started"] == 0
+
+    def test_stats_refresh_after_task_created(self, client, project, admin_headers):
+        pid = project["id"]
+        before = client.get(f"/tasks/stats?project_id={pid}").json()
+        payload = {**_TASK_PAYLOAD, "project_id": pid}
+        client.post("/tasks/", json=payload, headers=admin_headers)
+        after = client.get(f"/tasks/stats?project_id={pid}").json()
+        assert after["total_tasks"] == before["total_tasks"] + 1
+
 
 # ─────────────────────────────────────────────────────────────
 # VOLUNTEER AVAILABLE TASKS  (GET /tasks/volunteers/available)
@@ -786,3 +829,43 @@ class TestProjectVolunteersBug:
         assert response.status_code == 500, (
             "If status != 500, the missing skills_count / active_projects_count bug has been fixed."
         )
+
+
+# ─────────────────────────────────────────────────────────────
+# SEARCH STATEMENT TIMEOUT  (PostgreSQL only)
+# ─────────────────────────────────────────────────────────────
+
+# e.g. TEST_POSTGRES_URL=postgresql://postgres@localhost/repensar_test
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+class TestSearchTimeout:
+    @pytest.fixture(name="pg_session")
+    def pg_session_fixture(self):
+        engine = create_engine(TEST_POSTGRES_URL)
+        with Session(engine) as session:
+            yield session
+        engine.dispose()
+
+    def _timeout(self, session):
+        return session.execute(text("SHOW statement_timeout")).scalar()
+
+    def test_timeout_is_restored_after_search(self, pg_session, monkeypatch):
+        monkeypatch.setattr(settings, "SEARCH_STATEMENT_TIMEOUT_MS", 1234)
+        before = self._timeout(pg_session)
+
+        with _limit_search_time(pg_session, "river"):
+            assert self._timeout(pg_session) == "1234ms"
+
+        assert self._timeout(pg_session) == before
+
+    def test_slow_search_raises_search_timeout(self, pg_session, monkeypatch):
+        monkeypatch.setattr(settings, "SEARCH_STATEMENT_TIMEOUT_MS", 50)
+
+        with pytest.raises(SearchTimeoutError):
+            with _limit_search_time(pg_session, "river"):
+                pg_session.execute(text("SELECT pg_sleep(1)"))
+
+        # The session was rolled back and is usable again
+        assert pg_session.execute(text("SELECT 1")).scalar() == 1